@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app import crud, schemas
-from app.dependencies import get_db
+from app.dependencies import conditional_etag, get_read_db
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
-@router.get("/", response_model=list[schemas.Article])
-def get_articles(db: Session = Depends(get_db)):
+@router.get("/", response_model=list[schemas.Article],
+            dependencies=[Depends(conditional_etag("articles"))])
+def get_articles(db: Session = Depends(get_read_db)):
     return crud.article.get_multi(db)
@@ -1,38 +1,68 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
-from app.core.security import create_access_token, verify_password
+from app.core.password_hasher import PasswordHasherBusy, password_hasher
+from app.core.security import create_access_token
 from app.dependencies import get_db
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+# Endpoints here are async so a request waiting on the password hasher holds
+# no threadpool thread; the short DB calls still run in the threadpool.
+
+
+async def _run_hasher(method, *args):
+    try:
+        return await method(*args)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.post("/register", response_model=schemas.UserPublic)
-def register(
+async def register(
     *,
     db: Session = Depends(get_db),
     user_in: schemas.UserCreate,
 ):
-    user = crud.user.get_by_email(db, email=user_in.email)
+    user = await run_in_threadpool(crud.user.get_by_email, db, email=user_in.email)
     if user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = crud.user.create(db, obj_in=user_in)
+    hashed_password = await _run_hasher(password_hasher.hash, user_in.password)
+    user = await run_in_threadpool(
+        crud.user.create, db, obj_in=user_in, hashed_password=hashed_password
+    )
     return user
 
 
 @router.post("/login", response_model=schemas.Token)
-def login(
+async def login(
     *,
     db: Session = Depends(get_db),
     login_in: schemas.UserLogin,
 ):
-    user = crud.user.get_by_email(db, email=login_in.email)
-    if not user or not verify_password(login_in.password, user.hashed_password):
+    user = await run_in_threadpool(crud.user.get_by_email, db, email=login_in.email)
+    matches, new_hash = False, None
+    if user:
+        matches, new_hash = await _run_hasher(
+            password_hasher.verify, login_in.password, user.hashed_password
+        )
+    if not matches:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
+    if new_hash is not None:
+        # Hashed with older cost parameters: upgrade while we have the password
+        await run_in_threadpool(
+            crud.user.update, db, db_obj=user, obj_in={"hashed_password": new_hash}
+        )
 
     access_token = create_access_token(user.id)
     return {
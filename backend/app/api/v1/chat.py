@@ -7,8 +7,9 @@ from app.models.chat import SenderType
 from app.services.planner_service import PlannerService
 from app.services.generator_service import GeneratorService
 from app.services.emotion_service import EmotionService
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
 
@@ -4,10 +4,11 @@ import os
 from fastapi import APIRouter, HTTPException
 from sqlalchemy.orm import Session
 from app import crud, dependencies
-from app.db.session import SessionLocal
+from app.db.session import ReadSessionLocal, SessionLocal
 import structlog
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
 @router.get("/ping")
@@ -86,7 +87,7 @@ def debug_music_tracks():
     #     raise HTTPException(status_code=403, detail="Debug endpoint not available in production")
     
     try:
-        db = SessionLocal()
+        db = ReadSessionLocal()
         # Use SQLAlchemy ORM instead of raw SQL
         from app.models.music_track import MusicTrack
         tracks = db.query(MusicTrack).order_by(MusicTrack.created_at.desc()).limit(10).all()
@@ -120,7 +121,7 @@ def debug_music_stats():
     #     raise HTTPException(status_code=403, detail="Debug endpoint not available in production")
     
     try:
-        db = SessionLocal()
+        db = ReadSessionLocal()
         from app.models.music_track import MusicTrack
         
         # Get stats for last 24 hours
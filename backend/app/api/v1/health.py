@@ -1,12 +1,19 @@
 # backend/app/api/v1/health.py
 
+import asyncio
+import os
+
 from fastapi import APIRouter
 from typing import Dict, Any
 import structlog
-from app.core.rate_limiter import rate_limiter
+from app.core.password_hasher import password_hasher
+from app.core.rate_limiter import RedisRateLimiter, rate_limiter
 from app.core.request_queue import request_queue
+from app.core.responses import ORJSONRoute
+from app.db.recent_writes import recent_writes
+from app.db.session import get_pool_stats, has_read_replica, read_engine
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
 @router.get("/health")
@@ -14,16 +21,30 @@ async def health_check() -> Dict[str, Any]:
     """Health check endpoint untuk monitoring"""
     try:
         # Check rate limiter status
+        def youtube_counts():
+            return (
+                rate_limiter.get_active_count("youtube"),
+                rate_limiter.get_request_count("youtube"),
+                rate_limiter.get_wait_time("youtube"),
+            )
+
+        # The Redis limiter's getters are network round trips; keep them off the loop
+        if isinstance(rate_limiter, RedisRateLimiter):
+            active, history, wait_time = await asyncio.to_thread(youtube_counts)
+        else:
+            active, history, wait_time = youtube_counts()
         rate_limit_status = {
             "youtube_requests_available": await rate_limiter.can_make_request("youtube"),
-            "active_requests": rate_limiter.get_active_count("youtube"),
-            "rate_limit_history": len(rate_limiter._request_history.get("youtube", []))
+            "active_requests": active,
+            "rate_limit_history": history,
+            "wait_time_seconds": wait_time,
         }
         
         # Check request queue status
         queue_status = {
             "pending_requests": request_queue.get_queue_size(),
             "active_workers": request_queue.get_active_workers(),
+            "concurrency_limit": request_queue.concurrency.current,
             "failed_requests": request_queue.get_failed_count()
         }
         
@@ -32,6 +53,14 @@ async def health_check() -> Dict[str, Any]:
             "timestamp": "2025-01-06T21:43:00Z",
             "rate_limiter": rate_limit_status,
             "request_queue": queue_status,
+            "password_hasher": {
+                "pending": password_hasher.pending,
+                "rejected": password_hasher.stats["rejected"],
+            },
+            "database_pool": {
+                key: value for key, value in get_pool_stats().items()
+                if key != "checkout_wait_seconds"
+            },
             "version": "1.0.0"
         }
     except Exception as e:
@@ -45,20 +74,27 @@ async def health_check() -> Dict[str, Any]:
 async def detailed_health_check() -> Dict[str, Any]:
     """Detailed health check untuk debugging"""
     try:
+        limits = rate_limiter.youtube_limits
         detailed_info = {
             "rate_limiter_config": {
-                "youtube_per_minute": 5,
-                "youtube_per_hour": 30,
-                "max_concurrent": 3
+                "youtube_per_minute": limits["requests_per_minute"],
+                "youtube_per_hour": limits["requests_per_hour"],
+                "max_concurrent": limits["concurrent_requests"]
             },
             "queue_config": {
-                "max_workers": 3,
-                "max_queue_size": 100,
-                "worker_timeout": 45
+                "min_workers": request_queue.min_workers,
+                "max_workers": request_queue.max_workers,
+                "concurrency_limit": request_queue.concurrency.current,
+                "max_queue_size": request_queue.max_queue_size,
+                "overflow": request_queue.overflow,
+                "aging_seconds": request_queue.aging_seconds,
+                "idle_timeout_seconds": request_queue.idle_timeout,
+                "latency_target_seconds": request_queue.concurrency.latency_target
             },
             "system_info": {
-                "worker_count": 3,
-                "worker_timeout": 300
+                # Same environment variables gunicorn.conf.py reads
+                "worker_count": int(os.getenv("WORKERS", "3")),
+                "worker_timeout": int(os.getenv("WORKER_TIMEOUT", "300"))
             }
         }
         
@@ -66,7 +102,11 @@ async def detailed_health_check() -> Dict[str, Any]:
             "status": "healthy",
             "config": detailed_info,
             "rate_limiter": await rate_limiter.get_status(),
-            "request_queue": request_queue.get_detailed_status()
+            "request_queue": request_queue.get_detailed_status(),
+            "password_hasher": password_hasher.get_stats(),
+            "database_pool": get_pool_stats(),
+            "replica_pool": get_pool_stats(read_engine) if has_read_replica() else None,
+            "read_your_writes": recent_writes.get_stats(),
         }
     except Exception as e:
         log.error("detailed_health_check_error", error=str(e))
@@ -1,31 +1,35 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from app import crud, schemas
-from app.dependencies import get_db
+from app import crud, models, schemas
+from app.dependencies import check_etag, get_current_user, get_read_db
+from app.core.responses import ORJSONRoute
+from app.services.home_feed_service import home_feed_snapshot, home_feed_versions
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+
+def home_feed_etag(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+) -> str:
+    etag = crud.content_version.get_etag(db, *home_feed_versions(current_user.id))
+    return check_etag(request, response, etag)
 
 
 @router.get("/home-feed", response_model=schemas.HomeFeed)
-def get_home_feed(db: Session = Depends(get_db)):
-    """Return the latest quote and music recommendation."""
-    music_obj = crud.music_track.get_latest(db)
-    # Validasi ketat: field wajib tidak boleh null/kosong
-    if music_obj is not None:
-        if not (music_obj.id and music_obj.title and music_obj.youtube_id and music_obj.stream_url) or music_obj.status == 'failed':
-            music_obj = None
-    
-    # Always return response with quote, music can be null
-    music_status = music_obj.status if music_obj else "done"
-    quote_obj = crud.motivational_quote.get_latest(db)
-    
-    # Return 204 only if both quote and music are null
-    if quote_obj is None and music_obj is None:
-        return JSONResponse(status_code=204, content=None)
-    
-    return schemas.HomeFeed(
-        quote=quote_obj,
-        music=music_obj,
-        music_status=music_status,
+def get_home_feed(
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+    etag: str = Depends(home_feed_etag),
+):
+    """Return the latest quote and the user's music recommendation."""
+    # 204 when there is neither a quote nor music yet
+    status_code, body = home_feed_snapshot.get(db, current_user.id, etag)
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json" if body else None,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
     )
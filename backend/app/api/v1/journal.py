@@ -1,16 +1,33 @@
 # backend/app/api/v1/journal.py (Versi Perbaikan)
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException
 from sqlalchemy.orm import Session
 from app import crud, models, schemas
-from app.dependencies import get_db, get_current_user
-from app.tasks import analyze_profile_task, run_music_generation_flow
+from app.dependencies import get_db, get_current_user, get_read_db
+from app.services.ready_track_pool_service import ready_track_pool
 import structlog
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
 
+# app.tasks pulls in Celery and the music pipeline; load it with the first
+# journal rather than at worker boot.
+def analyze_profile_task(user_id: int):
+    from app.tasks import analyze_profile_task as task
+
+    return task(user_id)
+
+
+async def run_music_generation_flow(user_id: Optional[int] = None):
+    from app.tasks import run_music_generation_flow as flow
+
+    return await flow(user_id=user_id)
+
+
 @router.post("/", response_model=schemas.JournalInDB)
 def create_journal(
     *,
@@ -26,6 +43,10 @@ def create_journal(
         db=db, obj_in=journal_in, owner_id=current_user.id
     )
 
+    # Serve a pre-warmed track for the journal's mood right away; the
+    # personalized generation below replaces it once it finishes.
+    ready_track_pool.assign_for_mood(db, getattr(journal_in, 'mood', None), owner_id=current_user.id)
+
     # Trigger profile analysis
     background_tasks.add_task(analyze_profile_task, current_user.id)
     
@@ -45,7 +66,7 @@ def create_journal(
 
 @router.get("/", response_model=list[schemas.JournalInDB])
 def read_journals(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: models.User = Depends(get_current_user),
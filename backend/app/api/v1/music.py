@@ -5,47 +5,70 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 import structlog
 import asyncio # -> Import asyncio
-from typing import List
-from app.services.playlist_cache_service import PlaylistCacheService
+from typing import List, Optional
 import datetime
-from fastapi.responses import JSONResponse
+import re
+from email.utils import format_datetime
+from fastapi.responses import JSONResponse, Response
 
 from app import crud, models, schemas, dependencies
 from app.services.music_suggestion_service import MusicSuggestionService
-from app.tasks import run_music_generation_flow
-from youtubesearchpython import VideosSearch
-from app.services.stealth_youtube_extractor import stealth_youtube_extractor
-from app.core.rate_limiter import rate_limiter
+from app.core.lazy import LazyImport
 from app.core.response_handler import SafeResponseHandler
+from app.services.music_moods import RADIO_CATEGORIES
+from app.services.radio_station_service import RadioStationService
+from app.core.responses import ORJSONRoute
 
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
-# Radio station categories mapping
-RADIO_CATEGORIES = {
-    'santai': {'mood': 'relax', 'keywords': ['chill', 'relax', 'ambient', 'peaceful']},
-    'energik': {'mood': 'energetic', 'keywords': ['upbeat', 'motivational', 'workout', 'dance']},
-    'fokus': {'mood': 'focus', 'keywords': ['instrumental', 'concentration', 'study', 'productivity']},
-    'bahagia': {'mood': 'happy', 'keywords': ['happy', 'uplifting', 'positive', 'cheerful']},
-    'sedih': {'mood': 'sad', 'keywords': ['melancholy', 'emotional', 'ballad', 'contemplative']},
-    'romantis': {'mood': 'romantic', 'keywords': ['love', 'romantic', 'intimate', 'soulful']},
-    'nostalgia': {'mood': 'nostalgic', 'keywords': ['classic', 'vintage', 'memories', 'timeless']},
-    'instrumental': {'mood': 'instrumental', 'keywords': ['no vocals', 'classical', 'cinematic', 'atmospheric']},
-    'jazz': {'mood': 'jazz', 'keywords': ['smooth', 'sophisticated', 'lounge', 'swing']},
-    'rock': {'mood': 'rock', 'keywords': ['guitar', 'alternative', 'indie', 'energetic']},
-    'pop': {'mood': 'pop', 'keywords': ['mainstream', 'catchy', 'contemporary', 'hits']},
-    'electronic': {'mood': 'electronic', 'keywords': ['synth', 'beats', 'digital', 'futuristic']},
-}
+# Loads the request queue, rate limiter and yt-dlp pool on first stream lookup
+stealth_youtube_extractor = LazyImport(
+    "app.services.stealth_youtube_extractor", "stealth_youtube_extractor"
+)
+
+YOUTUBE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+@router.get("/stream/{youtube_id}", response_model=schemas.AudioStream)
+async def get_stream_url(
+    youtube_id: str,
+    user_id: Optional[int] = Depends(dependencies.get_optional_user_id),
+):
+    """Resolve a playable stream URL on first play, via the extraction cache."""
+    if not YOUTUBE_ID_PATTERN.match(youtube_id):
+        raise HTTPException(status_code=400, detail="Invalid youtube_id")
+
+    try:
+        # Queued under the listener, so one user's lookups can't crowd out others
+        stream = await stealth_youtube_extractor.resolve_stream(youtube_id, tenant=user_id)
+    except Exception as e:
+        log.error("stream_resolution_error", youtube_id=youtube_id, error=str(e))
+        stream = None
+
+    if not stream:
+        raise HTTPException(status_code=502, detail="Could not resolve audio stream")
+
+    log.info("stream_resolved", youtube_id=youtube_id, strategy=stream.get("strategy_used"))
+    return schemas.AudioStream(
+        youtube_id=youtube_id,
+        stream_url=stream["audio_url"],
+        expires_at=datetime.datetime.fromtimestamp(
+            stream["expires_at"], tz=datetime.timezone.utc
+        ),
+    )
+
 
 @router.get("/station", response_model=List[schemas.AudioTrack])
 async def get_radio_station(
     *,
     category: str = Query(..., description="Radio station category"),
+    response: Response,
     db: Session = Depends(dependencies.get_db),
     suggestion_service: MusicSuggestionService = Depends(),
 ):
-    """Get radio station playlist based on category."""
+    """Get radio station playlist, from the precomputed store when available."""
     log.info("radio_station_request", category=category)
     
     # Validate category
@@ -56,56 +79,30 @@ async def get_radio_station(
             detail=f"Invalid category. Available: {', '.join(RADIO_CATEGORIES.keys())}"
         )
     
+    radio_service = RadioStationService()
+    station = radio_service.get_stored(db, category)
+    if station is not None:
+        # Served from the beat-refreshed store
+        _set_station_freshness(response, station)
+        log.info("radio_station_served_from_store", category=category,
+                 generated_at=station.generated_at.isoformat())
+        return station.tracks
+
     try:
-        category_config = RADIO_CATEGORIES[category]
-        mood = category_config['mood']
-        keywords = category_config['keywords']
-        
-        # Generate playlist using music suggestion service
-        playlist = []
-        
-        # Generate 5-8 songs for the radio station
-        for i in range(5):
-            try:
-                # Use different mood variations to get diverse songs
-                mood_variation = f"{mood} {keywords[i % len(keywords)]}"
-                suggestion = await suggestion_service.suggest_song(mood=mood_variation)
-                
-                if suggestion:
-                    # Search for YouTube video
-                    search_query = f"{suggestion.title} {suggestion.artist}"
-                    videos_search = VideosSearch(search_query, limit=1)
-                    results = videos_search.result()
-                    
-                    youtube_id = None
-                    if results and results.get('result') and len(results['result']) > 0:
-                        youtube_id = results['result'][0]['id']
-                    
-                    if youtube_id:
-                        # Convert SongSuggestion to AudioTrack format
-                        audio_track = {
-                            "id": i + 1,  # Use integer ID
-                            "title": suggestion.title,
-                            "artist": suggestion.artist,
-                            "youtube_id": youtube_id,
-                            "stream_url": None,
-                            "cover_url": None,
-                            "status": "done",
-                        }
-                        playlist.append(audio_track)
-                        log.info("radio_track_added", track=suggestion.title, artist=suggestion.artist, youtube_id=youtube_id)
-                    else:
-                        log.warning("youtube_search_failed", query=search_query)
-                    
-            except Exception as e:
-                log.warning("radio_track_generation_failed", error=str(e), iteration=i)
-                continue
+        playlist, timings = await radio_service.build_station(
+            category, suggestion_service=suggestion_service
+        )
+        response.headers["Server-Timing"] = ", ".join(
+            f"{stage};dur={ms:.1f}" for stage, ms in timings.items()
+        )
         
         if not playlist:
             # Fallback: return some default tracks if generation fails
             log.warning("radio_generation_failed_completely", category=category)
-            playlist = _get_fallback_playlist(category)
+            return _get_fallback_playlist(category)
         
+        station = crud.radio_station.upsert(db, category=category, tracks=playlist)
+        _set_station_freshness(response, station)
         log.info("radio_station_generated", category=category, track_count=len(playlist))
         return playlist
         
@@ -115,6 +112,12 @@ async def get_radio_station(
         return _get_fallback_playlist(category)
 
 
+def _set_station_freshness(response: Response, station: models.RadioStation) -> None:
+    """Expose when the stored playlist was generated as a Last-Modified header."""
+    generated_at = station.generated_at.replace(tzinfo=datetime.timezone.utc)
+    response.headers["Last-Modified"] = format_datetime(generated_at, usegmt=True)
+
+
 def _get_fallback_playlist(category: str) -> List[dict]:
     """Generate a fallback playlist when radio generation fails."""
     fallback_tracks = {
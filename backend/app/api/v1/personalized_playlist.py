@@ -1,17 +1,22 @@
 # backend/app/api/v1/personalized_playlist.py
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 import structlog
 import datetime
 from app import crud, models, schemas, dependencies
 from app.services.music_suggestion_service import MusicSuggestionService
 from app.services.prompt_builder_service import build_dynamic_prompt
-from app.services.playlist_cache_service import PlaylistCacheService
-from youtubesearchpython import VideosSearch
+from app.services.playlist_cache_service import playlist_cache
+from app.core.lazy import LazyImport
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 log = structlog.get_logger(__name__)
 
+VideosSearch = LazyImport("youtubesearchpython", "VideosSearch")  # Pulls in httpx and yt-dlp
+
 @router.get("/personalized-playlist", response_model=list[schemas.AudioTrack])
 async def get_personalized_playlist(
     db: Session = Depends(dependencies.get_db),
@@ -20,10 +25,12 @@ async def get_personalized_playlist(
 ):
     today = datetime.date.today().isoformat()
     # 1. Cek cache
-    cached = PlaylistCacheService.get_playlist(current_user.id, today, "personalized")
-    if cached:
-        log.info("api:personalized_playlist_cache_hit", count=len(cached))
-        return cached
+    # Cache menyimpan JSON yang sudah diserialisasi, jadi hit dikirim apa adanya.
+    # Backend Redis memakai klien sinkron, jadi dijalankan di thread
+    cached = await asyncio.to_thread(playlist_cache.get_serialized, current_user.id, today, "personalized")
+    if cached is not None:
+        log.info("api:personalized_playlist_cache_hit", size=len(cached))
+        return Response(content=cached, media_type="application/json")
     # 2. Ambil data jurnal, chat, mood, history
     journals = crud.journal.get_by_user_id(db, user_id=current_user.id)
     chats = crud.chat.get_by_user_id(db, user_id=current_user.id)
@@ -61,6 +68,8 @@ async def get_personalized_playlist(
         track.id = i + 1
     if not playlist:
         raise HTTPException(status_code=404, detail="Tidak dapat menemukan video untuk playlist personal.")
-    PlaylistCacheService.set_playlist(current_user.id, today, "personalized", playlist)
+    payload = await asyncio.to_thread(
+        playlist_cache.set_playlist, current_user.id, today, "personalized", playlist
+    )
     log.info("api:personalized_playlist_created", count=len(playlist))
-    return playlist
+    return Response(content=payload, media_type="application/json")
@@ -4,10 +4,10 @@ import asyncio
 from fastapi import APIRouter, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
 from app import crud, schemas, models
-from app.dependencies import get_db, get_current_user
-from app.tasks import generate_quote_task
+from app.dependencies import conditional_etag, get_current_user, get_read_db
+from app.core.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # --- FUNGSI PEMBUNGKUS UNTUK MENJALANKAN TUGAS ASYNC ---
 def run_async_task(task):
@@ -15,13 +15,15 @@ def run_async_task(task):
     asyncio.run(task)
 
 
-@router.get("/", response_model=list[schemas.MotivationalQuote])
-def get_quotes(db: Session = Depends(get_db)):
+@router.get("/", response_model=list[schemas.MotivationalQuote],
+            dependencies=[Depends(conditional_etag("quotes"))])
+def get_quotes(db: Session = Depends(get_read_db)):
     return crud.motivational_quote.get_multi(db)
 
 
-@router.get("/latest", response_model=schemas.MotivationalQuote | None)
-def get_latest_quote(db: Session = Depends(get_db)):
+@router.get("/latest", response_model=schemas.MotivationalQuote | None,
+            dependencies=[Depends(conditional_etag("quotes"))])
+def get_latest_quote(db: Session = Depends(get_read_db)):
     return crud.motivational_quote.get_latest(db)
 
 
@@ -36,5 +38,7 @@ async def trigger_quote_generation(
     # --- PERBAIKAN: Panggil fungsi pembungkus, bukan tugasnya langsung ---
     # Kita sekarang memberikan fungsi pembungkus ke BackgroundTasks,
     # dan tugas async kita sebagai argumennya.
+    from app.tasks import generate_quote_task  # Celery loads on first use
+
     background_tasks.add_task(run_async_task, generate_quote_task())
     return {"message": "Quote generation process has been started."}
\ No newline at end of file
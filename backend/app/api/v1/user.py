@@ -1,10 +1,16 @@
+import datetime
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
+from app.core.config import settings
 from app.dependencies import get_current_user, get_db
+from app.core.responses import ORJSONRoute
+from app.services.export_service import gzip_chunks, iter_user_export
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.get("/me", response_model=schemas.UserPublic)
@@ -12,6 +18,33 @@ def read_users_me(current_user: models.User = Depends(get_current_user)):
     return current_user
 
 
+@router.get("/me/export")
+def export_users_me(
+    *,
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Stream all of the user's journals and chat messages as NDJSON. With
+    ``gzip=true`` the stream is a ``.ndjson.gz`` file for offline backups;
+    otherwise CompressionMiddleware negotiates the transfer encoding.
+    """
+    chunks = iter_user_export(db, current_user.id, batch_size=settings.EXPORT_BATCH_SIZE)
+    filename = f"dear-diary-export-{datetime.date.today().isoformat()}.ndjson"
+    if gzip:
+        return StreamingResponse(
+            gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.gz"'},
+        )
+    return StreamingResponse(
+        chunks,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.delete("/me", response_model=schemas.UserPublic)
 def delete_user_me(
     *,
@@ -2,6 +2,9 @@
 
 import os
 from celery import Celery
+from celery.signals import worker_process_init
+
+from app.core.config import settings
 
 # Ambil URL Redis dari environment variable
 redis_url = f"redis://{os.environ.get('REDIS_HOST', 'localhost')}:{os.environ.get('REDIS_PORT', '6379')}/0"
@@ -23,5 +26,25 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.generate_music_recommendation_task",
         "schedule": 60 * 15,
     },
+    "cleanup-failed-tracks": {
+        "task": "app.tasks.cleanup_failed_tracks_task",
+        "schedule": settings.FAILED_TRACK_CLEANUP_INTERVAL_SECONDS,
+    },
+    "refill-ready-track-pool": {
+        "task": "app.tasks.refill_ready_track_pool_task",
+        "schedule": settings.READY_TRACK_POOL_REFILL_INTERVAL_SECONDS,
+    },
+    "refresh-radio-stations": {
+        "task": "app.tasks.refresh_radio_stations_task",
+        "schedule": settings.RADIO_STATION_REFRESH_INTERVAL_SECONDS,
+    },
 }
 celery_app.conf.timezone = "UTC"
+
+
+@worker_process_init.connect
+def _dispose_engine_after_fork(**kwargs):
+    # Prefork pool children must not reuse the parent's DB connections
+    from app.db.session import dispose_engine_after_fork
+
+    dispose_engine_after_fork()
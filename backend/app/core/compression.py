@@ -0,0 +1,279 @@
+# backend/app/core/compression.py
+
+import asyncio
+import gzip
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = structlog.get_logger(__name__)
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+class _GzipEncoder:
+    name = "gzip"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def stream(self) -> "_StreamEncoder":
+        # wbits=31: gzip container around deflate
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return _StreamEncoder(
+            lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH),
+            compressor.flush,
+        )
+
+
+class _BrotliEncoder:
+    name = "br"
+
+    def __init__(self, quality: int = 4):
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality)
+
+    def stream(self) -> "_StreamEncoder":
+        compressor = brotli.Compressor(quality=self.quality)
+        return _StreamEncoder(
+            lambda chunk: compressor.process(chunk) + compressor.flush(),
+            compressor.finish,
+        )
+
+
+class _ZstdEncoder:
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    # A ZstdCompressor isn't thread-safe and its compressobj()s share its
+    # context, so every body gets its own.
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def stream(self) -> "_StreamEncoder":
+        compressor = zstandard.ZstdCompressor(level=self.level).compressobj()
+        return _StreamEncoder(
+            lambda chunk: compressor.compress(chunk)
+            + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressor.flush,
+        )
+
+
+class _StreamEncoder:
+    """Incremental encoder; every chunk is flushed so streamed data isn't held back."""
+
+    __slots__ = ("process", "finish")
+
+    def __init__(self, process, finish):
+        self.process = process
+        self.finish = finish
+
+
+def available_encoders(
+    gzip_level: int = 6, brotli_quality: int = 4, zstd_level: int = 3
+) -> Dict[str, object]:
+    """Encoders usable in this process, most preferred first."""
+    encoders = {}
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder(zstd_level)
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder(brotli_quality)
+    encoders["gzip"] = _GzipEncoder(gzip_level)
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """
+    Pick an encoding from an ``Accept-Encoding`` header. The client's q-values
+    win; ties go to the earlier entry in ``supported``. Returns None for identity.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token.strip()] = q
+
+    best, best_q = None, 0.0
+    for name in supported:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI response compression negotiated from ``Accept-Encoding``
+    (zstd, br or gzip, whichever the client accepts and is installed).
+
+    Bodies below ``minimum_size``, non-text content types and responses that
+    already carry a ``Content-Encoding`` pass through untouched. A complete
+    body is compressed in one shot and only used if it comes out smaller;
+    bodies of at least ``offload_size`` bytes are compressed in a thread so
+    the event loop keeps serving. Streaming bodies are compressed chunk by
+    chunk with a flush after each one.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        offload_size: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.encoders = available_encoders(gzip_level, brotli_quality, zstd_level)
+        self._supported = list(self.encoders)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept, self._supported) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponse(self, self.encoders[encoding], send).run(scope, receive)
+
+    async def _run(self, func, data: bytes) -> bytes:
+        if len(data) >= self.offload_size:
+            return await asyncio.to_thread(func, data)
+        return func(data)
+
+
+class _CompressedResponse:
+    """Per-request state: holds ``http.response.start`` until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoder, send):
+        self.middleware = middleware
+        self.encoder = encoder
+        self.send = send
+        self.start: Optional[dict] = None
+        self.stream: Optional[_StreamEncoder] = None
+        self.passthrough = False
+
+    async def run(self, scope, receive) -> None:
+        await self.middleware.app(scope, receive, self.wrapped_send)
+
+    async def wrapped_send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self._compressible(message["headers"])
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            out = await self.middleware._run(self.stream.process, body) if body else b""
+            if not more_body:
+                out += self.stream.finish()
+            await self.send({"type": "http.response.body", "body": out, "more_body": more_body})
+            return
+
+        if not more_body:
+            await self._send_complete(body)
+            return
+
+        # First chunk of a streaming body: total size unknown, compress incrementally
+        self.stream = self.encoder.stream()
+        await self.send(self._start_with(content_length=None))
+        out = await self.middleware._run(self.stream.process, body) if body else b""
+        await self.send({"type": "http.response.body", "body": out, "more_body": True})
+
+    async def _send_complete(self, body: bytes) -> None:
+        if len(body) >= self.middleware.minimum_size:
+            try:
+                compressed = await self.middleware._run(self.encoder.compress, body)
+            except Exception as e:
+                logger.warning("compression:failed", encoding=self.encoder.name, error=str(e))
+                compressed = None
+            if compressed is not None and len(compressed) < len(body):
+                await self.send(self._start_with(content_length=len(compressed)))
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+        await self.send(self._start_with(content_length=len(body), encoded=False))
+        await self.send({"type": "http.response.body", "body": body})
+
+    def _compressible(self, headers: List[Tuple[bytes, bytes]]) -> bool:
+        content_type = b""
+        for key, value in headers:
+            key = key.lower()
+            if key == b"content-encoding":
+                return False  # Already compressed (e.g. a cached gzip payload)
+            if key == b"content-type":
+                content_type = value.lower()
+        if self.start["status"] < 200 or self.start["status"] in (204, 304):
+            return False
+        content_type = content_type.decode("latin-1")
+        return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+    def _start_with(self, content_length: Optional[int], encoded: bool = True) -> dict:
+        headers = [
+            (key, value) for key, value in self.start["headers"]
+            if key.lower() not in (b"content-length", b"vary", b"etag")
+        ]
+        for key, value in self.start["headers"]:
+            if key.lower() == b"etag":
+                # The encoded bytes differ from what the strong ETag names
+                if encoded and not value.startswith(b"W/"):
+                    value = b"W/" + value
+                headers.append((key, value))
+        vary = [value for key, value in self.start["headers"] if key.lower() == b"vary"]
+        if not any(b"accept-encoding" in value.lower() for value in vary):
+            vary.append(b"Accept-Encoding")
+        headers.append((b"vary", b", ".join(vary)))
+        if encoded:
+            headers.append((b"content-encoding", self.encoder.name.encode()))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        return {**self.start, "headers": headers}
@@ -1,6 +1,8 @@
 # app/core/config.py
 
 import os
+from typing import Dict
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Tentukan path ke file .env. Ini membantu pydantic-settings menemukannya.
@@ -30,12 +32,25 @@ class Settings(BaseSettings):
 
     # Database & Redis - WAJIB ADA
     DATABASE_URL: str
+    # Pool koneksi per proses (diabaikan untuk SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10  # Koneksi tambahan saat pool penuh; -1 = tanpa batas
+    DB_POOL_TIMEOUT_SECONDS: int = 30  # Tunggu koneksi bebas sebelum error
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Ganti koneksi lebih tua dari ini
+    DB_POOL_PRE_PING: bool = True  # Cek koneksi sebelum dipakai
+    # Replika baca untuk endpoint read-only (kosong = semua query ke primary)
+    DATABASE_REPLICA_URL: str | None = None
+    # Setelah user menulis, bacaannya tetap ke primary selama ini (detik)
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Redis bersama untuk penanda tulis terakhir (kosong = penanda per worker)
+    READ_YOUR_WRITES_REDIS_URL: str | None = None
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
 
     # Keamanan - WAJIB ADA
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: int = 12  # Ubah untuk rehash otomatis saat login berikutnya
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 hari
 
     # Kredensial & Konfigurasi Layanan Eksternal
@@ -47,33 +62,105 @@ class Settings(BaseSettings):
     # Pengaturan Opsional (Contoh: CORS, Sentry)
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
     SENTRY_DSN: str | None = None
+    # Sampling trace Sentry per route (prefix path atau nama task Celery)
+    SENTRY_TRACES_SAMPLE_RATE: float = 0.1  # Route yang tidak terdaftar
+    SENTRY_TRACES_ROUTE_RATES: Dict[str, float] = {
+        "/api/v1/health": 0.0,
+        "/api/v1/home-feed": 0.01,
+        "/api/v1/quotes": 0.02,
+        "/api/v1/chat": 0.5,
+        "/api/v1/music": 0.5,
+        "/api/v1/journals": 0.25,
+    }
+    SENTRY_PROFILES_SAMPLE_RATE: float = 0.1  # Bagian dari trace yang juga diprofil
+    SENTRY_SLOW_TRANSACTION_SECONDS: float = 2.0
+    # Rekam penuh route dengan rate >= SENTRY_KEEP_SLOW_MIN_RATE agar transaksi
+    # lambat/error selalu dikirim; route di bawahnya (mis. home-feed) tetap
+    # head sampling sehingga transaksi lambatnya masih bisa terlewat
+    SENTRY_KEEP_SLOW_TRANSACTIONS: bool = True
+    SENTRY_KEEP_SLOW_MIN_RATE: float = 0.25
     LOG_LEVEL: str = "INFO"
 
     # --- Konfigurasi Pembatasan Laju dan Performa ---
 
     # Konfigurasi Pembatasan Laju
     RATE_LIMIT_ENABLED: bool = True
-    YOUTUBE_REQUESTS_PER_MINUTE: int = 5
-    YOUTUBE_REQUESTS_PER_HOUR: int = 30
+    RATE_LIMIT_BACKEND: str = "local"  # "local" (per proses) atau "redis" (bersama semua worker)
+    RATE_LIMIT_REDIS_URL: str | None = None  # Default ke CELERY_BROKER_URL
+    RATE_LIMIT_LEASE_SECONDS: int = 600  # Slot konkurensi proses yang mati dilepas setelah ini
+    # Satu anggaran untuk kedua backend: per proses (local) atau per cluster (redis)
+    YOUTUBE_REQUESTS_PER_MINUTE: int = 100
+    YOUTUBE_REQUESTS_PER_HOUR: int = 1000  # Cukup untuk isi ulang pool lagu (~126/jam)
     MUSIC_GENERATION_REQUESTS_PER_HOUR: int = 10
 
     # Konfigurasi YouTube
     YOUTUBE_MAX_RETRIES: int = 2
     YOUTUBE_TIMEOUT_SECONDS: int = 45
-    YOUTUBE_CONCURRENT_REQUESTS: int = 2
+    YOUTUBE_CONCURRENT_REQUESTS: int = 3
     YOUTUBE_MIN_INTERVAL_SECONDS: int = 3
 
+    # Antrian request ekstraksi YouTube
+    # Worker diskalakan AIMD antara MIN dan MAX berdasarkan latensi dan throttling (429)
+    REQUEST_QUEUE_MIN_WORKERS: int = 1
+    REQUEST_QUEUE_INITIAL_WORKERS: int = 3
+    REQUEST_QUEUE_MAX_WORKERS: int = 6
+    REQUEST_QUEUE_IDLE_TIMEOUT_SECONDS: int = 60
+    REQUEST_QUEUE_LATENCY_TARGET_SECONDS: int = 45
+    REQUEST_QUEUE_MAX_SIZE: int = 100
+    REQUEST_QUEUE_OVERFLOW: str = "shed"  # "reject" atau "shed" (buang request prioritas terendah)
+    REQUEST_QUEUE_AGING_SECONDS: int = 30  # Prioritas naik satu level tiap N detik menunggu
+
+    # Pool proses yt-dlp (menghindari spawn subprocess per strategi)
+    YTDLP_WORKER_POOL_ENABLED: bool = True
+    YTDLP_WORKER_POOL_SIZE: int = 2
+    YTDLP_WORKER_JOB_TIMEOUT_SECONDS: int = 120
+    YTDLP_WORKER_MAX_JOBS: int = 50
+
+    # Pool proses bcrypt untuk login/registrasi (di luar threadpool anyio)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Lebih dari ini dijawab 503
+
     # Konfigurasi Respons
     MAX_RESPONSE_SIZE_MB: float = 10.0
     ENABLE_COMPRESSION: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Byte; respons lebih kecil dikirim apa adanya
+    COMPRESSION_OFFLOAD_SIZE: int = 256 * 1024  # Byte; kompresi lebih besar dijalankan di thread
 
     # Konfigurasi Server
     WORKER_TIMEOUT: int = 300  # 5 menit
     MAX_REQUEST_SIZE: int = 50 * 1024 * 1024  # 50MB
 
+    # Retensi track musik gagal (dibersihkan oleh job maintenance Celery)
+    FAILED_TRACK_RETENTION_COUNT: int = 5  # Selalu simpan N track gagal terbaru
+    FAILED_TRACK_RETENTION_HOURS: int = 24
+    FAILED_TRACK_CLEANUP_INTERVAL_SECONDS: int = 60 * 60
+
+    # Pool track siap putar per mood (diisi ulang oleh Celery beat)
+    READY_TRACK_POOL_ENABLED: bool = True
+    READY_TRACK_POOL_SIZE: int = 3  # Track per mood bucket
+    READY_TRACK_MAX_AGE_HOURS: int = 4  # URL stream YouTube kedaluwarsa ~6 jam
+    READY_TRACK_POOL_REFILL_INTERVAL_SECONDS: int = 60 * 10
+
+    # Stasiun radio (satu panggilan LLM + pencarian YouTube paralel)
+    RADIO_STATION_SIZE: int = 5
+    RADIO_SEARCH_CONCURRENCY: int = 8  # >= ukuran stasiun + cadangan: satu putaran pencarian
+    RADIO_STATION_REFRESH_INTERVAL_SECONDS: int = 60 * 60  # Rotasi playlist oleh Celery beat
+    RADIO_STATION_MAX_AGE_HOURS: int = 6  # Lebih tua dari ini dianggap miss
+
     # Konfigurasi Cache
     CACHE_TTL_SECONDS: int = 3600  # 1 jam
     MAX_CACHE_ENTRIES: int = 1000
+    # Redis bersama untuk cache playlist harian (kosong = cache lokal per worker)
+    PLAYLIST_CACHE_REDIS_URL: str | None = None
+    # Redis bersama untuk snapshot home feed (kosong = snapshot per worker)
+    HOME_FEED_CACHE_REDIS_URL: str | None = None
+
+    # Cache pengguna terautentikasi di get_current_user (per worker; 0 = nonaktif)
+    USER_CACHE_TTL_SECONDS: int = 30  # Batas basi data user antar worker
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Ekspor data pengguna (/users/me/export)
+    EXPORT_BATCH_SIZE: int = 500  # Baris per batch dari cursor server-side
 
 
 # Buat satu instance settings untuk digunakan di seluruh aplikasi
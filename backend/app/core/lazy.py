@@ -0,0 +1,36 @@
+# backend/app/core/lazy.py
+
+import importlib
+from typing import Any, Optional
+
+
+class LazyImport:
+    """
+    Stand-in for ``from <module> import <name>`` that imports on first use.
+
+    For heavy dependencies that most API requests never touch, so they stay
+    out of worker boot. Calls and attribute access go to the real object;
+    tests can still monkeypatch the module attribute holding the stand-in.
+    """
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+        self._target: Optional[Any] = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {self._module}.{self._name} ({state})>"
@@ -0,0 +1,151 @@
+# backend/app/core/password_hasher.py
+
+import asyncio
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+log = structlog.get_logger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when ``max_pending`` hash jobs are already queued or running."""
+
+
+@functools.lru_cache(maxsize=None)
+def _context(rounds: int):
+    # Only the pool processes hash, so the API process never loads passlib
+    from passlib.context import CryptContext
+
+    # Hashes with any other cost count as outdated and get rehashed on login
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+# Worker functions run in the pool processes and also return their start
+# time, so the parent can tell queue wait from hashing time.
+
+def _hash(password: str, rounds: int) -> Tuple[str, float]:
+    started = time.time()
+    return _context(rounds).hash(password), started
+
+
+def _verify_and_update(
+    password: str, hashed: str, rounds: int
+) -> Tuple[Tuple[bool, Optional[str]], float]:
+    started = time.time()
+    return _context(rounds).verify_and_update(password, hashed), started
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing and verification on a dedicated process pool.
+
+    A login burst costs 100-300ms of CPU per password; running it here keeps
+    it off the anyio threadpool that serves every other sync endpoint, and
+    ``max_workers`` caps how many cores it can take. More than
+    ``max_pending`` outstanding jobs raise ``PasswordHasherBusy`` instead of
+    queueing without bound. The pool is started on first use, so each
+    Gunicorn worker gets its own after forking.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 64, rounds: int = 12):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.stats = {
+            "hashed": 0,
+            "verified": 0,
+            "rehash_needed": 0,
+            "rejected": 0,
+            "max_pending_seen": 0,
+        }
+        self.queue_time = Histogram("password_hash_wait_seconds")
+        self.run_time = Histogram("password_hash_run_seconds")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn avoids inheriting the event loop, DB connections and locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                log.info("password_hasher:started", max_workers=self.max_workers)
+            return self._executor
+
+    async def _submit(self, func, *args) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                raise PasswordHasherBusy("Password hashing queue is full")
+            self.pending += 1
+            self.stats["max_pending_seen"] = max(self.stats["max_pending_seen"], self.pending)
+        submitted = time.time()
+        try:
+            result, started = await asyncio.wrap_future(self._get_executor().submit(func, *args))
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); the next call starts a fresh pool
+            with self._lock:
+                self._executor = None
+            log.error("password_hasher:pool_broken")
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+        finished = time.time()
+        self.queue_time.observe(max(0.0, started - submitted))
+        self.run_time.observe(max(0.0, finished - started))
+        return result
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(_hash, password, self.rounds)
+        self.stats["hashed"] += 1
+        return hashed
+
+    async def verify(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        ``(matches, new_hash)``. ``new_hash`` is set when the password matched
+        a hash made with other cost parameters; store it in place of ``hashed``.
+        """
+        matches, new_hash = await self._submit(_verify_and_update, password, hashed, self.rounds)
+        self.stats["verified"] += 1
+        if new_hash is not None:
+            self.stats["rehash_needed"] += 1
+        return matches, new_hash
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "max_workers": self.max_workers,
+            "rounds": self.rounds,
+            "queue_time_seconds": self.queue_time.snapshot(),
+            "run_time_seconds": self.run_time.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global hasher instance
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    rounds=settings.BCRYPT_ROUNDS,
+)
@@ -2,125 +2,491 @@
 
 import asyncio
 import time
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+import uuid
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import structlog
 
+from app.core.config import Settings, settings
+
 logger = structlog.get_logger(__name__)
 
+MINUTE = 60
+HOUR = 3600
+
+
+class _SourceState:
+    """Sliding windows and concurrency counter for one request source."""
+
+    __slots__ = ("minute", "hour", "active", "waiters")
+
+    def __init__(self):
+        # Timestamps in arrival order; expired ones are popped from the left,
+        # so each timestamp is appended and removed once (amortized O(1)).
+        self.minute: Deque[float] = deque()
+        self.hour: Deque[float] = deque()
+        self.active = 0
+        self.waiters: List[asyncio.Future] = []
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
 class RateLimiter:
     """Advanced rate limiter for YouTube API requests"""
-    
-    def __init__(self):
-        self.requests: Dict[str, list] = {}
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, clock: Callable[[], float] = time.monotonic):
         self.youtube_limits = {
             'requests_per_minute': 100,  # Conservative limit
             'requests_per_hour': 1000,   # Daily quota management
-            'concurrent_requests': 3,    # Max concurrent requests
+            'concurrent_requests': 3,    # Max concurrent requests per source
         }
-        self.active_requests = 0
-        self.lock = asyncio.Lock()
-        
+        if limits:
+            self.youtube_limits.update(limits)
+        self._clock = clock
+        self._sources: Dict[str, _SourceState] = {}
+
+    def _state(self, source: str) -> _SourceState:
+        state = self._sources.get(source)
+        if state is None:
+            state = self._sources[source] = _SourceState()
+        return state
+
+    def _expire(self, state: _SourceState, now: float) -> None:
+        minute, hour = state.minute, state.hour
+        while minute and now - minute[0] >= MINUTE:
+            minute.popleft()
+        while hour and now - hour[0] >= HOUR:
+            hour.popleft()
+
+    def _blocked_by(self, source: str) -> Optional[str]:
+        """Name of the limit currently blocking ``source``, or None if a request may start."""
+        state = self._state(source)
+        self._expire(state, self._clock())
+        if state.active >= self.youtube_limits['concurrent_requests']:
+            return "concurrent"
+        if len(state.minute) >= self.youtube_limits['requests_per_minute']:
+            return "minute"
+        if len(state.hour) >= self.youtube_limits['requests_per_hour']:
+            return "hour"
+        return None
+
     async def can_make_request(self, source: str = "youtube") -> bool:
         """Check if we can make a request within rate limits"""
-        async with self.lock:
-            now = time.time()
-            
-            # Initialize if not exists
-            if source not in self.requests:
-                self.requests[source] = []
-            
-            # Clean old requests (older than 1 hour)
-            self.requests[source] = [
-                req_time for req_time in self.requests[source] 
-                if now - req_time < 3600
-            ]
-            
-            # Check concurrent requests
-            if self.active_requests >= self.youtube_limits['concurrent_requests']:
-                logger.warning("rate_limiter:concurrent_limit_reached", 
-                             active=self.active_requests)
-                return False
-            
-            # Check per-minute limit
-            recent_requests = [
-                req_time for req_time in self.requests[source] 
-                if now - req_time < 60
-            ]
-            
-            if len(recent_requests) >= self.youtube_limits['requests_per_minute']:
-                logger.warning("rate_limiter:minute_limit_reached", 
-                             count=len(recent_requests))
-                return False
-            
-            # Check hourly limit
-            if len(self.requests[source]) >= self.youtube_limits['requests_per_hour']:
-                logger.warning("rate_limiter:hour_limit_reached", 
-                             count=len(self.requests[source]))
-                return False
-            
-            return True
-    
+        # All bookkeeping is synchronous, so it is atomic within the event loop
+        # and needs no lock.
+        blocked = self._blocked_by(source)
+        if blocked:
+            state = self._state(source)
+            logger.warning(f"rate_limiter:{blocked}_limit_reached", source=source,
+                           active=state.active, minute=len(state.minute), hour=len(state.hour))
+        return blocked is None
+
     async def record_request(self, source: str = "youtube"):
         """Record a new request"""
-        async with self.lock:
-            now = time.time()
-            if source not in self.requests:
-                self.requests[source] = []
-            self.requests[source].append(now)
-            self.active_requests += 1
-            logger.info("rate_limiter:request_recorded", 
-                       source=source, active=self.active_requests)
-    
+        state = self._state(source)
+        now = self._clock()
+        self._expire(state, now)
+        state.minute.append(now)
+        state.hour.append(now)
+        state.active += 1
+        logger.info("rate_limiter:request_recorded",
+                   source=source, active=state.active)
+
     async def complete_request(self, source: str = "youtube"):
         """Mark request as completed"""
-        async with self.lock:
-            self.active_requests = max(0, self.active_requests - 1)
-            logger.info("rate_limiter:request_completed", 
-                       source=source, active=self.active_requests)
-    
+        state = self._state(source)
+        state.active = max(0, state.active - 1)
+        logger.info("rate_limiter:request_completed",
+                   source=source, active=state.active)
+        self._wake_waiters(state)
+
+    async def release_reservation(self, source: str = "youtube"):
+        """Nothing to release: waiting for a slot doesn't reserve one here"""
+
+    def _wake_waiters(self, state: _SourceState) -> None:
+        """Wake everyone waiting on this source; each re-checks the limits itself."""
+        waiters, state.waiters = state.waiters, []
+        for future in waiters:
+            loop = future.get_loop()
+            if loop.is_closed():
+                continue
+            loop.call_soon_threadsafe(_wake, future)
+
     async def wait_for_available_slot(self, source: str = "youtube", max_wait: int = 300):
         """Wait until we can make a request (with timeout)"""
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait:
-            if await self.can_make_request(source):
+        deadline = self._clock() + max_wait
+        state = self._state(source)
+        loop = asyncio.get_running_loop()
+
+        while True:
+            blocked = self._blocked_by(source)
+            if blocked is None:
                 return True
-            
-            logger.info("rate_limiter:waiting_for_slot", 
-                       source=source, waited=int(time.time() - start_time))
-            await asyncio.sleep(5)  # Wait 5 seconds before retry
-        
-        logger.error("rate_limiter:timeout_waiting_for_slot", 
+
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                break
+
+            # Window limits free up at a known time; a concurrency slot frees up
+            # when complete_request() wakes us.
+            wait = self.get_wait_time(source) if blocked != "concurrent" else remaining
+            future = loop.create_future()
+            state.waiters.append(future)
+            logger.info("rate_limiter:waiting_for_slot",
+                       source=source, blocked_by=blocked, wait=round(min(wait, remaining), 2))
+            try:
+                await asyncio.wait_for(future, timeout=min(wait, remaining))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if future in state.waiters:
+                    state.waiters.remove(future)
+
+        logger.error("rate_limiter:timeout_waiting_for_slot",
                     source=source, max_wait=max_wait)
         return False
-    
+
     async def get_status(self) -> dict:
         """Get current rate limiter status"""
-        now = time.time()
         status = {}
-        
+
         for operation_type in ["youtube", "music_generation", "youtube_search"]:
-            history = self.requests.get(operation_type, [])
-            recent_requests = [t for t in history if now - t < 3600]  # Last hour
-            
+            state = self._state(operation_type)
             status[operation_type] = {
-                "can_make_request": await self.can_make_request(operation_type),
-                "active_requests": self.get_active_count(operation_type),
-                "requests_last_hour": len(recent_requests),
+                "can_make_request": self._blocked_by(operation_type) is None,
+                "active_requests": state.active,
+                "requests_last_minute": len(state.minute),
+                "requests_last_hour": len(state.hour),
+                "waiting": len(state.waiters),
                 "wait_time_seconds": self.get_wait_time(operation_type)
             }
-        
+
         return status
-    
+
     def get_active_count(self, operation_type: str) -> int:
         """Get number of active requests for operation type"""
-        return len(self.requests.get(operation_type, []))
-    
-    def get_wait_time(self, source: str) -> int:
-        """Estimate wait time before next request can be made"""
-        # TODO: Implement wait time calculation based on request history
-        return 0
+        return self._state(operation_type).active
+
+    def get_request_count(self, operation_type: str) -> int:
+        """Number of requests recorded for operation type in the last hour"""
+        state = self._state(operation_type)
+        self._expire(state, self._clock())
+        return len(state.hour)
+
+    def get_wait_time(self, source: str) -> float:
+        """
+        Seconds until the sliding windows allow the next request. Concurrency is
+        not time-based, so a source that is only blocked by it reports 0.
+        """
+        state = self._state(source)
+        now = self._clock()
+        self._expire(state, now)
+        wait = 0.0
+        limits = self.youtube_limits
+
+        # A full window opens once enough of its oldest requests age out to
+        # bring the count below the limit.
+        if len(state.minute) >= limits['requests_per_minute']:
+            oldest = state.minute[len(state.minute) - limits['requests_per_minute']]
+            wait = max(wait, oldest + MINUTE - now)
+        if len(state.hour) >= limits['requests_per_hour']:
+            oldest = state.hour[len(state.hour) - limits['requests_per_hour']]
+            wait = max(wait, oldest + HOUR - now)
+        return max(0.0, wait)
+
+
+# Check (mode 0), check-and-reserve (mode 1) or unconditionally record (mode 2)
+# a request in one atomic step. KEYS: request timestamps zset, leases zset
+# (member -> lease expiry). Expired leases belong to crashed processes.
+_ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local per_minute = tonumber(ARGV[2])
+local per_hour = tonumber(ARGV[3])
+local concurrent = tonumber(ARGV[4])
+local lease_seconds = tonumber(ARGV[5])
+local member = ARGV[6]
+local mode = ARGV[7]
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - 3600)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+
+local active = redis.call('ZCARD', KEYS[2])
+local hour_count = redis.call('ZCARD', KEYS[1])
+local minute_count = redis.call('ZCOUNT', KEYS[1], '(' .. (now - 60), '+inf')
+
+local wait = 0
+if minute_count >= per_minute then
+  local oldest = redis.call('ZRANGE', KEYS[1], hour_count - per_minute, hour_count - per_minute, 'WITHSCORES')
+  wait = math.max(wait, tonumber(oldest[2]) + 60 - now)
+end
+if hour_count >= per_hour then
+  local oldest = redis.call('ZRANGE', KEYS[1], hour_count - per_hour, hour_count - per_hour, 'WITHSCORES')
+  wait = math.max(wait, tonumber(oldest[2]) + 3600 - now)
+end
+
+local blocked = ''
+if active >= concurrent then
+  blocked = 'concurrent'
+elseif minute_count >= per_minute then
+  blocked = 'minute'
+elseif hour_count >= per_hour then
+  blocked = 'hour'
+end
+
+if mode == '2' or (mode == '1' and blocked == '') then
+  redis.call('ZADD', KEYS[1], now, member)
+  redis.call('ZADD', KEYS[2], now + lease_seconds, member)
+  redis.call('EXPIRE', KEYS[1], 3600)
+  redis.call('EXPIRE', KEYS[2], lease_seconds)
+  active = active + 1
+  minute_count = minute_count + 1
+  hour_count = hour_count + 1
+end
+
+return {blocked, tostring(math.max(wait, 0)), active, minute_count, hour_count}
+"""
+
+
+class RedisRateLimiter:
+    """
+    RateLimiter with its windows and concurrency leases in Redis, so the budget
+    holds across every gunicorn and Celery worker. All bookkeeping runs in one
+    Lua script, which makes check-and-reserve atomic cluster-wide.
+
+    ``wait_for_available_slot`` reserves the slot it finds; the following
+    ``record_request`` from the same process consumes that reservation, or
+    ``release_reservation`` returns it if the request never runs.
+    Redis errors fail open so extraction keeps working without Redis.
+
+    The client is synchronous (Celery tasks share it), so the async methods
+    run each round trip in a thread to keep the event loop free while Redis
+    is slow. The synchronous getters block; call them off the loop.
+    """
+
+    def __init__(
+        self,
+        client,
+        limits: Optional[Dict[str, int]] = None,
+        prefix: str = "ratelimit:",
+        lease_seconds: int = 600,
+        poll_interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.youtube_limits = {
+            'requests_per_minute': 100,
+            'requests_per_hour': 1000,
+            'concurrent_requests': 3,
+        }
+        if limits:
+            self.youtube_limits.update(limits)
+        self.client = client
+        self.prefix = prefix
+        self.lease_seconds = lease_seconds
+        # Remote completions can't wake local waiters, so concurrency waits re-check this often
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._script = client.register_script(_ACQUIRE_SCRIPT)
+        self._leases: Dict[str, List[str]] = defaultdict(list)
+        self._reserved: Dict[str, int] = defaultdict(int)
+        self._waiters: Dict[str, List[asyncio.Future]] = defaultdict(list)
+
+    def _run(self, source: str, mode: str) -> Tuple[Optional[str], float, dict]:
+        """Run the script; returns (blocked_by, wait_seconds, counts) and keeps any new lease."""
+        member = uuid.uuid4().hex
+        limits = self.youtube_limits
+        try:
+            blocked, wait, active, minute, hour = self._script(
+                keys=[f"{self.prefix}{source}:requests", f"{self.prefix}{source}:leases"],
+                args=[
+                    repr(self._clock()), limits['requests_per_minute'], limits['requests_per_hour'],
+                    limits['concurrent_requests'], self.lease_seconds, member, mode,
+                ],
+            )
+        except Exception as e:
+            logger.warning("rate_limiter:redis_unavailable", source=source, error=str(e))
+            return None, 0.0, {"active": 0, "minute": 0, "hour": 0}
+
+        blocked = blocked.decode() if isinstance(blocked, bytes) else blocked
+        counts = {"active": int(active), "minute": int(minute), "hour": int(hour)}
+        if mode == "2" or (mode == "1" and not blocked):
+            self._leases[source].append(member)
+        return blocked or None, float(wait), counts
+
+    async def _run_async(self, source: str, mode: str) -> Tuple[Optional[str], float, dict]:
+        return await asyncio.to_thread(self._run, source, mode)
+
+    async def _release_lease(self, source: str, member: str, *keys: str) -> None:
+        def release():
+            for key in keys:
+                self.client.zrem(f"{self.prefix}{source}:{key}", member)
+
+        try:
+            await asyncio.to_thread(release)
+        except Exception as e:
+            logger.warning("rate_limiter:redis_unavailable", source=source, error=str(e))
+
+    async def can_make_request(self, source: str = "youtube") -> bool:
+        """Check if we can make a request within the cluster-wide limits"""
+        blocked, _, counts = await self._run_async(source, "0")
+        if blocked:
+            logger.warning(f"rate_limiter:{blocked}_limit_reached", source=source, **counts)
+        return blocked is None
+
+    async def record_request(self, source: str = "youtube"):
+        """Record a new request, consuming a reservation made while waiting"""
+        if self._reserved[source] > 0:
+            self._reserved[source] -= 1
+        else:
+            await self._run_async(source, "2")
+        logger.info("rate_limiter:request_recorded", source=source,
+                   local_leases=len(self._leases[source]))
+
+    async def complete_request(self, source: str = "youtube"):
+        """Release one of this process' concurrency leases"""
+        if self._leases[source]:
+            await self._release_lease(source, self._leases[source].pop(), "leases")
+        logger.info("rate_limiter:request_completed", source=source,
+                   local_leases=len(self._leases[source]))
+        self._wake(source)
+
+    async def release_reservation(self, source: str = "youtube"):
+        """
+        Return a slot reserved by ``wait_for_available_slot`` for a request
+        that never ran (rejected, shed or cancelled in the queue). The
+        request is dropped from the windows too, since it never reached
+        upstream.
+        """
+        if self._reserved[source] <= 0:
+            return
+        self._reserved[source] -= 1
+        if self._leases[source]:
+            await self._release_lease(source, self._leases[source].pop(), "leases", "requests")
+        logger.info("rate_limiter:reservation_released", source=source,
+                   local_leases=len(self._leases[source]))
+        self._wake(source)
+
+    def _wake(self, source: str) -> None:
+        waiters, self._waiters[source] = self._waiters[source], []
+        for future in waiters:
+            loop = future.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+    async def wait_for_available_slot(self, source: str = "youtube", max_wait: int = 300):
+        """Wait until a slot is free and reserve it (with timeout)"""
+        deadline = time.monotonic() + max_wait
+        loop = asyncio.get_running_loop()
+
+        while True:
+            blocked, wait = await self._reserve(source)
+            if blocked is None:
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            if blocked == "concurrent":
+                wait = self.poll_interval
+            future = loop.create_future()
+            self._waiters[source].append(future)
+            logger.info("rate_limiter:waiting_for_slot",
+                       source=source, blocked_by=blocked, wait=round(min(wait, remaining), 2))
+            try:
+                await asyncio.wait_for(future, timeout=min(wait, remaining))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if future in self._waiters[source]:
+                    self._waiters[source].remove(future)
+
+        logger.error("rate_limiter:timeout_waiting_for_slot",
+                    source=source, max_wait=max_wait)
+        return False
+
+    async def _reserve(self, source: str) -> Tuple[Optional[str], float]:
+        """Check-and-reserve; a slot reserved after the caller gave up is handed back."""
+        attempt = asyncio.ensure_future(self._run_async(source, "1"))
+        try:
+            blocked, wait, _ = await asyncio.shield(attempt)
+        except asyncio.CancelledError:
+            attempt.add_done_callback(lambda done: self._abandon(source, done))
+            raise
+        if blocked is None:
+            self._reserved[source] += 1
+        return blocked, wait
+
+    def _abandon(self, source: str, attempt: asyncio.Future) -> None:
+        if attempt.result()[0] is None:
+            self._reserved[source] += 1
+            asyncio.ensure_future(self.release_reservation(source))
+
+    async def get_status(self) -> dict:
+        """Get current cluster-wide rate limiter status"""
+        status = {}
+        operation_types = ["youtube", "music_generation", "youtube_search"]
+        results = await asyncio.gather(
+            *(self._run_async(operation_type, "0") for operation_type in operation_types)
+        )
+
+        for operation_type, (blocked, wait, counts) in zip(operation_types, results):
+            status[operation_type] = {
+                "can_make_request": blocked is None,
+                "active_requests": counts["active"],
+                "requests_last_minute": counts["minute"],
+                "requests_last_hour": counts["hour"],
+                "waiting": len(self._waiters[operation_type]),
+                "wait_time_seconds": wait,
+            }
+
+        return status
+
+    def get_active_count(self, operation_type: str) -> int:
+        """Get number of active requests for operation type across all workers"""
+        return self._run(operation_type, "0")[2]["active"]
+
+    def get_request_count(self, operation_type: str) -> int:
+        """Number of requests recorded for operation type in the last hour across all workers"""
+        return self._run(operation_type, "0")[2]["hour"]
+
+    def get_wait_time(self, source: str) -> float:
+        """Seconds until the cluster-wide sliding windows allow the next request"""
+        return self._run(source, "0")[1]
+
+
+def create_rate_limiter(settings: Settings = settings):
+    """Build the limiter selected by ``RATE_LIMIT_BACKEND`` ("local" or "redis")."""
+    limits = {
+        'requests_per_minute': settings.YOUTUBE_REQUESTS_PER_MINUTE,
+        'requests_per_hour': settings.YOUTUBE_REQUESTS_PER_HOUR,
+        'concurrent_requests': settings.YOUTUBE_CONCURRENT_REQUESTS,
+    }
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.RATE_LIMIT_REDIS_URL or settings.CELERY_BROKER_URL, socket_timeout=1
+        )
+        return RedisRateLimiter(client, limits=limits, lease_seconds=settings.RATE_LIMIT_LEASE_SECONDS)
+    return RateLimiter(limits=limits)
+
 
 # Global rate limiter instance
-rate_limiter = RateLimiter()
+rate_limiter = create_rate_limiter()
+
+
+async def release_unused_slot(job, source: str = "youtube") -> None:
+    """
+    Call once a caller is done with a request it reserved a slot for and then
+    queued (``job`` is its RequestJob, or None if queueing failed). A job that
+    never started never consumed its reservation, so it is returned here; a
+    job still queued is cancelled first, as nobody waits for it any more.
+    """
+    if job is not None:
+        job.cancel()  # No-op once the job has started
+        if job.started_at is not None:
+            return
+    await rate_limiter.release_reservation(source)
@@ -1,12 +1,17 @@
 # backend/app/core/request_queue.py
 
 import asyncio
+import itertools
+import time
 import uuid
-from typing import Optional, Callable, Any, Dict
-from datetime import datetime
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Dict, List, Union
 from enum import Enum
 import structlog
 
+from app.core.config import settings
+from app.core.metrics import Histogram
+
 logger = structlog.get_logger(__name__)
 
 class RequestPriority(Enum):
@@ -15,206 +20,541 @@ class RequestPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-class QueuedRequest:
+
+class QueueFullError(Exception):
+    """Raised when a request is rejected, or shed for a more important one, by a full queue."""
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SHED = "shed"
+
+
+class RequestJob:
+    """Handle for a queued request, returned by ``RequestQueue.add_request``."""
+
+    __slots__ = (
+        "request_id", "func", "args", "kwargs", "priority", "timeout", "tenant",
+        "seq", "status", "enqueued_at", "started_at", "finished_at", "future", "_queue",
+    )
+
     def __init__(
-        self, 
-        request_id: str,
+        self,
+        queue: "RequestQueue",
+        seq: int,
         func: Callable,
         args: tuple = (),
         kwargs: dict = None,
         priority: RequestPriority = RequestPriority.NORMAL,
-        timeout: int = 300
+        timeout: int = 300,
+        tenant: str = "",
     ):
-        self.request_id = request_id
+        self.request_id = str(uuid.uuid4())
         self.func = func
         self.args = args
         self.kwargs = kwargs or {}
         self.priority = priority
         self.timeout = timeout
-        self.created_at = datetime.now()
-        self.future: Optional[asyncio.Future] = None
+        self.tenant = tenant
+        self.seq = seq
+        self.status = JobStatus.QUEUED
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue = queue
+
+    async def result(self, timeout: Optional[float] = 300) -> Any:
+        """Wait for the job's result. A job still queued when the wait times out is cancelled."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error("request_queue:timeout", request_id=self.request_id, status=self.status.value)
+            self.cancel()
+            raise
+
+    def cancel(self) -> bool:
+        """Drop the job if it has not started yet."""
+        return self._queue._cancel(self)
+
+    @property
+    def queue_time(self) -> float:
+        return (self.started_at or time.monotonic()) - self.enqueued_at
+
+    @property
+    def run_time(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+THROTTLE_MARKERS = ("429", "too many requests", "rate limit", "captcha", "bot")
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Whether a job failure means upstream is pushing back (429, bot checks, timeouts)."""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+class AIMDConcurrencyController:
+    """
+    Additive-increase/multiplicative-decrease concurrency limit.
+
+    Every fast success adds ``1 / limit`` (about +1 per limit's worth of jobs).
+    A throttle signal, or a success slower than ``latency_target``, multiplies
+    the limit by ``decrease_factor``. Decreases are spaced by ``cooldown``
+    seconds so one burst of concurrent failures only counts once. An empty
+    result (``None``: every extraction strategy failed) never raises the limit.
+    """
+
+    __slots__ = (
+        "min_limit", "max_limit", "limit", "latency_target", "decrease_factor",
+        "cooldown", "_last_decrease", "increases", "decreases",
+    )
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 6,
+        initial: Optional[float] = None,
+        latency_target: float = 45,
+        decrease_factor: float = 0.5,
+        cooldown: float = 5,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial or self.min_limit)))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self._decrease("slow")
+        elif self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.increases += 1
+
+    def on_empty(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self._decrease("slow")
+
+    def on_throttle(self) -> None:
+        self._decrease("throttled")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown or self.limit <= self.min_limit:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self.decreases += 1
+        logger.warning("request_queue:concurrency_decreased", reason=reason, limit=self.current)
+
+
+class _TenantState:
+    """Queued jobs and fair-share bookkeeping for one tenant (user)."""
+
+    __slots__ = ("jobs", "weight", "last_finish", "running")
+
+    def __init__(self, weight: float = 1.0):
+        self.jobs: List[RequestJob] = []
+        self.weight = weight
+        self.last_finish = 0.0  # Virtual time at which this tenant's last dispatched job "ends"
+        self.running = 0
+
 
 class RequestQueue:
-    """Queue system for managing YouTube API requests"""
-    
-    def __init__(self, max_workers: int = 3):
+    """
+    Bounded, per-tenant fair queue for YouTube extraction requests.
+
+    Jobs are ordered by priority first. A job's effective priority rises one
+    level for every ``aging_seconds`` it waits, so LOW jobs eventually run.
+    Among jobs of equal effective priority, tenants (user ids) are served by
+    start-time fair queuing: each dispatch advances the tenant's virtual clock
+    by ``1 / weight``, and the tenant with the earliest virtual start goes
+    next. A burst from one user therefore interleaves with everyone else's
+    jobs instead of running ahead of them.
+
+    When the queue is full, ``overflow="reject"`` refuses the new request and
+    ``overflow="shed"`` drops the least important queued request instead if
+    the new one has a higher priority. Either way the loser gets a
+    ``QueueFullError``.
+
+    Workers are started on demand up to the AIMD concurrency limit, which
+    moves between ``min_workers`` and ``max_workers`` based on job latency
+    and throttling. Workers above the limit, or idle for ``idle_timeout``
+    seconds, exit.
+    """
+
+    RECENT_JOBS = 256  # Finished jobs kept so get_result(request_id) still works
+
+    def __init__(
+        self,
+        max_workers: int = 3,
+        max_queue_size: int = 100,
+        overflow: str = "shed",
+        aging_seconds: float = 30,
+        min_workers: int = 1,
+        initial_workers: Optional[int] = None,
+        idle_timeout: float = 60,
+        latency_target: float = 45,
+    ):
+        if overflow not in ("reject", "shed"):
+            raise ValueError("overflow must be 'reject' or 'shed'")
         self.max_workers = max_workers
-        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
-        self.active_requests: Dict[str, QueuedRequest] = {}
-        self.workers_running = 0
+        self.min_workers = min_workers
+        self.idle_timeout = idle_timeout
+        self.concurrency = AIMDConcurrencyController(
+            min_limit=min_workers,
+            max_limit=max_workers,
+            initial=initial_workers or max_workers,
+            latency_target=latency_target,
+        )
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.aging_seconds = aging_seconds
+        self._tenants: Dict[str, _TenantState] = {}
+        self._weights: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._queued = 0
+        self._seq = itertools.count()
+        self._jobs: Dict[str, RequestJob] = {}
+        self._recent: "OrderedDict[str, RequestJob]" = OrderedDict()
+        self._workers: set = set()
+        self._worker_ids = itertools.count(1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
         self.stats = {
+            'submitted': 0,
             'total_processed': 0,
             'total_failed': 0,
-            'queue_size': 0
+            'timed_out': 0,
+            'rejected': 0,
+            'shed': 0,
+            'cancelled': 0,
         }
-        self._workers = []
-        self._results = {}
-        
+        self.queue_time = Histogram("request_queue_wait_seconds")
+        self.run_time = Histogram("request_queue_run_seconds")
+
     async def add_request(
-        self, 
-        func: Callable, 
-        args: tuple = (), 
+        self,
+        func: Callable,
+        args: tuple = (),
         kwargs: dict = None,
         priority: RequestPriority = RequestPriority.NORMAL,
-        timeout: int = 300
-    ) -> str:
-        """Add request to queue and return request ID"""
-        
-        request_id = str(uuid.uuid4())
-        request = QueuedRequest(
-            request_id=request_id,
-            func=func,
-            args=args,
-            kwargs=kwargs,
-            priority=priority,
-            timeout=timeout
-        )
-        
-        # Create future for result
-        request.future = asyncio.get_event_loop().create_future()
-        
-        # Add to queue (priority queue uses negative priority for correct ordering)
-        await self.queue.put((-priority.value, request.created_at, request))
-        
-        self.stats['queue_size'] = self.queue.qsize()
-        
-        logger.info("request_queue:added", 
-                   request_id=request_id, 
+        timeout: int = 300,
+        tenant: Optional[Union[str, int]] = None,
+    ) -> RequestJob:
+        """
+        Queue a request and return its job handle; raises QueueFullError when full.
+        ``tenant`` (usually the user id) is the unit of fair sharing.
+        """
+        self._bind_loop()
+
+        if self._queued >= self.max_queue_size:
+            victim = self._shed_candidate() if self.overflow == "shed" else None
+            if victim is None or victim.priority.value >= priority.value:
+                self.stats['rejected'] += 1
+                logger.warning("request_queue:rejected", priority=priority.name,
+                               queue_size=self._queued)
+                raise QueueFullError("Request queue is full")
+            self._finish_unstarted(victim, JobStatus.SHED,
+                                   QueueFullError("Request shed for a higher-priority request"))
+            self.stats['shed'] += 1
+            logger.warning("request_queue:shed", request_id=victim.request_id,
+                           priority=victim.priority.name, for_priority=priority.name)
+
+        tenant = "" if tenant is None else str(tenant)
+        job = RequestJob(self, next(self._seq), func, args, kwargs, priority, timeout, tenant)
+        self._jobs[job.request_id] = job
+        self._tenant(tenant).jobs.append(job)
+        self._queued += 1
+        self.stats['submitted'] += 1
+        self._wakeup.set()
+        self._scale_up()
+
+        logger.info("request_queue:added",
+                   request_id=job.request_id,
                    priority=priority.name,
-                   queue_size=self.stats['queue_size'])
-        
-        # Start workers if not running
-        await self._ensure_workers_running()
-        
-        return request_id
-    
-    async def get_result(self, request_id: str, timeout: int = 300) -> Any:
-        """Wait for request result"""
-        if request_id in self.active_requests:
-            request = self.active_requests[request_id]
-            if request.future:
-                try:
-                    result = await asyncio.wait_for(request.future, timeout=timeout)
-                    return result
-                except asyncio.TimeoutError:
-                    logger.error("request_queue:timeout", request_id=request_id)
-                    raise
-                finally:
-                    # Cleanup
-                    if request_id in self.active_requests:
-                        del self.active_requests[request_id]
-        
-        raise ValueError(f"Request {request_id} not found")
-    
-    async def _ensure_workers_running(self):
-        """Ensure we have enough workers running"""
-        while self.workers_running < self.max_workers:
-            self.workers_running += 1
-            worker = asyncio.create_task(self._worker(f"worker-{self.workers_running}"))
-            self._workers.append(worker)
-            logger.info("request_queue:worker_started", 
-                       worker_id=self.workers_running,
-                       total_workers=self.workers_running)
-    
+                   tenant=tenant,
+                   queue_size=self._queued)
+        return job
+
+    async def get_result(self, request: Union[str, RequestJob], timeout: int = 300) -> Any:
+        """Wait for a request's result, by handle or by request id"""
+        job = request if isinstance(request, RequestJob) else (
+            self._jobs.get(request) or self._recent.get(request)
+        )
+        if job is None:
+            raise ValueError(f"Request {request} not found")
+        return await job.result(timeout=timeout)
+
+    def set_tenant_weight(self, tenant: Union[str, int], weight: float) -> None:
+        """Give a tenant a larger (or smaller) share of the workers; the default is 1."""
+        self._weights[str(tenant)] = weight
+        if str(tenant) in self._tenants:
+            self._tenants[str(tenant)].weight = weight
+
+    def _tenant(self, tenant: str) -> _TenantState:
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _TenantState(self._weights.get(tenant, 1.0))
+        return state
+
+    def _effective_priority(self, job: RequestJob, now: float) -> int:
+        aged = int((now - job.enqueued_at) / self.aging_seconds) if self.aging_seconds > 0 else 0
+        return min(RequestPriority.CRITICAL.value, job.priority.value + aged)
+
+    def _shed_candidate(self) -> Optional[RequestJob]:
+        """Least important queued job: lowest effective priority, newest first."""
+        now = time.monotonic()
+        live = [job for state in self._tenants.values() for job in state.jobs]
+        if not live:
+            return None
+        return min(live, key=lambda job: (self._effective_priority(job, now), -job.seq))
+
+    def _cancel(self, job: RequestJob) -> bool:
+        if job.status is not JobStatus.QUEUED:
+            return False
+        self._finish_unstarted(job, JobStatus.CANCELLED)
+        self.stats['cancelled'] += 1
+        logger.info("request_queue:cancelled", request_id=job.request_id)
+        return True
+
+    def _finish_unstarted(
+        self, job: RequestJob, status: JobStatus, error: Optional[Exception] = None
+    ) -> None:
+        self._tenants[job.tenant].jobs.remove(job)
+        job.status = status
+        job.finished_at = time.monotonic()
+        self._queued -= 1
+        if not job.future.done():
+            if error is None:
+                job.future.cancel()
+            else:
+                job.future.set_exception(error)
+                # Nobody may be waiting on a shed job; don't log "exception never retrieved"
+                job.future.exception()
+        self._retire(job)
+        self._forget_idle_tenants()
+
+    def _retire(self, job: RequestJob) -> None:
+        self._jobs.pop(job.request_id, None)
+        self._recent[job.request_id] = job
+        while len(self._recent) > self.RECENT_JOBS:
+            self._recent.popitem(last=False)
+
+    def _pop(self) -> Optional[RequestJob]:
+        """
+        Pick the next job: highest effective priority, then the tenant with the
+        earliest virtual start, then arrival order. A linear scan is fine for a
+        queue bounded to ``max_queue_size``.
+        """
+        now = time.monotonic()
+        best_key, best_job, best_start = None, None, 0.0
+        for state in self._tenants.values():
+            if not state.jobs:
+                continue
+            start = max(self._virtual_time, state.last_finish)
+            for job in state.jobs:
+                key = (-self._effective_priority(job, now), start, job.seq)
+                if best_key is None or key < best_key:
+                    best_key, best_job, best_start = key, job, start
+        if best_job is None:
+            return None
+
+        state = self._tenants[best_job.tenant]
+        state.jobs.remove(best_job)
+        state.last_finish = best_start + 1.0 / state.weight
+        self._virtual_time = best_start
+        self._queued -= 1
+        return best_job
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Celery tasks run each job under a fresh asyncio.run(); workers of a
+            # finished loop are gone, so start a new set on this one.
+            self._loop = loop
+            self._workers = set()
+            self._wakeup = asyncio.Event()
+
+    def _scale_up(self) -> None:
+        """Start workers for queued work, up to the current concurrency limit"""
+        wanted = min(self.concurrency.current, self._queued + self._running())
+        while len(self._workers) < wanted:
+            worker_id = f"worker-{next(self._worker_ids)}"
+            worker = self._loop.create_task(self._worker(worker_id))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+            logger.info("request_queue:worker_started",
+                       worker_id=worker_id,
+                       total_workers=len(self._workers),
+                       limit=self.concurrency.current)
+
+    def _running(self) -> int:
+        return sum(state.running for state in self._tenants.values())
+
     async def _worker(self, worker_id: str):
         """Worker coroutine to process queue"""
         logger.info("request_queue:worker_starting", worker_id=worker_id)
-        
+        me = asyncio.current_task()
+        reason = "cancelled"
         try:
             while True:
-                try:
-                    # Get request from queue (wait up to 60 seconds)
-                    priority, created_at, request = await asyncio.wait_for(
-                        self.queue.get(), timeout=60
-                    )
-                    
-                    self.stats['queue_size'] = self.queue.qsize()
-                    self.active_requests[request.request_id] = request
-                    
-                    logger.info("request_queue:processing", 
-                               worker_id=worker_id,
-                               request_id=request.request_id,
-                               queue_size=self.stats['queue_size'])
-                    
-                    # Process request
+                if len(self._workers) > self.concurrency.current:
+                    reason = "over_limit"
+                    break
+                job = self._pop()
+                if job is None:
+                    self._wakeup.clear()
                     try:
-                        result = await asyncio.wait_for(
-                            request.func(*request.args, **request.kwargs),
-                            timeout=request.timeout
-                        )
-                        
-                        # Set result
-                        if request.future and not request.future.done():
-                            request.future.set_result(result)
-                        
-                        self.stats['total_processed'] += 1
-                        logger.info("request_queue:completed", 
-                                   worker_id=worker_id,
-                                   request_id=request.request_id)
-                        
-                    except Exception as e:
-                        # Set exception
-                        if request.future and not request.future.done():
-                            request.future.set_exception(e)
-                        
-                        self.stats['total_failed'] += 1
-                        logger.error("request_queue:failed", 
-                                    worker_id=worker_id,
-                                    request_id=request.request_id,
-                                    error=str(e))
-                    
-                    finally:
-                        # Mark task as done
-                        self.queue.task_done()
-                        
-                        # Cleanup active request
-                        if request.request_id in self.active_requests:
-                            del self.active_requests[request.request_id]
-                
-                except asyncio.TimeoutError:
-                    # No requests in queue for 60 seconds, keep worker alive
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.idle_timeout)
+                    except asyncio.TimeoutError:
+                        if len(self._workers) > self.min_workers:
+                            reason = "idle"
+                            break
                     continue
-                    
-        except Exception as e:
-            logger.error("request_queue:worker_error", 
-                        worker_id=worker_id, error=str(e))
+                await self._run(job, worker_id)
+                self._scale_up()
         finally:
-            self.workers_running -= 1
-            logger.info("request_queue:worker_stopped", 
+            # Leave the set right away so concurrent checks see the new size
+            self._workers.discard(me)
+            logger.info("request_queue:worker_stopped",
                        worker_id=worker_id,
-                       remaining_workers=self.workers_running)
-    
+                       reason=reason,
+                       remaining_workers=len(self._workers))
+
+    async def _run(self, job: RequestJob, worker_id: str) -> None:
+        tenant = self._tenant(job.tenant)
+        tenant.running += 1
+        job.status = JobStatus.RUNNING
+        job.started_at = time.monotonic()
+        self.queue_time.observe(job.started_at - job.enqueued_at)
+
+        logger.info("request_queue:processing",
+                   worker_id=worker_id,
+                   request_id=job.request_id,
+                   queue_size=self._queued)
+        try:
+            result = await asyncio.wait_for(
+                job.func(*job.args, **job.kwargs),
+                timeout=job.timeout
+            )
+            job.status = JobStatus.DONE
+            latency = time.monotonic() - job.started_at
+            if result is None:
+                self.concurrency.on_empty(latency)
+            else:
+                self.concurrency.on_success(latency)
+            if not job.future.done():
+                job.future.set_result(result)
+            self.stats['total_processed'] += 1
+            logger.info("request_queue:completed",
+                       worker_id=worker_id,
+                       request_id=job.request_id)
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            if is_throttle_error(e):
+                self.concurrency.on_throttle()
+            if not job.future.done():
+                job.future.set_exception(e)
+            self.stats['total_failed'] += 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.stats['timed_out'] += 1
+            logger.error("request_queue:failed",
+                        worker_id=worker_id,
+                        request_id=job.request_id,
+                        error=str(e))
+        finally:
+            tenant.running -= 1
+            job.finished_at = time.monotonic()
+            self.run_time.observe(job.finished_at - job.started_at)
+            self._retire(job)
+            self._forget_idle_tenants()
+
+    def _forget_idle_tenants(self) -> None:
+        """Drop state for tenants with nothing queued or running and no fair-share credit left."""
+        for name in [
+            name for name, state in self._tenants.items()
+            if not state.jobs and not state.running and state.last_finish <= self._virtual_time
+        ]:
+            del self._tenants[name]
+
+    def get_tenant_stats(self) -> Dict[str, dict]:
+        """Queue depth per tenant, deepest first"""
+        ranked = sorted(self._tenants.items(), key=lambda item: -len(item[1].jobs))
+        return {
+            (name or "anonymous"): {
+                "queued": len(state.jobs),
+                "running": state.running,
+                "weight": state.weight,
+            }
+            for name, state in ranked
+            if state.jobs or state.running
+        }
+
     def get_stats(self) -> dict:
         """Get queue statistics"""
         return {
             **self.stats,
-            'queue_size': self.queue.qsize(),
-            'active_requests': len(self.active_requests),
-            'workers_running': self.workers_running
+            'queue_size': self._queued,
+            'max_queue_size': self.max_queue_size,
+            'active_requests': sum(1 for job in self._jobs.values() if job.status is JobStatus.RUNNING),
+            'workers_running': self.get_active_workers(),
+            'concurrency_limit': self.concurrency.current,
+            'concurrency_increases': self.concurrency.increases,
+            'concurrency_decreases': self.concurrency.decreases,
         }
-    
+
     def get_queue_size(self) -> int:
         """Get current queue size"""
-        return self.queue.qsize()
-    
+        return self._queued
+
     def get_active_workers(self) -> int:
         """Get number of active workers"""
         return len([w for w in self._workers if not w.done()])
-    
+
     def get_failed_count(self) -> int:
-        """Get number of failed requests (approximate)"""
-        return len([result for result in self._results.values() 
-                   if hasattr(result, 'exception') and result.exception()])
-    
+        """Get number of failed requests"""
+        return self.stats['total_failed']
+
     def get_detailed_status(self) -> dict:
         """Get detailed status for monitoring"""
         return {
-            "queue_size": self.get_queue_size(),
-            "active_workers": self.get_active_workers(),
-            "total_workers": len(self._workers),
-            "completed_requests": len(self._results),
-            "failed_requests": self.get_failed_count()
+            **self.get_stats(),
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "completed_requests": self.stats['total_processed'],
+            "failed_requests": self.get_failed_count(),
+            "queue_time_seconds": self.queue_time.snapshot(),
+            "run_time_seconds": self.run_time.snapshot(),
+            "tenants": self.get_tenant_stats(),
         }
 
 # Global request queue instance
-request_queue = RequestQueue(max_workers=3)
+request_queue = RequestQueue(
+    max_workers=settings.REQUEST_QUEUE_MAX_WORKERS,
+    max_queue_size=settings.REQUEST_QUEUE_MAX_SIZE,
+    overflow=settings.REQUEST_QUEUE_OVERFLOW,
+    aging_seconds=settings.REQUEST_QUEUE_AGING_SECONDS,
+    min_workers=settings.REQUEST_QUEUE_MIN_WORKERS,
+    initial_workers=settings.REQUEST_QUEUE_INITIAL_WORKERS,
+    idle_timeout=settings.REQUEST_QUEUE_IDLE_TIMEOUT_SECONDS,
+    latency_target=settings.REQUEST_QUEUE_LATENCY_TARGET_SECONDS,
+)
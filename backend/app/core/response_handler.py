@@ -1,13 +1,13 @@
 # backend/app/core/response_handler.py
 
-import json
 from typing import Any, Optional
 from fastapi import Response
 from fastapi.responses import JSONResponse, StreamingResponse
 import structlog
-import gzip
 import io
 
+from app.core.responses import dumps
+
 logger = structlog.get_logger(__name__)
 
 class SafeResponseHandler:
@@ -17,15 +17,13 @@ class SafeResponseHandler:
     def create_json_response(
         data: Any, 
         status_code: int = 200,
-        compress: bool = True,
         max_size_mb: float = 10.0
     ) -> Response:
         """Create JSON response with proper content handling"""
         
         try:
             # Serialize data
-            json_str = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-            json_bytes = json_str.encode('utf-8')
+            json_bytes = dumps(data)
             
             # Check size
             size_mb = len(json_bytes) / (1024 * 1024)
@@ -35,26 +33,11 @@ class SafeResponseHandler:
                 # Truncate or paginate large responses
                 return SafeResponseHandler._handle_large_response(data, status_code)
             
+            # Compression is negotiated per request by CompressionMiddleware
             headers = {
                 'Content-Type': 'application/json; charset=utf-8'
             }
             
-            # Compress if beneficial and requested
-            if compress and len(json_bytes) > 1024:  # Only compress if > 1KB
-                try:
-                    compressed = gzip.compress(json_bytes)
-                    if len(compressed) < len(json_bytes) * 0.9:  # Only if 10%+ reduction
-                        headers['Content-Encoding'] = 'gzip'
-                        headers['Content-Length'] = str(len(compressed))
-                        return Response(
-                            content=compressed,
-                            status_code=status_code,
-                            headers=headers
-                        )
-                except Exception as e:
-                    logger.warning("response_handler:compression_failed", error=str(e))
-            
-            # Return uncompressed
             headers['Content-Length'] = str(len(json_bytes))
             return Response(
                 content=json_bytes,
@@ -83,7 +66,7 @@ class SafeResponseHandler:
                 "message": "Response was truncated due to size. Use pagination for full results."
             }
             return SafeResponseHandler.create_json_response(
-                truncated_data, status_code, compress=True, max_size_mb=float('inf')
+                truncated_data, status_code, max_size_mb=float('inf')
             )
         
         # For other types, return error
@@ -114,7 +97,7 @@ class SafeResponseHandler:
                     elif isinstance(item, bytes):
                         chunk = item
                     else:
-                        chunk = json.dumps(item).encode('utf-8')
+                        chunk = dumps(item)
                     
                     buffer.write(chunk)
                     
@@ -131,10 +114,10 @@ class SafeResponseHandler:
                     
             except Exception as e:
                 logger.error("response_handler:streaming_error", error=str(e))
-                error_response = json.dumps({
+                error_response = dumps({
                     "error": "Streaming error",
                     "code": "STREAMING_ERROR"
-                }).encode('utf-8')
+                })
                 yield error_response
         
         return StreamingResponse(
@@ -170,44 +153,3 @@ class SafeResponseHandler:
             status_code=status_code,
             headers={'Content-Type': 'application/json; charset=utf-8'}
         )
-
-class ResponseHandlerMiddleware:
-    """Middleware to handle response content-length issues"""
-    
-    def __init__(self, app):
-        self.app = app
-    
-    async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
-            return
-        
-        # Wrap send to handle content-length
-        async def wrapped_send(message):
-            if message["type"] == "http.response.body":
-                # Calculate and set proper content-length
-                body = message.get("body", b"")
-                if body:
-                    message["body"] = body
-                    # Let ASGI server handle content-length
-                    if "more_body" not in message:
-                        message["more_body"] = False
-            
-            await send(message)
-        
-        try:
-            await self.app(scope, receive, wrapped_send)
-        except Exception as e:
-            logger.error("response_middleware_error", error=str(e))
-            # Send error response
-            await send({
-                "type": "http.response.start",
-                "status": 500,
-                "headers": [[b"content-type", b"application/json"]],
-            })
-            error_body = json.dumps({"detail": "Internal server error"}).encode()
-            await send({
-                "type": "http.response.body",
-                "body": error_body,
-                "more_body": False,
-            })
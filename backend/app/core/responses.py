@@ -0,0 +1,59 @@
+# backend/app/core/responses.py
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, request_response
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # orjson handles dicts, lists, datetimes, enums (e.g. SenderType), UUIDs and
+    # dataclasses natively; everything else gets FastAPI's usual encoding.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize ``content`` to compact UTF-8 JSON bytes."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    ``If-None-Match`` check. It uses weak comparison (RFC 9110), so an ETag that
+    CompressionMiddleware marked ``W/`` still matches the strong original.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route class for the API routers: routes without a response model render
+    with ORJSONResponse. Routes with one keep FastAPI's default, where Pydantic
+    serializes the validated model straight to JSON bytes; that is faster than
+    dumping the model to Python objects for orjson.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, endpoint, **kwargs)
+        if self.response_model is None and isinstance(self.response_class, DefaultPlaceholder):
+            self.response_class = ORJSONResponse
+            self.app = request_response(self.get_route_handler())
+
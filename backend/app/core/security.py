@@ -1,18 +1,27 @@
+import functools
 from datetime import datetime, timedelta
 from typing import Any, Union
-from passlib.context import CryptContext
 from jose import jwt
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@functools.lru_cache(maxsize=None)
+def _pwd_context():
+    # Login and registration hash on the password hasher's pool; passlib is
+    # only loaded here for synchronous callers.
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+    )
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def create_access_token(
@@ -0,0 +1,130 @@
+# backend/app/core/sentry.py
+
+import datetime
+import random
+from typing import Any, Dict, Mapping, Optional
+
+# Trace statuses Sentry derives from 5xx responses and unhandled exceptions;
+# 4xx statuses (not_found, unauthenticated, ...) are not errors for sampling.
+SERVER_ERROR_STATUSES = frozenset({
+    "internal_error",
+    "unknown",
+    "unknown_error",
+    "unimplemented",
+    "unavailable",
+    "deadline_exceeded",
+    "data_loss",
+    "aborted",
+})
+
+
+class RouteSampler:
+    """
+    Sentry trace and profile sampling by route.
+
+    ``route_rates`` maps path (or Celery task name) prefixes to sample rates;
+    the longest matching prefix wins and anything else uses ``default_rate``.
+    The route rate is a head-sampling decision made when the request starts,
+    so unsampled requests carry no tracing overhead. Routes at 0 are never
+    traced, and ``profiles_rate`` of the traced requests are also profiled.
+
+    With ``keep_slow`` (the default), routes sampled at ``tail_min_rate`` or
+    more are traced in full instead. ``before_send_transaction`` then keeps
+    errors, transactions slower than ``slow_seconds`` and profiled
+    transactions, and sends the rest at the route's rate. Routes below
+    ``tail_min_rate`` (e.g. the home feed poll) stay head-sampled, so their
+    slow or failed requests are still dropped when the coin flip misses:
+    they are frequent and cheap, and tracing every one of them would cost
+    more than the few slow ones are worth.
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 0.1,
+        route_rates: Optional[Mapping[str, float]] = None,
+        profiles_rate: float = 0.1,
+        slow_seconds: float = 2.0,
+        keep_slow: bool = True,
+        tail_min_rate: float = 0.25,
+    ):
+        self.default_rate = default_rate
+        self.routes = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.profiles_rate = profiles_rate
+        self.slow_seconds = slow_seconds
+        self.keep_slow = keep_slow
+        self.tail_min_rate = tail_min_rate
+
+    def rate_for(self, name: str) -> float:
+        for prefix, rate in self.routes:
+            if name.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def _tail_sampled(self, rate: float) -> bool:
+        return self.keep_slow and rate > 0 and rate >= self.tail_min_rate
+
+    def traces_sampler(self, sampling_context: Dict[str, Any]) -> float:
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)  # Keep distributed traces whole
+        rate = self.rate_for(_name(sampling_context))
+        if self._tail_sampled(rate):
+            return 1.0  # Decided in before_send_transaction, once the outcome is known
+        return rate
+
+    def profiles_sampler(self, sampling_context: Dict[str, Any]) -> float:
+        # Sentry applies this to transactions that are already traced
+        rate = self.rate_for(_name(sampling_context))
+        if rate <= 0:
+            return 0.0
+        if self._tail_sampled(rate):
+            # Everything is traced; profile the route's share, and
+            # before_send_transaction keeps every profiled transaction
+            return rate * self.profiles_rate
+        return self.profiles_rate
+
+    def before_send_transaction(self, event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rate = self.rate_for(event.get("transaction") or "")
+        if not self._tail_sampled(rate):
+            return event  # Head-sampled already
+        if event.get("profile") is not None:
+            return event
+        status = event.get("contexts", {}).get("trace", {}).get("status")
+        if status in SERVER_ERROR_STATUSES:
+            return event
+        duration = _duration(event)
+        if duration is not None and duration >= self.slow_seconds:
+            return event
+        if random.random() < rate:
+            return event
+        return None
+
+
+def _name(sampling_context: Dict[str, Any]) -> str:
+    scope = sampling_context.get("asgi_scope")
+    if scope and scope.get("path"):
+        return scope["path"]
+    return (sampling_context.get("transaction_context") or {}).get("name") or ""
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _duration(event: Dict[str, Any]) -> Optional[float]:
+    start = _timestamp(event.get("start_timestamp"))
+    end = _timestamp(event.get("timestamp"))
+    if start is None or end is None:
+        return None
+    return end - start
@@ -0,0 +1,65 @@
+# backend/app/core/user_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class UserCache:
+    """
+    Bounded in-process LRU of user rows (column dicts) with a short TTL.
+
+    Invalidation is per process, so the TTL bounds how long another worker
+    can keep serving a user that was changed or deleted elsewhere.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[int, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a load that raced one is not stored
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.stats["hits"] += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[user_id]
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, user_id: int, row: Dict[str, Any], generation: int) -> None:
+        """Store ``row`` unless an invalidation happened since ``generation`` was read."""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[user_id] = (row, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(user_id, None)
+            self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._entries), "ttl_seconds": self.ttl_seconds}
@@ -5,6 +5,9 @@ from .crud_chat import chat_message, CRUDChatMessage
 from .crud_motivational_quote import motivational_quote, CRUDMotivationalQuote
 from .crud_user_profile import user_profile, CRUDUserProfile
 from .crud_music_track import music_track, CRUDMusicTrack
+from .crud_ready_track import ready_track, CRUDReadyTrack
+from .crud_radio_station import radio_station, CRUDRadioStation
+from .crud_content_version import content_version, CRUDContentVersion
 
 __all__ = [
     "user",
@@ -21,4 +24,10 @@ __all__ = [
     "CRUDUserProfile",
     "music_track",
     "CRUDMusicTrack",
+    "ready_track",
+    "CRUDReadyTrack",
+    "radio_station",
+    "CRUDRadioStation",
+    "content_version",
+    "CRUDContentVersion",
 ]
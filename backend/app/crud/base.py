@@ -1,7 +1,8 @@
 # backend/app/crud/base.py
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.db.base_class import Base
 
@@ -22,6 +23,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    def iter_by_owner(
+        self, db: Session, *, owner_id: int, batch_size: int = 500
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        All of an owner's rows as column dicts, oldest first, ``batch_size``
+        at a time. Rows are read from a server-side cursor where the driver
+        supports one, so memory stays flat however many rows there are.
+        """
+        table = self.model.__table__
+        result = db.execute(
+            select(table)
+            .where(table.c.owner_id == owner_id)
+            .order_by(table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for rows in result.mappings().partitions():
+            yield [dict(row) for row in rows]
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         # Konversi Pydantic model ke dict
         obj_in_data = obj_in.model_dump()
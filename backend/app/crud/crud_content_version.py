@@ -0,0 +1,94 @@
+# backend/app/crud/crud_content_version.py
+
+import datetime
+import hashlib
+import itertools
+from typing import Iterable, Optional
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from app.models.article import Article
+from app.models.content_version import ContentVersion
+from app.models.motivational_quote import MotivationalQuote
+from app.models.music_track import MusicTrack
+
+
+def music_version(owner_id: Optional[int]) -> str:
+    """Version name for one user's tracks; unowned (shared) tracks use ``music``."""
+    return "music" if owner_id is None else f"music:{owner_id}"
+
+
+# Versions invalidated by a write to each model, given the written row
+TRACKED_MODELS = {
+    MusicTrack: lambda track: (music_version(track.owner_id),),
+    MotivationalQuote: lambda quote: ("quotes",),
+    Article: lambda article: ("articles",),
+}
+
+
+_UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class CRUDContentVersion(CRUDBase[ContentVersion, None, None]):
+    def get_etag(self, db: Session, *names: str) -> str:
+        """
+        Strong ETag over the named versions, fetched in one query; it changes
+        whenever a tracked write to any of them is committed.
+        """
+        rows = db.execute(
+            select(self.model.name, self.model.version, self.model.updated_at)
+            .where(self.model.name.in_(names))
+        ).all()
+        # The timestamps keep tags unique if the table is ever recreated
+        found = {
+            row.name: f"{row.version}.{int(row.updated_at.timestamp() * 1_000_000)}"
+            for row in rows
+        }
+        key = "|".join(f"{name}={found.get(name, 0)}" for name in sorted(names))
+        return '"' + hashlib.blake2b(key.encode(), digest_size=12).hexdigest() + '"'
+
+    def bump(self, db: Session, names: Iterable[str]) -> None:
+        """Increment the counters in the caller's transaction, creating missing rows."""
+        connection = db.connection()
+        now = datetime.datetime.utcnow()
+        upsert = _UPSERTS.get(connection.dialect.name)
+        for name in sorted(names):  # Fixed order: concurrent writers can't deadlock
+            if upsert is not None:
+                # Per-user names appear on first write; two first writers
+                # must not collide on the primary key.
+                connection.execute(
+                    upsert(self.model)
+                    .values(name=name, version=1, updated_at=now)
+                    .on_conflict_do_update(
+                        index_elements=[self.model.name],
+                        set_={"version": self.model.version + 1, "updated_at": now},
+                    )
+                )
+                continue
+            result = connection.execute(
+                update(self.model)
+                .where(self.model.name == name)
+                .values(version=self.model.version + 1, updated_at=now)
+            )
+            if result.rowcount == 0:
+                connection.execute(insert(self.model).values(name=name, version=1, updated_at=now))
+
+
+content_version = CRUDContentVersion(ContentVersion)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_versions_on_write(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe what this flush wrote
+    names = set()
+    for obj in itertools.chain(session.new, session.deleted):
+        if type(obj) in TRACKED_MODELS:
+            names.update(TRACKED_MODELS[type(obj)](obj))
+    for obj in session.dirty:
+        if type(obj) in TRACKED_MODELS and session.is_modified(obj, include_collections=False):
+            names.update(TRACKED_MODELS[type(obj)](obj))
+    if names:
+        content_version.bump(session, names)
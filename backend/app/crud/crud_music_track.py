@@ -1,7 +1,10 @@
+import datetime
+
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from .base import CRUDBase
+from .crud_content_version import content_version, music_version
 from app.models.music_track import MusicTrack
 from app.schemas.audio import AudioTrackCreate, AudioTrackUpdate
 
@@ -15,13 +18,19 @@ class CRUDMusicTrack(CRUDBase[MusicTrack, AudioTrackCreate, AudioTrackUpdate]):
         db.refresh(db_obj)
         return db_obj
 
-    def get_latest(self, db: Session) -> MusicTrack | None:
-        return db.query(self.model).order_by(desc(self.model.created_at)).first()
+    def _owned_by(self, db: Session, owner_id: int | None):
+        # owner_id None selects the shared tracks
+        return db.query(self.model).filter(
+            self.model.owner_id.is_(None) if owner_id is None else self.model.owner_id == owner_id
+        )
+
+    def get_latest(self, db: Session, *, owner_id: int | None = None) -> MusicTrack | None:
+        return self._owned_by(db, owner_id).order_by(desc(self.model.created_at)).first()
 
-    def get_latest_done(self, db: Session) -> MusicTrack | None:
+    def get_latest_done(self, db: Session, *, owner_id: int | None = None) -> MusicTrack | None:
         """Get the latest music track with status 'done' and valid fields."""
         return (
-            db.query(self.model)
+            self._owned_by(db, owner_id)
             .filter(self.model.status == 'done')
             .filter(self.model.title.isnot(None))
             .filter(self.model.youtube_id.isnot(None))
@@ -30,5 +39,33 @@ class CRUDMusicTrack(CRUDBase[MusicTrack, AudioTrackCreate, AudioTrackUpdate]):
             .first()
         )
 
+    def delete_failed(
+        self, db: Session, *, keep_latest: int, older_than: datetime.datetime
+    ) -> int:
+        """
+        Delete failed tracks created before ``older_than`` in one statement,
+        always keeping the ``keep_latest`` newest failed tracks. Returns the
+        number of rows removed.
+        """
+        newest_failed = (
+            db.query(self.model.id)
+            .filter(self.model.status == "failed")
+            .order_by(desc(self.model.created_at))
+            .limit(keep_latest)
+        )
+        doomed = (
+            db.query(self.model)
+            .filter(self.model.status == "failed")
+            .filter(self.model.created_at < older_than)
+            .filter(self.model.id.not_in(newest_failed.scalar_subquery()))
+        )
+        owners = [owner_id for (owner_id,) in doomed.with_entities(self.model.owner_id).distinct()]
+        removed = doomed.delete(synchronize_session=False)
+        if removed:
+            # Bulk deletes skip the flush hook
+            content_version.bump(db, {music_version(owner_id) for owner_id in owners})
+        db.commit()
+        return removed
+
 
 music_track = CRUDMusicTrack(MusicTrack)
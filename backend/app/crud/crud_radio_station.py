@@ -0,0 +1,29 @@
+# backend/app/crud/crud_radio_station.py
+
+import datetime
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from app.models.radio_station import RadioStation
+
+
+class CRUDRadioStation(CRUDBase[RadioStation, None, None]):
+    def get_by_category(self, db: Session, *, category: str) -> RadioStation | None:
+        return db.query(self.model).filter(self.model.category == category).first()
+
+    def upsert(self, db: Session, *, category: str, tracks: List[dict]) -> RadioStation:
+        """Replace the stored playlist for ``category``, creating the row on first use."""
+        station = self.get_by_category(db, category=category)
+        if station is None:
+            station = RadioStation(category=category)
+            db.add(station)
+        station.tracks = tracks
+        station.generated_at = datetime.datetime.utcnow()
+        db.commit()
+        db.refresh(station)
+        return station
+
+
+radio_station = CRUDRadioStation(RadioStation)
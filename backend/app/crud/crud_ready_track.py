@@ -0,0 +1,83 @@
+# backend/app/crud/crud_ready_track.py
+
+import datetime
+from typing import Dict, List
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from app.models.music_track import MusicTrack
+from app.models.ready_track import ReadyTrack
+
+
+class CRUDReadyTrack(CRUDBase[ReadyTrack, None, None]):
+    def create_for_mood(
+        self, db: Session, *, mood: str, title: str, artist: str | None,
+        youtube_id: str, stream_url: str
+    ) -> ReadyTrack:
+        db_obj = ReadyTrack(
+            mood=mood, title=title, artist=artist,
+            youtube_id=youtube_id, stream_url=stream_url,
+        )
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def count_by_mood(self, db: Session, *, fresh_after: datetime.datetime) -> Dict[str, int]:
+        rows = (
+            db.query(self.model.mood, func.count(self.model.id))
+            .filter(self.model.created_at > fresh_after)
+            .group_by(self.model.mood)
+            .all()
+        )
+        return {mood: count for mood, count in rows}
+
+    def youtube_ids_for_mood(self, db: Session, *, mood: str) -> List[str]:
+        rows = db.query(self.model.youtube_id).filter(self.model.mood == mood).all()
+        return [youtube_id for (youtube_id,) in rows]
+
+    def delete_stale(self, db: Session, *, older_than: datetime.datetime) -> int:
+        removed = (
+            db.query(self.model)
+            .filter(self.model.created_at <= older_than)
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return removed
+
+    def assign_to_feed(
+        self, db: Session, *, mood: str, fresh_after: datetime.datetime,
+        owner_id: int | None = None,
+    ) -> MusicTrack | None:
+        """
+        Take the oldest fresh pooled track for ``mood`` and publish it as a
+        finished MusicTrack of ``owner_id``, in one transaction.
+        """
+        ready = (
+            db.query(self.model)
+            .filter(self.model.mood == mood, self.model.created_at > fresh_after)
+            .order_by(self.model.created_at)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if ready is None:
+            return None
+
+        track = MusicTrack(
+            owner_id=owner_id,
+            title=ready.title,
+            artist=ready.artist,
+            youtube_id=ready.youtube_id,
+            stream_url=ready.stream_url,
+            status="done",
+        )
+        db.add(track)
+        db.delete(ready)
+        db.commit()
+        db.refresh(track)
+        return track
+
+
+ready_track = CRUDReadyTrack(ReadyTrack)
@@ -1,24 +1,81 @@
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Union
+
+from sqlalchemy.orm import Session, make_transient_to_detached
 from .base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.core.config import settings
 from app.core.security import get_password_hash
+from app.core.user_cache import UserCache
+
+# Columns kept in the cache; the password hash is loaded on access instead
+_CACHED_COLUMNS = tuple(
+    column.key for column in User.__table__.columns if column.key != "hashed_password"
+)
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+    def __init__(self, model, cache: UserCache):
+        super().__init__(model)
+        self.cache = cache
+
     def get_by_email(self, db: Session, *, email: str) -> User | None:
         return db.query(User).filter(User.email == email).first()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    def get_cached(self, db: Session, id: int | None) -> User | None:
+        """
+        ``get`` through the user cache. A hit is attached to ``db`` without a
+        query, so lazy loads and updates work as on a freshly loaded user.
+        """
+        if id is None or not self.cache.enabled:
+            return self.get(db, id=id)
+        row = self.cache.get(id)
+        if row is None:
+            generation = self.cache.generation
+            user = self.get(db, id=id)
+            if user is not None:
+                self.cache.set(id, {key: getattr(user, key) for key in _CACHED_COLUMNS}, generation)
+            return user
+
+        key = db.identity_key(User, id)
+        if key in db.identity_map:
+            return db.identity_map[key]
+        user = User(**row)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    def create(
+        self, db: Session, *, obj_in: UserCreate, hashed_password: str | None = None
+    ) -> User:
+        """Pass ``hashed_password`` when it was already hashed off-thread."""
         db_obj = User(
             email=obj_in.email,
             username=obj_in.username,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password or get_password_hash(obj_in.password),
         )
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> User:
+        user = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        self.cache.invalidate(user.id)
+        return user
+
+    def remove(self, db: Session, *, id: int) -> User | None:
+        user = super().remove(db, id=id)
+        self.cache.invalidate(id)
+        return user
+
 
-user = CRUDUser(User)
+user = CRUDUser(
+    User,
+    UserCache(
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+        max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ),
+)
@@ -0,0 +1,76 @@
+# backend/app/db/pool.py
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.core.metrics import Histogram
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long checkouts wait and how full it gets.
+
+    The wait covers queueing for a free connection and opening a new one
+    under ``pool_size + max_overflow``. A long wait or any ``timeouts`` means
+    the pool is too small for the worker's concurrency. A peak utilization
+    well below 1 means it can shrink, leaving Postgres connections for other
+    workers. ``engine.dispose()`` swaps in a fresh pool, and with it fresh
+    metrics.
+    """
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.checkout_wait = Histogram("db_pool_checkout_wait_seconds")
+        self.peak_checked_out = 0
+        self.stats = {"checkouts": 0, "timeouts": 0}
+        self._metrics_lock = threading.Lock()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.stats["timeouts"] += 1
+            raise
+        wait = time.perf_counter() - start
+        checked_out = self.checkedout()
+        with self._metrics_lock:
+            self.checkout_wait.observe(wait)
+            self.stats["checkouts"] += 1
+            if checked_out > self.peak_checked_out:
+                self.peak_checked_out = checked_out
+        return connection
+
+    @property
+    def capacity(self) -> int | None:
+        """Most connections this pool opens at once; None when overflow is unlimited."""
+        return None if self.max_overflow < 0 else self.size() + self.max_overflow
+
+    def get_stats(self) -> Dict[str, Any]:
+        capacity = self.capacity
+        checked_out = self.checkedout()
+        return {
+            **self.stats,
+            "pool_size": self.size(),
+            "max_overflow": self.max_overflow,
+            "capacity": capacity,
+            "checked_out": checked_out,
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "peak_checked_out": self.peak_checked_out,
+            "utilization": round(checked_out / capacity, 3) if capacity else None,
+            "peak_utilization": round(self.peak_checked_out / capacity, 3) if capacity else None,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+        }
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.get_stats()
+    return {"pool": type(pool).__name__}  # e.g. SQLite in development
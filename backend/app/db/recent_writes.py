@@ -0,0 +1,152 @@
+# backend/app/db/recent_writes.py
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+log = structlog.get_logger(__name__)
+
+
+class RecentWrites:
+    """
+    Users who committed a write in the last ``window_seconds``; their reads
+    go to the primary until the replica has caught up (read-your-writes).
+
+    Marks are kept per process, and in Redis when one is configured so a
+    user's next request sees its own write whichever worker serves it. If
+    Redis fails, the user is assumed to have written, so the read goes to
+    the primary. Writes are only tracked while ``enabled``, i.e. when a
+    replica is configured.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 5.0,
+        enabled: bool = True,
+        redis_client=None,
+        prefix: str = "recent-write:",
+        max_entries: int = 10000,
+    ):
+        self.window_seconds = window_seconds
+        self.enabled = enabled
+        self.redis = redis_client
+        self.prefix = prefix
+        self.max_entries = max(1, max_entries)
+        self._local: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"marked": 0, "primary_reads": 0, "errors": 0}
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RecentWrites":
+        import redis
+
+        return cls(redis_client=redis.Redis.from_url(url, socket_timeout=1), **kwargs)
+
+    def mark(self, user_ids: Iterable[int]) -> None:
+        user_ids = set(user_ids)
+        if not user_ids:
+            return
+        expires_at = time.monotonic() + self.window_seconds
+        with self._lock:
+            for user_id in user_ids:
+                self._local[user_id] = expires_at
+                self._local.move_to_end(user_id)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+            self.stats["marked"] += len(user_ids)
+        if self.redis is None:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipe.set(f"{self.prefix}{user_id}", 1, px=int(self.window_seconds * 1000))
+            pipe.execute()
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("recent_writes:mark_failed", error=str(e))
+
+    def wrote_recently(self, user_id: Optional[int]) -> bool:
+        if user_id is None:
+            return False
+        recent = self._wrote_recently(user_id)
+        if recent:
+            self.stats["primary_reads"] += 1
+        return recent
+
+    def _wrote_recently(self, user_id: int) -> bool:
+        with self._lock:
+            expires_at = self._local.get(user_id)
+            if expires_at is not None:
+                if expires_at > time.monotonic():
+                    return True
+                del self._local[user_id]
+        if self.redis is None:
+            return False
+        try:
+            return bool(self.redis.exists(f"{self.prefix}{user_id}"))
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("recent_writes:check_failed", error=str(e))
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "window_seconds": self.window_seconds,
+            "backend": "redis" if self.redis is not None else "local",
+        }
+
+
+def _build_recent_writes() -> RecentWrites:
+    kwargs = {
+        "window_seconds": settings.READ_YOUR_WRITES_SECONDS,
+        "enabled": bool(settings.DATABASE_REPLICA_URL),
+    }
+    if settings.READ_YOUR_WRITES_REDIS_URL:
+        return RecentWrites.from_url(settings.READ_YOUR_WRITES_REDIS_URL, **kwargs)
+    return RecentWrites(**kwargs)
+
+
+# Global tracker instance
+recent_writes = _build_recent_writes()
+
+_WRITERS_KEY = "recent_writes:user_ids"
+
+
+def _writer_id(obj) -> Optional[int]:
+    # Journals, chats, tracks and profiles belong to a user via owner_id/user_id
+    if getattr(obj, "__tablename__", None) == "users":
+        return obj.id
+    return getattr(obj, "owner_id", None) or getattr(obj, "user_id", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_writers(session: Session, flush_context) -> None:
+    if not recent_writes.enabled:
+        return
+    writers = session.info.setdefault(_WRITERS_KEY, set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        user_id = _writer_id(obj)
+        if user_id is not None:
+            writers.add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_writers(session: Session) -> None:
+    writers = session.info.pop(_WRITERS_KEY, None)
+    if writers:
+        recent_writes.mark(writers)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_writers(session: Session) -> None:
+    session.info.pop(_WRITERS_KEY, None)
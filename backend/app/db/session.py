@@ -1,8 +1,12 @@
 # app/db/session.py - Versi Revisi Final
 
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db import recent_writes  # noqa: F401 - registers the read-your-writes listeners
+from app.db.pool import InstrumentedQueuePool, pool_stats
 
 # --- Revisi Kritis di Sini ---
 # Kita akan membuat argumen koneksi menjadi kondisional.
@@ -11,13 +15,52 @@ from app.core.config import settings
 # produksi (PostgreSQL) tanpa perlu diubah.
 
 connect_args = {}
+pool_args: Dict[str, Any] = {}
 # Periksa apakah URL database adalah untuk SQLite
 if settings.DATABASE_URL and settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+else:
+    # Ukuran pool per proses: total koneksi = worker x (size + overflow)
+    pool_args = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
 
 # Buat engine dengan argumen yang sudah disesuaikan
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, **pool_args)
 # --- Akhir Revisi ---
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Replika baca: pool terpisah dengan ukuran yang sama; tanpa replika
+# semua bacaan tetap lewat engine primary.
+if settings.DATABASE_REPLICA_URL:
+    read_engine = create_engine(settings.DATABASE_REPLICA_URL, connect_args=connect_args, **pool_args)
+else:
+    read_engine = engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+def has_read_replica() -> bool:
+    return read_engine is not engine
+
+
+def dispose_engine_after_fork() -> None:
+    """
+    Give a forked worker its own connection pools. Connections the parent
+    opened are dropped without being closed, since the parent still owns
+    them.
+    """
+    engine.dispose(close=False)
+    if has_read_replica():
+        read_engine.dispose(close=False)
+
+
+def get_pool_stats(bind=None) -> Dict[str, Any]:
+    return pool_stats((bind or engine).pool)
@@ -1,5 +1,5 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import Callable, Generator, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import ValidationError
@@ -7,9 +7,14 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.core.config import settings
+from app.core.responses import etag_matches
+from app.db import session as db_session
+from app.db.recent_writes import recent_writes
 from app.db.session import SessionLocal
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+# Same scheme without the 401; only used to route reads (get_read_db)
+optional_oauth2 = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
 def get_db() -> Generator:
@@ -20,6 +25,50 @@ def get_db() -> Generator:
         db.close()
 
 
+def _token_user_id(token: Optional[str]) -> Optional[int]:
+    # Unverified on purpose: this only picks a database, get_current_user
+    # still authenticates the request.
+    if not token:
+        return None
+    try:
+        return int(jwt.get_unverified_claims(token)["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_optional_user_id(token: Optional[str] = Depends(optional_oauth2)) -> Optional[int]:
+    """
+    Id from a valid access token, or None for anonymous requests. For public
+    endpoints that only need to know who is asking (e.g. for fair queuing);
+    the user isn't loaded.
+    """
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        return schemas.TokenPayload(**payload).sub
+    except (JWTError, ValidationError):
+        return None
+
+
+def get_read_db(
+    primary: Session = Depends(get_db), token: Optional[str] = Depends(optional_oauth2)
+) -> Generator:
+    """
+    Session for read-only endpoints: the read replica when one is configured,
+    except for users who wrote in the last ``READ_YOUR_WRITES_SECONDS``, who
+    read from the primary so they see their own changes.
+    """
+    if not db_session.has_read_replica() or recent_writes.wrote_recently(_token_user_id(token)):
+        yield primary
+        return
+    db = db_session.ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_current_user(
     db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
 ) -> models.User:
@@ -33,7 +82,31 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = crud.user.get(db, id=token_data.sub)
+    user = crud.user.get_cached(db, id=token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
+
+
+def check_etag(request: Request, response: Response, etag: str) -> str:
+    """Answer a matching ``If-None-Match`` with 304; otherwise tag the response."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return etag
+
+
+def conditional_etag(*names: str) -> Callable[..., str]:
+    """
+    Dependency for GETs cached under the ``crud.content_version`` ``names``:
+    sets the ETag and answers a matching ``If-None-Match`` with 304 before
+    the endpoint queries or serializes anything. Reads the versions through
+    ``get_read_db``, the same session the endpoint should use, so the tag
+    never runs ahead of the body.
+    """
+
+    def check(request: Request, response: Response, db: Session = Depends(get_read_db)) -> str:
+        return check_etag(request, response, crud.content_version.get_etag(db, *names))
+
+    return check
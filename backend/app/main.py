@@ -9,8 +9,11 @@ from fastapi.middleware.cors import CORSMiddleware
 
 
 from app.api.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-import sentry_sdk
+from app.core.sentry import RouteSampler
+from app.services.ytdlp_worker_pool import ytdlp_worker_pool
+from app.core.password_hasher import password_hasher
 import structlog
 
 # --- Setup Logging ---
@@ -25,10 +28,22 @@ logger = structlog.get_logger()
 SENTRY_DSN = os.getenv("SENTRY_DSN", None)
 
 if SENTRY_DSN:
+    import sentry_sdk  # Only loaded when Sentry is configured
+
+    # Sampling per route: rendah untuk polling, tinggi untuk chat/musik
+    sentry_sampler = RouteSampler(
+        default_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+        route_rates=settings.SENTRY_TRACES_ROUTE_RATES,
+        profiles_rate=settings.SENTRY_PROFILES_SAMPLE_RATE,
+        slow_seconds=settings.SENTRY_SLOW_TRANSACTION_SECONDS,
+        keep_slow=settings.SENTRY_KEEP_SLOW_TRANSACTIONS,
+        tail_min_rate=settings.SENTRY_KEEP_SLOW_MIN_RATE,
+    )
     sentry_sdk.init(
         dsn=SENTRY_DSN,
-        traces_sample_rate=1.0,  # Untuk performance monitoring
-        profiles_sample_rate=1.0,  # Untuk profiling detail
+        traces_sampler=sentry_sampler.traces_sampler,
+        profiles_sampler=sentry_sampler.profiles_sampler,
+        before_send_transaction=sentry_sampler.before_send_transaction,
         environment=os.getenv("ENVIRONMENT", "development"),
     )
     logger.info(
@@ -42,16 +57,21 @@ async def lifespan(app: FastAPI):
     # Logika migrasi telah dipindahkan ke build.sh
     logger.info("Application startup...")
     yield
+    ytdlp_worker_pool.shutdown()
+    password_hasher.shutdown()
     logger.info("Application shutdown complete.")
 
 
 # --- Inisialisasi FastAPI App ---
 app = FastAPI(title="Dear Diary API", lifespan=lifespan)
 
-# Add response handling middleware to prevent Content-Length mismatch
-from app.core.response_handler import ResponseHandlerMiddleware
-
-app.add_middleware(ResponseHandlerMiddleware)
+# --- Kompresi respons (gzip/br/zstd sesuai Accept-Encoding) ---
+if settings.ENABLE_COMPRESSION:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+    )
 
 # --- Setup CORS ---
 allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "")
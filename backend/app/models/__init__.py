@@ -5,6 +5,9 @@ from .journal import Journal
 from .article import Article
 from .motivational_quote import MotivationalQuote
 from .music_track import MusicTrack
+from .ready_track import ReadyTrack
+from .radio_station import RadioStation
+from .content_version import ContentVersion
 
 __all__ = [
     "User",
@@ -14,4 +17,7 @@ __all__ = [
     "Article",
     "MotivationalQuote",
     "MusicTrack",
+    "ReadyTrack",
+    "RadioStation",
+    "ContentVersion",
 ]
@@ -0,0 +1,13 @@
+# backend/app/models/content_version.py
+
+from sqlalchemy import Column, Integer, String, DateTime
+import datetime
+from app.db.base_class import Base
+
+
+class ContentVersion(Base):
+    """Write counter for a cached resource (e.g. the home feed), bumped on every change."""
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
@@ -1,11 +1,18 @@
 # backend/app/models/music_track.py
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 import datetime
 from app.db.base_class import Base
 
 class MusicTrack(Base):
+    __table_args__ = (
+        # Per-user feed lookup: newest track of one owner
+        Index("ix_musictracks_owner_id_created_at", "owner_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    # Pemilik track; NULL = track bersama (mis. dari job terjadwal global)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     title = Column(String)
     youtube_id = Column(String)
     artist = Column(String)
@@ -0,0 +1,14 @@
+# backend/app/models/radio_station.py
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+import datetime
+from app.db.base_class import Base
+
+
+class RadioStation(Base):
+    """Precomputed playlist for one radio category, refreshed by Celery beat."""
+
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String, unique=True, index=True, nullable=False)
+    tracks = Column(JSON, nullable=False)  # List of AudioTrack-shaped dicts
+    generated_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
@@ -0,0 +1,17 @@
+# backend/app/models/ready_track.py
+
+from sqlalchemy import Column, Integer, String, DateTime, Text
+import datetime
+from app.db.base_class import Base
+
+
+class ReadyTrack(Base):
+    """Pre-resolved track waiting in the per-mood pool for a fresh journal."""
+
+    id = Column(Integer, primary_key=True, index=True)
+    mood = Column(String, index=True, nullable=False)
+    title = Column(String, nullable=False)
+    artist = Column(String)
+    youtube_id = Column(String, nullable=False)
+    stream_url = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
@@ -30,6 +30,7 @@ from .audio import (
     AudioTrackCreate,
     AudioTrackUpdate,
     AudioTrack,
+    AudioStream,
 )
 from .song import SongSuggestion
 from .home_feed import HomeFeed
@@ -73,6 +74,7 @@ __all__ = [
     "AudioTrackCreate",
     "AudioTrackUpdate",
     "AudioTrack",
+    "AudioStream",
     "SongSuggestion",
     "HomeFeed",
 ]
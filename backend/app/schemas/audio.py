@@ -1,5 +1,7 @@
 # backend/app/schemas/audio.py
 
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict
 
 class AudioTrackBase(BaseModel):
@@ -26,4 +28,12 @@ class AudioTrackUpdate(AudioTrackBase):
 class AudioTrack(AudioTrackBase):
     id: int
     status: str = "done"
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AudioStream(BaseModel):
+    """Playable stream URL resolved on demand for a track."""
+
+    youtube_id: str
+    stream_url: str
+    expires_at: datetime
@@ -0,0 +1,61 @@
+# backend/app/services/export_service.py
+
+import datetime
+import zlib
+from typing import Iterable, Iterator
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.responses import dumps
+
+log = structlog.get_logger(__name__)
+
+# Record type and CRUD of each exported section, in output order
+EXPORT_SECTIONS = (
+    ("journal", crud.journal),
+    ("chat_message", crud.chat_message),
+)
+
+
+def iter_user_export(db: Session, user_id: int, batch_size: int = 500) -> Iterator[bytes]:
+    """
+    A user's journals and chat messages as NDJSON, one chunk per cursor batch.
+
+    The first line is an ``export`` header and the last a ``summary`` with
+    per-type counts; a backup without the summary line is incomplete.
+    """
+    yield _line({
+        "type": "export",
+        "version": 1,
+        "user_id": user_id,
+        "exported_at": datetime.datetime.utcnow(),
+    })
+    counts = {}
+    try:
+        for record_type, crud_obj in EXPORT_SECTIONS:
+            counts[record_type] = 0
+            for rows in crud_obj.iter_by_owner(db, owner_id=user_id, batch_size=batch_size):
+                counts[record_type] += len(rows)
+                yield b"".join(_line({"type": record_type, "data": row}) for row in rows)
+    except Exception as e:
+        # Headers are already sent; dropping the connection is all that's left
+        log.error("export:failed", user_id=user_id, error=str(e), counts=counts)
+        raise
+    log.info("export:done", user_id=user_id, counts=counts)
+    yield _line({"type": "summary", "counts": counts})
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a chunk stream incrementally, yielding output as the compressor emits it."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def _line(record: dict) -> bytes:
+    return dumps(record) + b"\n"
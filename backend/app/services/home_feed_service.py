@@ -0,0 +1,156 @@
+# backend/app/services/home_feed_service.py
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.core.config import settings
+from app.crud.crud_content_version import music_version
+
+log = structlog.get_logger(__name__)
+
+# (status code, body) of a rendered home feed
+Snapshot = Tuple[int, bytes]
+
+
+def home_feed_versions(user_id: int) -> Tuple[str, ...]:
+    """Content versions a user's home feed is built from (see ``crud.content_version``)."""
+    return ("quotes", music_version(None), music_version(user_id))
+
+
+def build_home_feed(db: Session, user_id: int) -> Optional[schemas.HomeFeed]:
+    """
+    Latest quote and the user's latest music recommendation, or None when
+    there is neither. Users without tracks of their own get the shared one.
+    """
+    music_obj = (
+        crud.music_track.get_latest(db, owner_id=user_id)
+        or crud.music_track.get_latest(db, owner_id=None)
+    )
+    music_status = "done"
+    if music_obj is not None and music_obj.status == "generating":
+        # Keep playing the last finished track (e.g. one assigned from the
+        # ready-track pool) while personalized generation runs.
+        music_status = "generating"
+        music_obj = (
+            crud.music_track.get_latest_done(db, owner_id=user_id)
+            or crud.music_track.get_latest_done(db, owner_id=None)
+        )
+    # Validasi ketat: field wajib tidak boleh null/kosong
+    if music_obj is not None:
+        if not (music_obj.id and music_obj.title and music_obj.youtube_id and music_obj.stream_url) or music_obj.status == 'failed':
+            music_obj = None
+
+    quote_obj = crud.motivational_quote.get_latest(db)
+    if quote_obj is None and music_obj is None:
+        return None
+    return schemas.HomeFeed(quote=quote_obj, music=music_obj, music_status=music_status)
+
+
+class HomeFeedSnapshotService:
+    """
+    Pre-serialized per-user home feeds, keyed by the ETag over
+    ``home_feed_versions(user_id)``.
+
+    Writes to the user's tracks, shared tracks or quotes bump one of those
+    versions (see ``crud.content_version``), so a snapshot is built at most
+    once per write: by the first worker to see the new version, or once for
+    all workers when a Redis backend is configured. Every other request
+    returns stored bytes. Each worker keeps the ``max_users`` most recently
+    served users in memory.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        prefix: str = "home-feed:",
+        ttl_seconds: int = 24 * 3600,
+        max_users: int = 1000,
+    ):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max(1, max_users)
+        self._local: "OrderedDict[int, Tuple[str, Snapshot]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "shared_hits": 0, "builds": 0, "errors": 0}
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "HomeFeedSnapshotService":
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=1), **kwargs)
+
+    def get(self, db: Session, user_id: int, etag: str) -> Snapshot:
+        with self._lock:
+            local = self._local.get(user_id)
+            if local is not None and local[0] == etag:
+                self._local.move_to_end(user_id)
+                self.stats["hits"] += 1
+                return local[1]
+
+        snapshot = self._get_shared(etag)
+        if snapshot is None:
+            snapshot = self._build(db, user_id)
+            self._set_shared(etag, snapshot)
+        with self._lock:
+            self._local[user_id] = (etag, snapshot)
+            self._local.move_to_end(user_id)
+            while len(self._local) > self.max_users:
+                self._local.popitem(last=False)
+        return snapshot
+
+    def _build(self, db: Session, user_id: int) -> Snapshot:
+        self.stats["builds"] += 1
+        feed = build_home_feed(db, user_id)
+        if feed is None:
+            return 204, b""
+        return 200, feed.model_dump_json(by_alias=True).encode()
+
+    def _get_shared(self, etag: str) -> Optional[Snapshot]:
+        if self.redis is None:
+            return None
+        try:
+            payload = self.redis.get(self.prefix + etag)
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("home_feed_snapshot:get_failed", error=str(e))
+            return None
+        if payload is None:
+            return None
+        self.stats["shared_hits"] += 1
+        # Stored as b"<status>" + body; 204 snapshots have no body
+        return int(payload[:3]), payload[3:]
+
+    def _set_shared(self, etag: str, snapshot: Snapshot) -> None:
+        if self.redis is None:
+            return
+        status_code, body = snapshot
+        try:
+            self.redis.set(self.prefix + etag, str(status_code).encode() + body, ex=self.ttl_seconds)
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("home_feed_snapshot:set_failed", error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "backend": "redis" if self.redis is not None else "local",
+            "local_users": len(self._local),
+        }
+
+
+def _build_service() -> HomeFeedSnapshotService:
+    if settings.HOME_FEED_CACHE_REDIS_URL:
+        return HomeFeedSnapshotService.from_url(
+            settings.HOME_FEED_CACHE_REDIS_URL, max_users=settings.MAX_CACHE_ENTRIES
+        )
+    return HomeFeedSnapshotService(max_users=settings.MAX_CACHE_ENTRIES)
+
+
+# Global snapshot instance
+home_feed_snapshot = _build_service()
@@ -9,8 +9,14 @@ import time
 from datetime import datetime, timedelta
 
 # Import our rate limiter
-from app.core.rate_limiter import rate_limiter
+from app.core.rate_limiter import rate_limiter, release_unused_slot
 from app.core.request_queue import request_queue, RequestPriority
+from app.core.config import settings
+from app.services.ytdlp_worker_pool import (
+    YtDlpExtractionError,
+    YtDlpJobTimeout,
+    ytdlp_worker_pool,
+)
 
 log = structlog.get_logger(__name__)
 YT_DLP_BIN = "yt-dlp"
@@ -30,7 +36,8 @@ class ImprovedYouTubeExtractor:
         self, 
         youtube_url: str, 
         priority: RequestPriority = RequestPriority.NORMAL,
-        use_cache: bool = True
+        use_cache: bool = True,
+        tenant: Optional[str] = None
     ) -> Optional[dict]:
         """
         Extract audio URL with rate limiting and caching
@@ -47,17 +54,19 @@ class ImprovedYouTubeExtractor:
             log.error("youtube_extractor:rate_limit_timeout", url=youtube_url)
             raise Exception("Rate limit exceeded, please try again later")
         
-        # Add to queue
-        request_id = await request_queue.add_request(
-            func=self._extract_audio_url_internal,
-            args=(youtube_url,),
-            priority=priority,
-            timeout=180  # 3 minutes timeout
-        )
-        
+        job = None
         try:
+            # Add to queue
+            job = await request_queue.add_request(
+                func=self._extract_audio_url_internal,
+                args=(youtube_url,),
+                priority=priority,
+                timeout=180,  # 3 minutes timeout
+                tenant=tenant
+            )
+            
             # Wait for result
-            result = await request_queue.get_result(request_id, timeout=200)
+            result = await job.result(timeout=200)
             
             # Cache successful result
             if result and use_cache:
@@ -78,6 +87,8 @@ class ImprovedYouTubeExtractor:
             log.error("youtube_extractor:queue_error", 
                      url=youtube_url, error=str(e))
             raise
+        finally:
+            await release_unused_slot(job)
     
     async def _extract_audio_url_internal(self, youtube_url: str) -> Optional[dict]:
         """
@@ -165,31 +176,19 @@ class ImprovedYouTubeExtractor:
         """
         Execute yt-dlp with timeout and error handling
         """
-        cmd = [YT_DLP_BIN] + strategy["args"] + [youtube_url]
-        
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        
         try:
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        timeout=45  # 45 second timeout per strategy
-                    )
-                ),
-                timeout=50  # Additional asyncio timeout
-            )
-            
-            if not result.stdout.strip():
-                log.warning("youtube_extractor:empty_output", strategy=strategy["name"])
-                return None
+            if settings.YTDLP_WORKER_POOL_ENABLED:
+                info = await ytdlp_worker_pool.extract(
+                    youtube_url, strategy["args"], timeout=45  # 45 second timeout per strategy
+                )
+                if not info:
+                    log.warning("youtube_extractor:empty_output", strategy=strategy["name"])
+                    return None
+            else:
+                info = await self._execute_ytdlp_subprocess(youtube_url, strategy)
+                if info is None:
+                    return None
             
-            info = json.loads(result.stdout)
             audio_url = info.get("url")
             
             if not audio_url:
@@ -221,12 +220,13 @@ class ImprovedYouTubeExtractor:
                 "extracted_at": datetime.now().isoformat()
             }
             
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, YtDlpJobTimeout):
             log.error("youtube_extractor:timeout", strategy=strategy["name"])
             raise Exception(f"YouTube extraction timeout for strategy {strategy['name']}")
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr[:200] if e.stderr else "Unknown subprocess error"
+        except (subprocess.CalledProcessError, YtDlpExtractionError) as e:
+            stderr = e.stderr if isinstance(e, subprocess.CalledProcessError) else str(e)
+            error_msg = stderr[:200] if stderr else "Unknown subprocess error"
             
             # Check for specific YouTube errors
             if "429" in error_msg or "Too Many Requests" in error_msg:
@@ -250,6 +250,32 @@ class ImprovedYouTubeExtractor:
                      strategy=strategy["name"], error=str(e))
             raise
     
+    async def _execute_ytdlp_subprocess(self, youtube_url: str, strategy: dict) -> Optional[dict]:
+        """Run one strategy through a fresh yt-dlp process (pool disabled)."""
+        cmd = [YT_DLP_BIN] + strategy["args"] + [youtube_url]
+        
+        # Run in executor to avoid blocking
+        loop = asyncio.get_event_loop()
+        result = await asyncio.wait_for(
+            loop.run_in_executor(
+                None,
+                lambda: subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=45  # 45 second timeout per strategy
+                )
+            ),
+            timeout=50  # Additional asyncio timeout
+        )
+        
+        if not result.stdout.strip():
+            log.warning("youtube_extractor:empty_output", strategy=strategy["name"])
+            return None
+        
+        return json.loads(result.stdout)
+    
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
         current_time = time.time()
@@ -12,6 +12,17 @@ from app.core.config import Settings, settings
 from app.models.journal import Journal
 from app.models.user_profile import UserProfile
 
+# Static recommendations per mood bucket, used when the LLM is unavailable
+FALLBACK_RECOMMENDATIONS = {
+    "bahagia": "1. \"Happy\" - Pharrell Williams\n2. \"Good as Hell\" - Lizzo\n3. \"Can't Stop the Feeling\" - Justin Timberlake",
+    "sedih": "1. \"The Sound of Silence\" - Simon & Garfunkel\n2. \"Mad World\" - Gary Jules\n3. \"Hurt\" - Johnny Cash",
+    "marah": "1. \"Angry Too\" - Lola Blanc\n2. \"Break Stuff\" - Limp Bizkit\n3. \"Killing in the Name\" - Rage Against the Machine",
+    "cemas": "1. \"Weightless\" - Marconi Union\n2. \"Clair de Lune\" - Claude Debussy\n3. \"Aqueous Transmission\" - Incubus",
+    "stress": "1. \"Breathe Me\" - Sia\n2. \"The Scientist\" - Coldplay\n3. \"Skinny Love\" - Bon Iver",
+    "lelah": "1. \"Tired\" - Alan Walker\n2. \"Heavy\" - Linkin Park ft. Kiiara\n3. \"Exhausted\" - Foo Fighters",
+    "netral": "1. \"Perfect\" - Ed Sheeran\n2. \"Count on Me\" - Bruno Mars\n3. \"Better Days\" - OneRepublic"
+}
+
 
 class MusicKeywordService:
     def __init__(self, settings: Settings = Depends(lambda: settings)):
@@ -121,22 +132,15 @@ class MusicKeywordService:
         
         dominant_mood = max(mood_counts, key=mood_counts.get) if mood_counts else "netral"
         
-        fallback_recommendations = {
-            "bahagia": "1. \"Happy\" - Pharrell Williams\n2. \"Good as Hell\" - Lizzo\n3. \"Can't Stop the Feeling\" - Justin Timberlake",
-            "sedih": "1. \"The Sound of Silence\" - Simon & Garfunkel\n2. \"Mad World\" - Gary Jules\n3. \"Hurt\" - Johnny Cash",
-            "marah": "1. \"Angry Too\" - Lola Blanc\n2. \"Break Stuff\" - Limp Bizkit\n3. \"Killing in the Name\" - Rage Against the Machine",
-            "cemas": "1. \"Weightless\" - Marconi Union\n2. \"Clair de Lune\" - Claude Debussy\n3. \"Aqueous Transmission\" - Incubus",
-            "stress": "1. \"Breathe Me\" - Sia\n2. \"The Scientist\" - Coldplay\n3. \"Skinny Love\" - Bon Iver",
-            "lelah": "1. \"Tired\" - Alan Walker\n2. \"Heavy\" - Linkin Park ft. Kiiara\n3. \"Exhausted\" - Foo Fighters",
-            "netral": "1. \"Perfect\" - Ed Sheeran\n2. \"Count on Me\" - Bruno Mars\n3. \"Better Days\" - OneRepublic"
-        }
-        
-        return fallback_recommendations.get(dominant_mood, fallback_recommendations["netral"])
+        return FALLBACK_RECOMMENDATIONS.get(dominant_mood, FALLBACK_RECOMMENDATIONS["netral"])
 
     async def generate_diverse_recommendations(self, journals: List[Journal], user_profile: Optional[UserProfile] = None, count: int = 5) -> List[str]:
         """Generate diverse music recommendations with psychological insight"""
         keyword_response = await self.generate_keyword(journals, user_profile)
-        
+        return self.extract_recommendations(keyword_response, journals, count=count)
+
+    def extract_recommendations(self, keyword_response: str, journals: List[Journal], count: int = 5) -> List[str]:
+        """Split a generate_keyword response into ranked recommendation lines (no LLM call)."""
         # Parse the AI response to extract individual recommendations
         recommendations = []
         lines = keyword_response.split('\n')
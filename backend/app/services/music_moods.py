@@ -0,0 +1,50 @@
+# backend/app/services/music_moods.py
+
+"""Mood buckets shared by radio stations, fallback recommendations and the ready-track pool."""
+
+# Radio station categories mapping
+RADIO_CATEGORIES = {
+    'santai': {'mood': 'relax', 'keywords': ['chill', 'relax', 'ambient', 'peaceful']},
+    'energik': {'mood': 'energetic', 'keywords': ['upbeat', 'motivational', 'workout', 'dance']},
+    'fokus': {'mood': 'focus', 'keywords': ['instrumental', 'concentration', 'study', 'productivity']},
+    'bahagia': {'mood': 'happy', 'keywords': ['happy', 'uplifting', 'positive', 'cheerful']},
+    'sedih': {'mood': 'sad', 'keywords': ['melancholy', 'emotional', 'ballad', 'contemplative']},
+    'romantis': {'mood': 'romantic', 'keywords': ['love', 'romantic', 'intimate', 'soulful']},
+    'nostalgia': {'mood': 'nostalgic', 'keywords': ['classic', 'vintage', 'memories', 'timeless']},
+    'instrumental': {'mood': 'instrumental', 'keywords': ['no vocals', 'classical', 'cinematic', 'atmospheric']},
+    'jazz': {'mood': 'jazz', 'keywords': ['smooth', 'sophisticated', 'lounge', 'swing']},
+    'rock': {'mood': 'rock', 'keywords': ['guitar', 'alternative', 'indie', 'energetic']},
+    'pop': {'mood': 'pop', 'keywords': ['mainstream', 'catchy', 'contemporary', 'hits']},
+    'electronic': {'mood': 'electronic', 'keywords': ['synth', 'beats', 'digital', 'futuristic']},
+}
+
+# Journal mood buckets (same keys as MusicKeywordService fallbacks) -> radio category
+MOOD_BUCKETS = {
+    'bahagia': 'bahagia',
+    'sedih': 'sedih',
+    'marah': 'rock',
+    'cemas': 'santai',
+    'stress': 'santai',
+    'lelah': 'instrumental',
+    'netral': 'pop',
+}
+
+DEFAULT_MOOD_BUCKET = 'netral'
+
+# Mood labels sent by the app that differ from the bucket names
+MOOD_ALIASES = {
+    'senang': 'bahagia',
+    'gembira': 'bahagia',
+    'stres': 'stress',
+    'khawatir': 'cemas',
+    'capek': 'lelah',
+}
+
+
+def mood_bucket(mood: str | None) -> str:
+    """Map a free-form journal mood (e.g. "Senang 😊") to a mood bucket."""
+    words = (mood or '').strip().lower().split()
+    if not words:
+        return DEFAULT_MOOD_BUCKET
+    word = MOOD_ALIASES.get(words[0], words[0])
+    return word if word in MOOD_BUCKETS else DEFAULT_MOOD_BUCKET
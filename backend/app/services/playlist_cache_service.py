@@ -1,24 +1,165 @@
 # backend/app/services/playlist_cache_service.py
 
 import datetime
-from typing import List, Optional
-from app.schemas.song import SongSuggestion
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-# Simple in-memory cache (replace with Redis/DB in production)
-class PlaylistCacheService:
-    _cache = {}
+import structlog
+from pydantic import TypeAdapter
 
-    @classmethod
-    def get_playlist(cls, user_id: int, date: str, category: str) -> Optional[List[SongSuggestion]]:
-        key = (user_id, date, category)
-        return cls._cache.get(key)
+from app.core.config import settings
+from app.schemas.audio import AudioTrack
 
-    @classmethod
-    def set_playlist(cls, user_id: int, date: str, category: str, playlist: List[SongSuggestion]):
-        key = (user_id, date, category)
-        cls._cache[key] = playlist
+log = structlog.get_logger(__name__)
+
+_playlist_adapter = TypeAdapter(List[AudioTrack])
+
+
+def _expires_at(date: str) -> float:
+    """Playlists are per day: an entry expires at the midnight that ends ``date``."""
+    day = datetime.date.fromisoformat(date)
+    midnight = datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min)
+    return midnight.timestamp()
+
+
+class LocalPlaylistBackend:
+    """In-process LRU store; the stand-in when no shared backend is configured."""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: bytes, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def size(self) -> Optional[int]:
+        return len(self._entries)
+
+
+class RedisPlaylistBackend:
+    """
+    Shared store so every gunicorn worker sees the same playlists. Expiry uses
+    Redis key expiry; bounding and LRU eviction are left to the server's
+    ``maxmemory-policy allkeys-lru``.
+    """
+
+    def __init__(self, client, prefix: str = "playlist:"):
+        self.client = client
+        self.prefix = prefix
+        self.evictions = 0
 
     @classmethod
-    def clear_old(cls):
-        # Optionally clear old cache entries
-        pass
+    def from_url(cls, url: str) -> "RedisPlaylistBackend":
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=1))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, payload: bytes, expires_at: float) -> None:
+        ttl = int(expires_at - time.time())
+        if ttl > 0:
+            self.client.set(self.prefix + key, payload, ex=ttl)
+
+    def purge_expired(self) -> int:
+        return 0  # Redis expires keys itself
+
+    def size(self) -> Optional[int]:
+        return None  # Unknown without scanning the keyspace
+
+
+class PlaylistCacheService:
+    """
+    Daily playlist cache keyed by (user_id, date, category).
+
+    Playlists are stored as serialized JSON bytes, so a hit can be returned
+    as-is without building and re-validating Pydantic models. Backend errors
+    are logged and treated as misses.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else LocalPlaylistBackend()
+        self.stats = {"hits": 0, "misses": 0, "sets": 0, "errors": 0}
+
+    @staticmethod
+    def _key(user_id: int, date: str, category: str) -> str:
+        return f"{user_id}:{date}:{category}"
+
+    def get_serialized(self, user_id: int, date: str, category: str) -> Optional[bytes]:
+        try:
+            payload = self.backend.get(self._key(user_id, date, category))
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("playlist_cache:get_failed", error=str(e))
+            payload = None
+        self.stats["hits" if payload is not None else "misses"] += 1
+        return payload
+
+    def get_playlist(self, user_id: int, date: str, category: str) -> Optional[List[AudioTrack]]:
+        payload = self.get_serialized(user_id, date, category)
+        return _playlist_adapter.validate_json(payload) if payload is not None else None
+
+    def set_playlist(
+        self, user_id: int, date: str, category: str, playlist: List[AudioTrack]
+    ) -> bytes:
+        """Serialize and store ``playlist``; returns the bytes so callers can reuse them."""
+        payload = _playlist_adapter.dump_json(playlist)
+        try:
+            self.backend.set(self._key(user_id, date, category), payload, _expires_at(date))
+            self.stats["sets"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            log.warning("playlist_cache:set_failed", error=str(e))
+        return payload
+
+    def clear_old(self) -> int:
+        """Drop entries whose day has passed; returns how many were removed."""
+        return self.backend.purge_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "evictions": self.backend.evictions,
+        }
+
+
+def _build_backend():
+    if settings.PLAYLIST_CACHE_REDIS_URL:
+        return RedisPlaylistBackend.from_url(settings.PLAYLIST_CACHE_REDIS_URL)
+    return LocalPlaylistBackend(max_entries=settings.MAX_CACHE_ENTRIES)
+
+
+# Global cache instance
+playlist_cache = PlaylistCacheService(backend=_build_backend())
@@ -0,0 +1,141 @@
+# backend/app/services/radio_station_service.py
+
+import asyncio
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import Settings, settings
+from app.core.lazy import LazyImport
+from app.models.radio_station import RadioStation
+from app.schemas.song import SongSuggestion
+from app.services.music_moods import RADIO_CATEGORIES
+from app.services.music_suggestion_service import MusicSuggestionService
+
+log = structlog.get_logger(__name__)
+
+VideosSearch = LazyImport("youtubesearchpython", "VideosSearch")  # Pulls in httpx and yt-dlp
+
+# Dedicated threads for the blocking searches: the default executor is sized
+# from the CPU count and would split a station's searches into several rounds.
+_search_executor = ThreadPoolExecutor(
+    max_workers=settings.RADIO_SEARCH_CONCURRENCY, thread_name_prefix="radio-search"
+)
+
+
+class RadioStationService:
+    """
+    Builds a radio station playlist from one batched LLM suggestion call,
+    followed by YouTube searches that run concurrently on a bounded thread pool.
+    """
+
+    def __init__(self, settings: Settings = settings):
+        self.settings = settings
+
+    async def build_station(
+        self,
+        category: str,
+        suggestion_service: Optional[MusicSuggestionService] = None,
+        avoid_titles: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Dict[str, float]]:
+        """Return ``(playlist, timings_ms)`` for a category from ``RADIO_CATEGORIES``."""
+        suggestion_service = suggestion_service or MusicSuggestionService(settings=self.settings)
+        category_config = RADIO_CATEGORIES[category]
+        keyword = f"{category_config['mood']} ({', '.join(category_config['keywords'])})"
+        size = self.settings.RADIO_STATION_SIZE
+        timings: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        # Ask for a couple of spares so failed searches don't shrink the station
+        suggestions = await suggestion_service.suggest_diverse_songs(
+            keyword, count=size + 2, avoid_titles=avoid_titles
+        )
+        timings["suggest"] = (time.perf_counter() - started) * 1000
+
+        search_started = time.perf_counter()
+        youtube_ids = await asyncio.gather(*(self._search(song) for song in suggestions))
+        timings["search"] = (time.perf_counter() - search_started) * 1000
+
+        playlist: List[dict] = []
+        seen = set()
+        for song, youtube_id in zip(suggestions, youtube_ids):
+            if not youtube_id or youtube_id in seen:
+                continue
+            seen.add(youtube_id)
+            playlist.append({
+                "id": len(playlist) + 1,  # Use integer ID
+                "title": song.title,
+                "artist": song.artist,
+                "youtube_id": youtube_id,
+                "stream_url": None,
+                "cover_url": None,
+                "status": "done",
+            })
+            if len(playlist) >= size:
+                break
+        timings["total"] = (time.perf_counter() - started) * 1000
+
+        log.info(
+            "radio_station_built",
+            category=category,
+            suggestions=len(suggestions),
+            track_count=len(playlist),
+            **{f"{stage}_ms": round(ms, 1) for stage, ms in timings.items()},
+        )
+        return playlist, timings
+
+    def get_stored(self, db: Session, category: str) -> Optional[RadioStation]:
+        """The precomputed station for ``category``, or None if missing or too old."""
+        station = crud.radio_station.get_by_category(db, category=category)
+        if station is None or not station.tracks:
+            return None
+        max_age = datetime.timedelta(hours=self.settings.RADIO_STATION_MAX_AGE_HOURS)
+        if station.generated_at < datetime.datetime.utcnow() - max_age:
+            return None
+        return station
+
+    async def refresh_all(self, db: Session) -> Dict[str, int]:
+        """
+        Rebuild and store every category's playlist, avoiding the songs of the
+        previous rotation. Returns the stored track count per category.
+        """
+        suggestion_service = MusicSuggestionService(settings=self.settings)
+        refreshed: Dict[str, int] = {}
+        for category in RADIO_CATEGORIES:
+            previous = crud.radio_station.get_by_category(db, category=category)
+            previous_titles = [t["title"] for t in previous.tracks] if previous else []
+            try:
+                playlist, _ = await self.build_station(
+                    category, suggestion_service=suggestion_service, avoid_titles=previous_titles
+                )
+            except Exception as e:
+                log.error("radio_station_refresh_failed", category=category, error=str(e))
+                continue
+            # Keep serving the previous rotation rather than storing an empty one
+            if playlist:
+                crud.radio_station.upsert(db, category=category, tracks=playlist)
+                refreshed[category] = len(playlist)
+        log.info("radio_stations_refreshed", refreshed=refreshed)
+        return refreshed
+
+    async def _search(self, song: SongSuggestion) -> Optional[str]:
+        search_query = f"{song.title} {song.artist}"
+        loop = asyncio.get_running_loop()
+        try:
+            # VideosSearch performs the request in its constructor
+            results = await loop.run_in_executor(
+                _search_executor, lambda: VideosSearch(search_query, limit=1).result()
+            )
+        except Exception as e:
+            log.warning("radio_search_failed", query=search_query, error=str(e))
+            return None
+        items = (results or {}).get("result") or []
+        if not items:
+            log.warning("youtube_search_failed", query=search_query)
+            return None
+        return items[0].get("id")
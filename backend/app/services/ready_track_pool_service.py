@@ -0,0 +1,130 @@
+# backend/app/services/ready_track_pool_service.py
+
+import asyncio
+import datetime
+import random
+from typing import Dict, List, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import Settings, settings
+from app.core.lazy import LazyImport
+from app.core.request_queue import RequestPriority
+from app.models.music_track import MusicTrack
+from app.schemas.song import SongSuggestion
+from app.services.music_keyword_service import FALLBACK_RECOMMENDATIONS
+from app.services.music_moods import MOOD_BUCKETS, RADIO_CATEGORIES, mood_bucket
+from app.services.music_suggestion_service import MusicSuggestionService
+
+log = structlog.get_logger(__name__)
+
+VideosSearch = LazyImport("youtubesearchpython", "VideosSearch")  # Pulls in httpx and yt-dlp
+
+
+class ReadyTrackPoolService:
+    """
+    Keeps a small pool of already-resolved tracks for every mood bucket so a
+    fresh journal gets music instantly, while the personalized generation flow
+    refines it in the background.
+    """
+
+    def __init__(self, settings: Settings = settings):
+        self.settings = settings
+
+    def _fresh_after(self) -> datetime.datetime:
+        return datetime.datetime.utcnow() - datetime.timedelta(
+            hours=self.settings.READY_TRACK_MAX_AGE_HOURS
+        )
+
+    def assign_for_mood(
+        self, db: Session, mood: str | None, owner_id: int | None = None
+    ) -> Optional[MusicTrack]:
+        """Publish a pooled track matching ``mood`` to ``owner_id``'s home feed, if one is ready."""
+        if not self.settings.READY_TRACK_POOL_ENABLED:
+            return None
+        bucket = mood_bucket(mood)
+        track = crud.ready_track.assign_to_feed(
+            db, mood=bucket, fresh_after=self._fresh_after(), owner_id=owner_id
+        )
+        if track:
+            log.info("ready_track_pool:assigned", mood=bucket, title=track.title,
+                     track_id=track.id, owner_id=owner_id)
+        else:
+            log.info("ready_track_pool:empty", mood=bucket)
+        return track
+
+    async def refill(self, db: Session) -> Dict[str, int]:
+        """Drop stale entries and top every mood bucket back up. Returns tracks added per bucket."""
+        removed = crud.ready_track.delete_stale(db, older_than=self._fresh_after())
+        counts = crud.ready_track.count_by_mood(db, fresh_after=self._fresh_after())
+        added: Dict[str, int] = {}
+
+        for bucket in MOOD_BUCKETS:
+            missing = self.settings.READY_TRACK_POOL_SIZE - counts.get(bucket, 0)
+            if missing <= 0:
+                continue
+
+            known_ids = set(crud.ready_track.youtube_ids_for_mood(db, mood=bucket))
+            added[bucket] = 0
+            for song in await self._candidates(bucket, missing):
+                if added[bucket] >= missing:
+                    break
+                resolved = await self._resolve(song)
+                if not resolved or resolved["youtube_id"] in known_ids:
+                    continue
+                crud.ready_track.create_for_mood(db, mood=bucket, **resolved)
+                known_ids.add(resolved["youtube_id"])
+                added[bucket] += 1
+
+        log.info("ready_track_pool:refilled", removed_stale=removed, added=added)
+        return added
+
+    async def _candidates(self, bucket: str, missing: int) -> List[SongSuggestion]:
+        """LLM suggestions for the bucket's radio category, backed by the static fallbacks."""
+        suggestion_service = MusicSuggestionService(settings=self.settings)
+        category = RADIO_CATEGORIES[MOOD_BUCKETS[bucket]]
+        keyword = f"{category['mood']} {', '.join(category['keywords'])}"
+        suggestions = await suggestion_service.suggest_diverse_songs(keyword, count=missing + 2)
+
+        fallbacks = await suggestion_service.parse_music_keywords_to_suggestions(
+            FALLBACK_RECOMMENDATIONS[bucket]
+        )
+        random.shuffle(fallbacks)
+        return suggestions + fallbacks
+
+    async def _resolve(self, song: SongSuggestion) -> Optional[dict]:
+        """Find the song on YouTube and extract a playable stream URL."""
+        from app.services.stealth_youtube_extractor import stealth_youtube_extractor
+
+        try:
+            # VideosSearch performs the request in its constructor
+            search = await asyncio.to_thread(
+                lambda: VideosSearch(f"{song.title} {song.artist}", limit=1).result()
+            )
+            items = search.get("result", [])
+            youtube_id = items[0].get("id") if items else None
+            if not youtube_id:
+                return None
+
+            audio_info = await stealth_youtube_extractor.extract_audio_url(
+                f"https://www.youtube.com/watch?v={youtube_id}",
+                priority=RequestPriority.LOW,
+                tenant="ready-track-pool",
+            )
+        except Exception as e:
+            log.warning("ready_track_pool:resolve_failed", title=song.title, error=str(e))
+            return None
+
+        if not audio_info or not audio_info.get("audio_url"):
+            return None
+        return {
+            "title": song.title,
+            "artist": song.artist,
+            "youtube_id": youtube_id,
+            "stream_url": audio_info["audio_url"],
+        }
+
+
+ready_track_pool = ReadyTrackPoolService()
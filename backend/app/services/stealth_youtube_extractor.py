@@ -12,7 +12,7 @@ import tempfile
 import os
 import hashlib
 import uuid
-from urllib.parse import urlencode, urlparse
+from urllib.parse import urlencode, urlparse, parse_qs
 
 try:
     import aiohttp
@@ -20,12 +20,33 @@ except ImportError:
     aiohttp = None
 
 # Import our rate limiter
-from app.core.rate_limiter import rate_limiter
+from app.core.rate_limiter import rate_limiter, release_unused_slot
 from app.core.request_queue import request_queue, RequestPriority
+from app.core.config import settings
+from app.services.ytdlp_worker_pool import (
+    WORKER_ENV_OVERRIDES,
+    YtDlpExtractionError,
+    YtDlpJobTimeout,
+    ytdlp_worker_pool,
+)
 
 log = structlog.get_logger(__name__)
 YT_DLP_BIN = "yt-dlp"
 
+# Stop serving a cached stream URL this many seconds before it expires
+STREAM_EXPIRY_MARGIN_SECONDS = 300
+
+
+def stream_url_expiry(audio_url: str, default_ttl: float) -> float:
+    """Return the unix time a googlevideo stream URL expires (its ``expire`` param)."""
+    try:
+        expire = parse_qs(urlparse(audio_url).query).get("expire")
+        if expire:
+            return float(expire[0])
+    except (TypeError, ValueError):
+        pass
+    return time.time() + default_ttl
+
 class StealthYouTubeExtractor:
     """
     Stealth YouTube extractor with anti-bot detection techniques
@@ -36,6 +57,7 @@ class StealthYouTubeExtractor:
         self.cache_ttl = 3600  # 1 hour cache
         self.last_request_time = 0
         self.min_request_interval = 3  # Minimum 3 seconds between requests
+        self._inflight: Dict[str, asyncio.Future] = {}
         self.user_agents = [
             # Chrome on Windows (latest)
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -377,17 +399,21 @@ class StealthYouTubeExtractor:
         priority: RequestPriority = RequestPriority.NORMAL,
         use_cache: bool = True,
         stealth_mode: bool = True,
-        use_proxy: bool = False
+        use_proxy: bool = False,
+        tenant: Optional[str] = None,
+        adaptive: bool = False
     ) -> Optional[dict]:
         """
-        Extract audio URL with advanced stealth techniques
+        Extract audio URL with advanced stealth techniques.
+        ``tenant`` (usually the user id) is used for fair scheduling in the request queue.
+        ``adaptive`` runs ``adaptive_extraction_with_intelligence`` as the queued job.
         """
         # Check cache first
-        if use_cache and youtube_url in self.cache:
-            cache_entry = self.cache[youtube_url]
-            if time.time() - cache_entry['timestamp'] < self.cache_ttl:
+        if use_cache:
+            cached = self.get_cached(youtube_url)
+            if cached:
                 log.info("stealth_youtube_extractor:cache_hit", url=youtube_url)
-                return cache_entry['data']
+                return cached
         
         # Check rate limits with jitter
         jitter = random.uniform(0.5, 3.0)  # Increased jitter
@@ -397,23 +423,32 @@ class StealthYouTubeExtractor:
             log.error("stealth_youtube_extractor:rate_limit_timeout", url=youtube_url)
             raise Exception("Rate limit exceeded, please try again later")
         
-        # Add to queue with stealth mode
-        request_id = await request_queue.add_request(
-            func=self._extract_audio_url_stealth if stealth_mode else self._extract_audio_url_basic,
-            args=(youtube_url, use_proxy),
-            priority=priority,
-            timeout=300  # 5 minutes timeout for stealth mode
-        )
+        if adaptive:
+            func = self.adaptive_extraction_with_intelligence
+        else:
+            func = self._extract_audio_url_stealth if stealth_mode else self._extract_audio_url_basic
         
+        job = None
         try:
+            # Add to queue with stealth mode
+            job = await request_queue.add_request(
+                func=func,
+                args=(youtube_url, use_proxy),
+                priority=priority,
+                timeout=300,  # 5 minutes timeout for stealth mode
+                tenant=tenant
+            )
+            
             # Wait for result
-            result = await request_queue.get_result(request_id, timeout=320)
+            result = await job.result(timeout=320)
             
             # Cache successful result
             if result and use_cache:
+                now = time.time()
                 self.cache[youtube_url] = {
                     'data': result,
-                    'timestamp': time.time()
+                    'timestamp': now,
+                    'expires_at': stream_url_expiry(result.get("audio_url", ""), self.cache_ttl)
                 }
                 # Limit cache size
                 if len(self.cache) > 100:
@@ -427,6 +462,47 @@ class StealthYouTubeExtractor:
             log.error("stealth_youtube_extractor:queue_error", 
                      url=youtube_url, error=str(e))
             raise
+        finally:
+            await release_unused_slot(job)
+    
+    def get_cached(self, youtube_url: str) -> Optional[dict]:
+        """Return a cached extraction whose stream URL is still safely playable."""
+        cache_entry = self.cache.get(youtube_url)
+        if not cache_entry:
+            return None
+        now = time.time()
+        expires_at = cache_entry.get('expires_at', cache_entry['timestamp'] + self.cache_ttl)
+        if (now - cache_entry['timestamp'] < self.cache_ttl
+                and now < expires_at - STREAM_EXPIRY_MARGIN_SECONDS):
+            return cache_entry['data']
+        return None
+    
+    async def resolve_stream(self, youtube_id: str, tenant: Optional[str] = None) -> Optional[dict]:
+        """
+        Resolve a playable stream for ``youtube_id`` on demand.
+
+        Served from the extraction cache when possible; concurrent requests for
+        the same video share one extraction, queued under the first caller's
+        ``tenant``. The result carries ``expires_at``.
+        """
+        youtube_url = f"https://www.youtube.com/watch?v={youtube_id}"
+        task = self._inflight.get(youtube_url)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.extract_audio_url(youtube_url, priority=RequestPriority.HIGH, tenant=tenant)
+            )
+            self._inflight[youtube_url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(youtube_url, None))
+        
+        result = await asyncio.shield(task)
+        if not result or not result.get("audio_url"):
+            return None
+        
+        cache_entry = self.cache.get(youtube_url)
+        expires_at = (cache_entry or {}).get('expires_at') or stream_url_expiry(
+            result["audio_url"], self.cache_ttl
+        )
+        return {**result, "expires_at": expires_at}
     
     async def _extract_audio_url_stealth(self, youtube_url: str, use_proxy: bool = False) -> Optional[dict]:
         """
@@ -530,46 +606,68 @@ class StealthYouTubeExtractor:
         basic_extractor = ImprovedYouTubeExtractor()
         return await basic_extractor._extract_audio_url_internal(youtube_url)
     
+    async def _run_ytdlp(self, youtube_url: str, args: List[str], timeout: int):
+        """
+        Run yt-dlp for one strategy. Returns ``(info, stderr)``, or ``None``
+        on timeout. Uses the persistent worker pool when enabled.
+        """
+        if settings.YTDLP_WORKER_POOL_ENABLED:
+            try:
+                data = await ytdlp_worker_pool.extract(youtube_url, args, timeout=timeout)
+            except YtDlpJobTimeout:
+                return None
+            except YtDlpExtractionError as e:
+                return None, str(e)
+            return data, ""
+
+        cmd = [YT_DLP_BIN] + args + [youtube_url]
+
+        # Set environment variables for additional stealth
+        env = os.environ.copy()
+        env.update(WORKER_ENV_OVERRIDES)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            return None
+
+        if process.returncode != 0:
+            return None, stderr.decode('utf-8', errors='ignore') or f"exit code {process.returncode}"
+
+        output_str = stdout.decode('utf-8', errors='ignore')
+        return (json.loads(output_str) if output_str.strip() else None), ""
+
     async def _try_extraction_strategy(self, youtube_url: str, strategy: Dict) -> Optional[dict]:
         """Try a specific extraction strategy with enhanced anti-detection"""
         
-        cmd = [YT_DLP_BIN] + strategy["args"] + [youtube_url]
-        
         try:
             # Add enhanced random delay before execution
             pre_delay = random.uniform(1.0, 3.0)
             await asyncio.sleep(pre_delay)
             
-            # Set environment variables for additional stealth
-            env = os.environ.copy()
-            env.update({
-                'HTTP_PROXY': '',
-                'HTTPS_PROXY': '',
-                'NO_PROXY': '',
-                'PYTHONHTTPSVERIFY': '0'
-            })
-            
-            # Execute with timeout and enhanced error detection
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env
-            )
-            
+            # Dynamic timeout based on strategy
+            timeout = 180 if "tv_client" in strategy["name"] else 120
             try:
-                # Dynamic timeout based on strategy
-                timeout = 180 if "tv_client" in strategy["name"] else 120
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-            except asyncio.TimeoutError:
-                process.kill()
+                output = await self._run_ytdlp(youtube_url, strategy["args"], timeout)
+            except json.JSONDecodeError as e:
+                log.error("stealth_youtube_extractor:json_error", 
+                         strategy=strategy["name"], error=str(e))
+                return None
+            if output is None:
                 log.error("stealth_youtube_extractor:timeout", 
                          strategy=strategy["name"], timeout=timeout)
                 return None
             
-            if process.returncode != 0:
-                stderr_str = stderr.decode('utf-8', errors='ignore')
-                
+            data, stderr_str = output
+            if stderr_str:
                 # Enhanced error pattern detection
                 bot_detection_patterns = [
                     "Sign in to confirm", "bot", "automated", "unusual traffic",
@@ -599,60 +697,52 @@ class StealthYouTubeExtractor:
                              stderr=stderr_str[:500])
                 return None
             
-            # Parse JSON output with enhanced validation
-            try:
-                output_str = stdout.decode('utf-8', errors='ignore')
-                if not output_str.strip():
-                    log.warning("stealth_youtube_extractor:empty_output", strategy=strategy["name"])
-                    return None
-                
-                data = json.loads(output_str)
-                audio_url = data.get("url")
-                
-                if not audio_url:
-                    log.warning("stealth_youtube_extractor:no_audio_url", strategy=strategy["name"])
-                    return None
-                
-                # Enhanced validation
-                duration = data.get("duration", 0)
-                filesize = data.get("filesize", 0)
-                
-                # Skip videos that are too long or too large
-                if duration and duration > 3600:  # 1 hour
-                    log.warning("stealth_youtube_extractor:video_too_long", 
-                               strategy=strategy["name"], duration=duration)
-                    return None
-                
-                if filesize and filesize > 100 * 1024 * 1024:  # 100MB
-                    log.warning("stealth_youtube_extractor:file_too_large", 
-                               strategy=strategy["name"], filesize=filesize)
-                    return None
-                
-                # Validate URL accessibility
-                if not await self._validate_audio_url(audio_url):
-                    log.warning("stealth_youtube_extractor:url_not_accessible", 
-                               strategy=strategy["name"])
-                    return None
-                
-                # Success - reduce delay for future requests
-                self.min_request_interval = max(self.min_request_interval * 0.9, 2)
-                
-                return {
-                    "audio_url": audio_url,
-                    "title": data.get("title", "Unknown"),
-                    "duration": duration,
-                    "duration_string": data.get("duration_string", "Unknown"),
-                    "strategy_used": strategy["name"],
-                    "filesize": filesize,
-                    "format_id": data.get("format_id", ""),
-                    "ext": data.get("ext", ""),
-                    "quality": data.get("quality", "")
-                }
-                
-            except json.JSONDecodeError as e:
-                log.error("stealth_youtube_extractor:json_error", 
-                         strategy=strategy["name"], error=str(e))
+            # Validate extracted info
+            if not data:
+                log.warning("stealth_youtube_extractor:empty_output", strategy=strategy["name"])
                 return None
+            
+            audio_url = data.get("url")
+            
+            if not audio_url:
+                log.warning("stealth_youtube_extractor:no_audio_url", strategy=strategy["name"])
+                return None
+            
+            # Enhanced validation
+            duration = data.get("duration", 0)
+            filesize = data.get("filesize", 0)
+            
+            # Skip videos that are too long or too large
+            if duration and duration > 3600:  # 1 hour
+                log.warning("stealth_youtube_extractor:video_too_long", 
+                           strategy=strategy["name"], duration=duration)
+                return None
+            
+            if filesize and filesize > 100 * 1024 * 1024:  # 100MB
+                log.warning("stealth_youtube_extractor:file_too_large", 
+                           strategy=strategy["name"], filesize=filesize)
+                return None
+            
+            # Validate URL accessibility
+            if not await self._validate_audio_url(audio_url):
+                log.warning("stealth_youtube_extractor:url_not_accessible", 
+                           strategy=strategy["name"])
+                return None
+            
+            # Success - reduce delay for future requests
+            self.min_request_interval = max(self.min_request_interval * 0.9, 2)
+            
+            return {
+                "audio_url": audio_url,
+                "title": data.get("title", "Unknown"),
+                "duration": duration,
+                "duration_string": data.get("duration_string", "Unknown"),
+                "strategy_used": strategy["name"],
+                "filesize": filesize,
+                "format_id": data.get("format_id", ""),
+                "ext": data.get("ext", ""),
+                "quality": data.get("quality", "")
+            }
                 
         except Exception as e:
             log.error("stealth_youtube_extractor:unexpected_error",
@@ -0,0 +1,258 @@
+# backend/app/services/ytdlp_worker_pool.py
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.core.config import settings
+
+log = structlog.get_logger(__name__)
+
+# Environment applied inside every worker process, mirroring what the
+# subprocess strategies used to pass to the yt-dlp binary.
+WORKER_ENV_OVERRIDES = {
+    "HTTP_PROXY": "",
+    "HTTPS_PROXY": "",
+    "NO_PROXY": "",
+    "PYTHONHTTPSVERIFY": "0",
+}
+
+
+class YtDlpJobTimeout(Exception):
+    """Raised when a worker does not answer within the job timeout."""
+
+
+class YtDlpExtractionError(Exception):
+    """Raised when yt-dlp reports an error for a job (the message mirrors stderr)."""
+
+
+class _SilentLogger:
+    """yt-dlp logger for workers; errors travel back in the job result instead."""
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+
+def _worker_main(conn, env_overrides: Dict[str, str]) -> None:
+    """Worker process loop: import yt-dlp once, then serve jobs from the pipe."""
+    os.environ.update(env_overrides)
+
+    import yt_dlp
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+
+        url, args = job
+        try:
+            ydl_opts = yt_dlp.parse_options(list(args)).ydl_opts
+            # The pool only resolves metadata, never downloads or prints, and
+            # errors must raise so they can be reported like a non-zero exit.
+            ydl_opts.update({
+                "ignoreerrors": False,
+                "forcejson": False,
+                "simulate": True,
+                "skip_download": True,
+                "noprogress": True,
+                "logger": _SilentLogger(),
+            })
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+                payload = ydl.sanitize_info(info) if info else None
+            conn.send(("ok", payload))
+        except BaseException as e:  # SystemExit from bad args included
+            conn.send(("error", str(e) or e.__class__.__name__))
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "jobs_done", "started_at")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.jobs_done = 0
+        self.started_at = time.time()
+
+
+class YtDlpWorkerPool:
+    """
+    Pool of long-lived processes running yt-dlp through its Python API.
+
+    Each job is a list of yt-dlp CLI arguments plus a URL, the same shape the
+    extractors used to hand to ``subprocess``, so strategies stay unchanged.
+    Workers are recycled after ``max_jobs_per_worker`` jobs and replaced when
+    a job times out or the process dies.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        job_timeout: float = 120,
+        max_jobs_per_worker: int = 50,
+    ):
+        self.size = max(1, size)
+        self.job_timeout = job_timeout
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        # spawn avoids inheriting the event loop, DB connections and locks
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: List[_Worker] = []
+        self._spawned = 0
+        self._lock = threading.Lock()
+        self._available = threading.Semaphore(self.size)
+        self._closed = False
+        self.stats = {
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "jobs_timed_out": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+        }
+
+    def _spawn_worker(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, WORKER_ENV_OVERRIDES),
+            name="ytdlp-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.stats["workers_started"] += 1
+        log.info("ytdlp_worker_pool:worker_started", pid=process.pid)
+        return _Worker(process, parent_conn)
+
+    def _stop_worker(self, worker: _Worker, reason: str) -> None:
+        try:
+            if worker.process.is_alive():
+                try:
+                    worker.conn.send(None)
+                except (OSError, BrokenPipeError):
+                    pass
+                worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join(timeout=1)
+        finally:
+            worker.conn.close()
+            with self._lock:
+                self._spawned -= 1
+            self.stats["workers_recycled"] += 1
+            log.info("ytdlp_worker_pool:worker_stopped",
+                     pid=worker.process.pid, reason=reason, jobs_done=worker.jobs_done)
+
+    def _checkout(self) -> _Worker:
+        self._available.acquire()
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                self._spawned -= 1
+                worker.conn.close()
+            self._spawned += 1
+        try:
+            return self._spawn_worker()
+        except Exception:
+            with self._lock:
+                self._spawned -= 1
+            self._available.release()
+            raise
+
+    def _checkin(self, worker: _Worker) -> None:
+        try:
+            if self._closed or worker.jobs_done >= self.max_jobs_per_worker:
+                self._stop_worker(worker, "closed" if self._closed else "max_jobs")
+            else:
+                with self._lock:
+                    self._idle.append(worker)
+        finally:
+            self._available.release()
+
+    def _run_job(self, youtube_url: str, args: List[str], timeout: float) -> Optional[dict]:
+        if self._closed:
+            raise RuntimeError("yt-dlp worker pool is shut down")
+
+        worker = self._checkout()
+        healthy = False
+        try:
+            worker.conn.send((youtube_url, list(args)))
+            if not worker.conn.poll(timeout):
+                self.stats["jobs_timed_out"] += 1
+                raise YtDlpJobTimeout(f"yt-dlp job timed out after {timeout}s")
+            status, payload = worker.conn.recv()
+            healthy = True
+        except (EOFError, OSError) as e:
+            self.stats["jobs_failed"] += 1
+            raise YtDlpExtractionError(f"yt-dlp worker died: {e}")
+        finally:
+            worker.jobs_done += 1
+            if healthy:
+                self._checkin(worker)
+            else:
+                # A hung or broken worker cannot be reused; replace it lazily.
+                try:
+                    self._stop_worker(worker, "unhealthy")
+                finally:
+                    self._available.release()
+
+        if status == "error":
+            self.stats["jobs_failed"] += 1
+            raise YtDlpExtractionError(payload)
+        self.stats["jobs_completed"] += 1
+        return payload
+
+    async def extract(
+        self, youtube_url: str, args: List[str], timeout: Optional[float] = None
+    ) -> Optional[dict]:
+        """Resolve ``youtube_url`` with the given yt-dlp CLI args in a pooled worker."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._run_job, youtube_url, args, timeout or self.job_timeout
+        )
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers are stopped when their job returns."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._stop_worker(worker, "shutdown")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "size": self.size,
+            "idle_workers": len(self._idle),
+            "live_workers": self._spawned,
+            "job_timeout": self.job_timeout,
+            "max_jobs_per_worker": self.max_jobs_per_worker,
+        }
+
+
+# Global pool instance; workers are spawned lazily on first job
+ytdlp_worker_pool = YtDlpWorkerPool(
+    size=settings.YTDLP_WORKER_POOL_SIZE,
+    job_timeout=settings.YTDLP_WORKER_JOB_TIMEOUT_SECONDS,
+    max_jobs_per_worker=settings.YTDLP_WORKER_MAX_JOBS,
+)
+atexit.register(ytdlp_worker_pool.shutdown)
@@ -9,8 +9,9 @@ from app.services.music_keyword_service import MusicKeywordService
 from app.services.music_suggestion_service import MusicSuggestionService
 from app.schemas.motivational_quote import MotivationalQuoteCreate
 from app.schemas.audio import AudioTrackCreate
-from youtubesearchpython import VideosSearch
+from app.core.lazy import LazyImport
 import asyncio
+import datetime
 import structlog
 from typing import Optional
 import random
@@ -18,6 +19,8 @@ from app.core.config import settings
 
 log = structlog.get_logger(__name__)
 
+VideosSearch = LazyImport("youtubesearchpython", "VideosSearch")  # Pulls in httpx and yt-dlp
+
 async def run_music_generation_flow(user_id: Optional[int] = None):
     """
     Menjalankan alur untuk menghasilkan rekomendasi musik
@@ -27,20 +30,6 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
     try:
         log.info("music_generation_flow:start", user_id=user_id)
         
-        # Clean up old failed tracks (keep only last 5 failed tracks)
-        failed_tracks = (
-            db.query(models.MusicTrack)
-            .filter(models.MusicTrack.status == 'failed')
-            .order_by(models.MusicTrack.created_at.desc())
-            .offset(5)  # Keep newest 5 failed tracks
-            .all()
-        )
-        if failed_tracks:
-            for track in failed_tracks:
-                db.delete(track)
-            db.commit()
-            log.info("music_generation_flow:cleaned_old_failed_tracks", count=len(failed_tracks))
-
         # Get journals with optional user filter
         journal_query = db.query(models.Journal).order_by(models.Journal.created_at.desc())
         if user_id:
@@ -72,7 +61,7 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
             return "No keyword generated."
 
         # Ambil lagu terbaru sebelum generate
-        prev_track = db.query(models.MusicTrack).order_by(models.MusicTrack.created_at.desc()).first()
+        prev_track = crud.music_track.get_latest(db, owner_id=user_id)
         prev_youtube_id = prev_track.youtube_id if prev_track else None
 
         max_suggestion_attempts = 5  # Increase attempts for better variety
@@ -80,9 +69,19 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
         found_valid_track = False
         final_track_data = None
         
+        # The keyword response already holds ranked recommendations, so the
+        # first attempt consumes them without another LLM call.
+        suggestion_service = MusicSuggestionService(settings=settings)
+        candidates = await suggestion_service.parse_music_keywords_to_suggestions(
+            '\n'.join(keyword_service.extract_recommendations(keyword, journals, count=5))
+        )
+        tried_titles = [prev_track.title] if prev_track and prev_track.title else []
+        
         # Buat entry dengan status 'generating' untuk tracking
         from app.models.music_track import MusicTrack
-        temp_track = MusicTrack(title="Generating...", youtube_id="", artist="", status="generating")
+        temp_track = MusicTrack(
+            owner_id=user_id, title="Generating...", youtube_id="", artist="", status="generating"
+        )
         db.add(temp_track)
         db.commit()
         db.refresh(temp_track)
@@ -93,27 +92,12 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
             log.info("music_generation_flow:attempt", attempt=suggestion_attempt + 1, max_attempts=max_suggestion_attempts)
             
             try:
-                # Get diverse suggestions using enhanced AI response
-                suggestion_service = MusicSuggestionService(settings=settings)
-                
-                # Use enhanced keyword service to get AI recommendations
-                ai_recommendations = await keyword_service.generate_diverse_recommendations(
-                    journals, user_profile, count=5
-                )
-                
-                # Parse AI recommendations into structured suggestions
-                suggestions = await suggestion_service.parse_music_keywords_to_suggestions(
-                    '\n'.join(ai_recommendations)
-                )
-                
-                # Fallback to traditional suggestion if AI parsing fails
-                if not suggestions:
-                    previous_titles = []
-                    if prev_track and prev_track.title:
-                        previous_titles.append(prev_track.title)
-                    
+                if candidates:
+                    suggestions, candidates = candidates, []
+                else:
+                    # Candidates exhausted: ask the LLM for fresh ones, avoiding what was tried
                     suggestions = await suggestion_service.suggest_diverse_songs(
-                        keyword, count=3, avoid_titles=previous_titles
+                        keyword, count=5, avoid_titles=tried_titles
                     )
                     
                     if not suggestions:
@@ -121,6 +105,7 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
                         single_suggestion = await suggestion_service.suggest_song(keyword)
                         suggestions = [single_suggestion] if single_suggestion else []
                 
+                suggestions = [s for s in suggestions if s.title not in tried_titles]
                 if not suggestions:
                     log.warn("music_generation_flow:no_suggestions", attempt=suggestion_attempt + 1)
                     suggestion_attempt += 1
@@ -128,13 +113,7 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
 
                 # Try each suggestion until we find one that works
                 for suggestion_idx, suggestion in enumerate(suggestions):
-                    log.info("music_generation_flow:trying_suggestion", 
-                            suggestion_idx=suggestion_idx + 1,
-                            title=suggestion.title,
-                            artist=suggestion.artist)
-
-                # Try each suggestion until we find one that works
-                for suggestion_idx, suggestion in enumerate(suggestions):
+                    tried_titles.append(suggestion.title)
                     log.info("music_generation_flow:trying_suggestion", 
                             suggestion_idx=suggestion_idx + 1,
                             title=suggestion.title,
@@ -202,9 +181,13 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
                         
                         # Use intelligent extraction for better success rates
                         log.info("music_generation_flow:using_intelligent_extraction", youtube_id=youtube_id)
-                        audio_info = await stealth_youtube_extractor.adaptive_extraction_with_intelligence(
+                        # Queued under the user, so one user's burst can't starve the others
+                        audio_info = await stealth_youtube_extractor.extract_audio_url(
                             youtube_url,
-                            use_proxy=False  # Start without proxy, will escalate if needed
+                            use_cache=False,
+                            use_proxy=False,  # Start without proxy, will escalate if needed
+                            tenant=user_id,
+                            adaptive=True
                         )
                         
                     except Exception as e:
@@ -223,9 +206,12 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
                                 # Force session rotation on bot detection
                                 stealth_youtube_extractor.rotate_session_parameters()
                                 
-                                audio_info = await stealth_youtube_extractor.adaptive_extraction_with_intelligence(
+                                audio_info = await stealth_youtube_extractor.extract_audio_url(
                                     youtube_url,
-                                    use_proxy=True    # Use proxy with intelligent strategies
+                                    use_cache=False,
+                                    use_proxy=True,   # Use proxy with intelligent strategies
+                                    tenant=user_id,
+                                    adaptive=True
                                 )
                                 
                                 log.info("music_generation_flow:intelligent_proxy_retry_success", youtube_id=youtube_id)
@@ -254,7 +240,8 @@ async def run_music_generation_flow(user_id: Optional[int] = None):
                                     youtube_url,
                                     stealth_mode=True,
                                     use_cache=False,
-                                    use_proxy=False
+                                    use_proxy=False,
+                                    tenant=user_id
                                 )
                                 log.info("music_generation_flow:basic_fallback_success", youtube_id=youtube_id)
                             except Exception:
@@ -330,6 +317,48 @@ async def generate_quote_task():
     # ...
     pass
 
+@celery_app.task
+def cleanup_failed_tracks_task() -> int:
+    """Periodic maintenance: bulk-delete failed music tracks past the retention policy."""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(
+            hours=settings.FAILED_TRACK_RETENTION_HOURS
+        )
+        removed = crud.music_track.delete_failed(
+            db, keep_latest=settings.FAILED_TRACK_RETENTION_COUNT, older_than=cutoff
+        )
+        log.info("celery_task:cleaned_failed_tracks", removed=removed)
+        return removed
+    finally:
+        db.close()
+
+@celery_app.task
+def refill_ready_track_pool_task() -> dict:
+    """Periodic maintenance: top up the per-mood pool of ready-to-play tracks."""
+    from app.services.ready_track_pool_service import ready_track_pool
+
+    db = SessionLocal()
+    try:
+        added = asyncio.run(ready_track_pool.refill(db))
+        log.info("celery_task:refilled_ready_track_pool", added=added)
+        return added
+    finally:
+        db.close()
+
+@celery_app.task
+def refresh_radio_stations_task() -> dict:
+    """Periodic maintenance: precompute the next playlist rotation for every radio category."""
+    from app.services.radio_station_service import RadioStationService
+
+    db = SessionLocal()
+    try:
+        refreshed = asyncio.run(RadioStationService().refresh_all(db))
+        log.info("celery_task:refreshed_radio_stations", refreshed=refreshed)
+        return refreshed
+    finally:
+        db.close()
+
 @celery_app.task
 async def generate_music_recommendation_task():
     log.info("celery_task:starting_music_generation")
@@ -0,0 +1,78 @@
+"""Measure per-request authentication overhead in ``get_current_user``.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_auth --runs 5000
+
+Each run opens a session, authenticates a bearer token and closes the
+session, as a request does. ``jwt only`` is the token decode alone.
+``no cache`` adds the ``crud.user.get`` query that used to run on every
+request. ``cache`` serves the user from ``crud.user.cache``. The database is
+a local SQLite file, so a networked Postgres makes the query cost larger.
+"""
+
+import argparse
+import tempfile
+import time
+
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base_class import Base
+from app.dependencies import get_current_user
+from app.models.user import User
+
+
+def timed(func, runs: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5000)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session_local = sessionmaker(bind=engine)
+        db = session_local()
+        db.add(User(id=1, username="bench", email="bench@example.com", hashed_password="x"))
+        db.commit()
+        db.close()
+        token = create_access_token(1)
+
+        def request() -> None:
+            db = session_local()
+            try:
+                get_current_user(db, token)
+            finally:
+                db.close()
+
+        cache = crud.user.cache
+        ttl = cache.ttl_seconds
+        paths = {
+            "jwt only": lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+            "no cache": request,
+            "cache": request,
+        }
+        for label, func in paths.items():
+            cache.ttl_seconds = ttl if label == "cache" else 0
+            cache.clear()
+            us = timed(func, opts.runs)
+            print(f"{label:<10} {us:8.1f}us/request")
+        cache.ttl_seconds = ttl
+        print(f"cache stats: {cache.get_stats()}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
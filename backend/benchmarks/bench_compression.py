@@ -0,0 +1,93 @@
+"""Measure response compression throughput and event-loop stalls.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_compression --items 2000 --runs 20
+
+Prints MB/s and compression ratio per encoding for a journal-list-shaped
+JSON payload, then the worst event-loop stall while ``CompressionMiddleware``
+compresses that payload inline versus offloaded to a thread.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import time
+
+from app.core.compression import CompressionMiddleware, available_encoders
+
+
+def make_payload(items: int) -> bytes:
+    now = datetime.datetime(2025, 1, 1)
+    return json.dumps([
+        {
+            "id": i,
+            "title": f"Journal entry {i}",
+            "content": "Hari ini aku merasa cukup tenang, walau pekerjaan menumpuk. " * 6,
+            "created_at": (now + datetime.timedelta(hours=i)).isoformat(),
+            "emotion": ["senang", "sedih", "cemas", "tenang"][i % 4],
+        }
+        for i in range(items)
+    ]).encode()
+
+
+def bench_encoders(payload: bytes, runs: int) -> None:
+    size_mb = len(payload) / (1024 * 1024)
+    print(f"payload {len(payload) / 1024:.0f} KiB")
+    for name, encoder in available_encoders().items():
+        start = time.perf_counter()
+        for _ in range(runs):
+            compressed = encoder.compress(payload)
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"{name:<5} {size_mb / elapsed:8.1f} MB/s  {elapsed * 1000:7.2f}ms/op  "
+              f"ratio={len(payload) / len(compressed):5.1f}x")
+
+
+async def max_loop_stall(payload: bytes, offload_size: int, encoding: str, runs: int) -> float:
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": payload})
+
+    async def send(message):
+        pass
+
+    middleware = CompressionMiddleware(app, offload_size=offload_size)
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - before - 0.001)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    for _ in range(runs):
+        await middleware(scope, None, send)
+        await asyncio.sleep(0.002)  # Let the ticker observe each request separately
+    done = True
+    await tick
+    return worst * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    opts = parser.parse_args()
+
+    payload = make_payload(opts.items)
+    bench_encoders(payload, opts.runs)
+    for encoding in available_encoders():
+        inline = await max_loop_stall(payload, len(payload) + 1, encoding, opts.runs)
+        offloaded = await max_loop_stall(payload, 1, encoding, opts.runs)
+        print(f"{encoding:<5} worst loop stall inline={inline:7.2f}ms offloaded={offloaded:7.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""Compare peak memory of the streaming export with building it in one go.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_export --journals 20000 --chats 20000
+
+``list`` loads every row through the ORM and serializes the whole document,
+as a plain JSON endpoint would. ``stream`` is ``iter_user_export``, which
+reads ``--batch`` rows at a time from the cursor. Peak memory is measured
+with tracemalloc while the output is consumed and discarded.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, schemas
+from app.core.responses import dumps
+from app.db.base_class import Base
+from app.models.chat import ChatMessage, SenderType
+from app.models.journal import Journal
+from app.models.user import User
+from app.services.export_service import gzip_chunks, iter_user_export
+
+
+def seed(session_local, journals: int, chats: int) -> None:
+    db = session_local()
+    db.add(User(id=1, username="bench", email="bench@example.com", hashed_password="x"))
+    db.bulk_save_objects(
+        Journal(title=f"Journal {i}", content="Hari ini aku merasa cukup tenang. " * 20,
+                mood="tenang", owner_id=1)
+        for i in range(journals)
+    )
+    db.bulk_save_objects(
+        ChatMessage(content="Terima kasih sudah bercerita. " * 4,
+                    sender_type=SenderType.AI if i % 2 else SenderType.USER, owner_id=1)
+        for i in range(chats)
+    )
+    db.commit()
+    db.close()
+
+
+def load_all(db) -> bytes:
+    journals = crud.journal.get_multi_by_owner(db, owner_id=1, limit=None)
+    chats = crud.chat_message.get_multi_by_owner(db, owner_id=1, limit=None)
+    return dumps({
+        "journals": [schemas.JournalInDB.model_validate(j) for j in journals],
+        "chat_messages": [schemas.ChatMessage.model_validate(c) for c in chats],
+    })
+
+
+def measure(session_local, label: str, produce) -> None:
+    db = session_local()
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = 0
+    for chunk in produce(db):
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    print(f"{label:<12} {elapsed:7.2f}s  peak {peak / 2**20:8.1f}MB  output {size / 2**20:7.1f}MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--journals", type=int, default=20000)
+    parser.add_argument("--chats", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=500)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session_local = sessionmaker(bind=engine)
+        seed(session_local, opts.journals, opts.chats)
+
+        measure(session_local, "list", lambda db: [load_all(db)])
+        measure(session_local, "stream", lambda db: iter_user_export(db, 1, opts.batch))
+        measure(session_local, "stream+gzip",
+                lambda db: gzip_chunks(iter_user_export(db, 1, opts.batch)))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Simulate a heavy user's burst against light users in the request queue.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_fair_queue --burst 60 --light-users 10 --job-ms 20
+
+The heavy user enqueues ``--burst`` jobs at once, then each light user
+enqueues one job. With fair queuing, light users wait for roughly one job per
+busy tenant. Without it (every job under one tenant), they wait for the
+whole burst.
+"""
+
+import argparse
+import asyncio
+import statistics
+
+import structlog
+
+from app.core.request_queue import RequestQueue
+
+
+async def simulate(fair: bool, burst: int, light_users: int, job_ms: float, workers: int) -> dict:
+    queue = RequestQueue(max_workers=workers, max_queue_size=burst + light_users)
+
+    async def job():
+        await asyncio.sleep(job_ms / 1000)
+
+    heavy = [
+        await queue.add_request(job, tenant="heavy" if fair else None)
+        for _ in range(burst)
+    ]
+    light = [
+        await queue.add_request(job, tenant=f"light-{i}" if fair else None)
+        for i in range(light_users)
+    ]
+    await asyncio.gather(*(j.result(timeout=None) for j in heavy + light))
+
+    light_waits = [j.queue_time * 1000 for j in light]
+    heavy_waits = [j.queue_time * 1000 for j in heavy]
+    return {
+        "light_max": max(light_waits),
+        "light_mean": statistics.mean(light_waits),
+        "heavy_max": max(heavy_waits),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=60)
+    parser.add_argument("--light-users", type=int, default=10)
+    parser.add_argument("--job-ms", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=3)
+    opts = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    for fair in (False, True):
+        result = await simulate(fair, opts.burst, opts.light_users, opts.job_ms, opts.workers)
+        print(f"{'fair' if fair else 'fifo':<5} light wait max={result['light_max']:7.1f}ms "
+              f"mean={result['light_mean']:7.1f}ms | heavy wait max={result['heavy_max']:7.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
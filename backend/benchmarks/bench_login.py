@@ -0,0 +1,85 @@
+"""Measure a login burst's throughput and its effect on other sync endpoints.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_login --logins 120 --rounds 10
+
+``threadpool`` verifies each password through ``anyio.to_thread`` (how sync
+endpoints ran bcrypt before). ``pool`` awaits ``PasswordHasher.verify``.
+While the burst runs, a probe stands in for every other sync endpoint: every
+20ms it runs a no-op in the anyio threadpool and records how long it waited
+for a thread.
+"""
+
+import argparse
+import asyncio
+import time
+
+import anyio.to_thread
+from passlib.context import CryptContext
+
+from app.core.password_hasher import PasswordHasher
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def run(label: str, verify, logins: int) -> None:
+    probe_waits = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await anyio.to_thread.run_sync(lambda: None)
+            probe_waits.append(time.perf_counter() - start)
+            await asyncio.sleep(0.02)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    assert all(results)
+    print(
+        f"{label:<11} {logins / elapsed:7.1f} logins/s  "
+        f"probe p50 {percentile(probe_waits, 0.5) * 1000:7.1f}ms  "
+        f"p95 {percentile(probe_waits, 0.95) * 1000:7.1f}ms  "
+        f"max {max(probe_waits) * 1000:7.1f}ms"
+    )
+
+
+async def main_async(opts) -> None:
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=opts.rounds)
+    hashed = context.hash("secret")
+
+    await run(
+        "threadpool",
+        lambda: anyio.to_thread.run_sync(context.verify, "secret", hashed),
+        opts.logins,
+    )
+
+    hasher = PasswordHasher(max_workers=opts.workers, max_pending=opts.logins, rounds=opts.rounds)
+    await hasher.verify("secret", hashed)  # Start the worker processes
+
+    async def pooled():
+        matches, _ = await hasher.verify("secret", hashed)
+        return matches
+
+    await run("pool", pooled, opts.logins)
+    hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=120)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
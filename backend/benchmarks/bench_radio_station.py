@@ -0,0 +1,76 @@
+"""Measure radio station build latency with simulated LLM and search latency.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_radio_station --runs 20 --llm-ms 1500 --search-ms 400
+
+The previous implementation made one ``suggest_song`` call plus one search per
+track, serially; its expected cost is printed for comparison.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import app.services.radio_station_service as radio_module
+from app.core.config import settings
+from app.schemas.song import SongSuggestion
+from app.services.radio_station_service import RadioStationService
+
+
+class FakeSuggestionService:
+    def __init__(self, llm_ms: float):
+        self.llm_ms = llm_ms
+
+    async def suggest_diverse_songs(self, keyword, count=3, avoid_titles=None):
+        await asyncio.sleep(self.llm_ms / 1000)
+        return [SongSuggestion(title=f"Song {i}", artist="Artist") for i in range(count)]
+
+
+def make_search(search_ms: float):
+    class FakeSearch:
+        def __init__(self, query, limit=1):
+            time.sleep(search_ms / 1000)
+            self.query = query
+
+        def result(self):
+            return {"result": [{"id": self.query}]}
+
+    return FakeSearch
+
+
+def summarize(name: str, samples: list) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{name:<12} n={len(samples):<3} mean={statistics.mean(samples):8.1f}ms "
+          f"median={statistics.median(samples):8.1f}ms p95={p95:8.1f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--llm-ms", type=float, default=1500)
+    parser.add_argument("--search-ms", type=float, default=400)
+    opts = parser.parse_args()
+
+    radio_module.VideosSearch = make_search(opts.search_ms)
+    service = RadioStationService()
+    suggestion_service = FakeSuggestionService(opts.llm_ms)
+
+    totals, stages = [], {"suggest": [], "search": []}
+    for _ in range(opts.runs):
+        _, timings = await service.build_station("jazz", suggestion_service=suggestion_service)
+        totals.append(timings["total"])
+        for stage in stages:
+            stages[stage].append(timings[stage])
+
+    serial = settings.RADIO_STATION_SIZE * (opts.llm_ms + opts.search_ms)
+    print(f"{'serial est.':<12} {serial:8.1f}ms ({settings.RADIO_STATION_SIZE} x (LLM + search))")
+    for stage, samples in stages.items():
+        summarize(stage, samples)
+    summarize("total", totals)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
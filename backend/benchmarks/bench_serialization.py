@@ -0,0 +1,97 @@
+"""Compare JSON serialization paths on journal and chat list payloads.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_serialization --items 200 --runs 200
+
+``stdlib`` is FastAPI's encoding for routes without a response model
+(``jsonable_encoder`` + ``json.dumps``), which ``SafeResponseHandler`` also
+used. ``orjson`` is ``ORJSONResponse``, now used for those routes.
+``pydantic`` is FastAPI's path for routes with a response model, which
+``ORJSONRoute`` leaves in place.
+"""
+
+import argparse
+import datetime
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import ORJSONResponse
+from app.models.chat import SenderType
+from app.schemas.chat import ChatMessage
+from app.schemas.journal import JournalInDB
+
+
+def make_journals(items: int) -> list:
+    now = datetime.datetime(2025, 1, 1)
+    return [
+        JournalInDB(
+            id=i,
+            owner_id=1,
+            title=f"Journal {i}",
+            content="Hari ini aku merasa cukup tenang, walau pekerjaan menumpuk. " * 6,
+            mood="tenang",
+            created_at=now + datetime.timedelta(hours=i),
+            sentiment_score=0.42,
+            sentiment_label="positive",
+        )
+        for i in range(items)
+    ]
+
+
+def make_chats(items: int) -> list:
+    now = datetime.datetime(2025, 1, 1)
+    return [
+        ChatMessage(
+            id=i,
+            owner_id=1,
+            content="Terima kasih sudah bercerita. Apa yang paling kamu rasakan?",
+            sender_type=SenderType.AI if i % 2 else SenderType.USER,
+            ai_technique="reflection" if i % 2 else None,
+            created_at=now + datetime.timedelta(minutes=i),
+            is_flagged=False,
+        )
+        for i in range(items)
+    ]
+
+
+def timed(func, runs: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def bench(name: str, models: list, runs: int) -> None:
+    adapter = TypeAdapter(list[type(models[0])])
+    as_dicts = adapter.dump_python(models)
+    paths = {
+        "stdlib models": lambda: json.dumps(jsonable_encoder(models)).encode(),
+        "stdlib dicts": lambda: json.dumps(jsonable_encoder(as_dicts)).encode(),
+        "orjson models": lambda: ORJSONResponse(models).body,
+        "orjson dicts": lambda: ORJSONResponse(as_dicts).body,
+        "pydantic": lambda: adapter.dump_json(models),
+    }
+    baseline = None
+    for label, func in paths.items():
+        ms = timed(func, runs)
+        baseline = baseline or ms
+        print(f"{name:<8} {label:<14} {ms:8.3f}ms  {baseline / ms:5.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=200)
+    opts = parser.parse_args()
+
+    bench("journals", make_journals(opts.items), opts.runs)
+    bench("chats", make_chats(opts.items), opts.runs)
+
+
+if __name__ == "__main__":
+    main()
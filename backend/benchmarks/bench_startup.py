@@ -0,0 +1,56 @@
+"""Measure how long a fresh worker process takes to import the API.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_startup --runs 10
+
+``lazy`` is ``import app.main`` as a Gunicorn worker does on boot or after
+``max_requests`` recycling without ``preload_app``. ``eager`` also imports the
+modules that are now loaded on first use, which is what boot used to cost.
+Each run is a new interpreter, so nothing is cached in-process.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+EAGER_MODULES = (
+    "youtubesearchpython",
+    "app.tasks",
+    "app.services.stealth_youtube_extractor",
+    "passlib.context",
+    "sentry_sdk",
+)
+
+
+def boot(code: str, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    opts = parser.parse_args()
+
+    paths = {
+        "baseline": "pass",
+        "lazy": "import app.main",
+        "eager": "import app.main; " + "; ".join(f"import {m}" for m in EAGER_MODULES),
+    }
+    for label, code in paths.items():
+        samples = boot(code, opts.runs)
+        print(
+            f"{label:<9} median {statistics.median(samples) * 1000:7.0f}ms  "
+            f"min {min(samples) * 1000:7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare yt-dlp subprocess-per-call against the persistent worker pool.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_ytdlp_pool --jobs 10
+    python -m benchmarks.bench_ytdlp_pool --url "https://www.youtube.com/watch?v=..."
+
+Without ``--url`` every job resolves an invalid URL, which fails right after
+yt-dlp has started, so the numbers isolate process start + import overhead.
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import time
+
+from app.services.ytdlp_worker_pool import YtDlpExtractionError, YtDlpWorkerPool
+
+ARGS = ["--no-warnings", "--quiet", "-f", "bestaudio", "--no-playlist",
+        "--skip-download", "--print-json"]
+
+
+def run_subprocess(url: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(["yt-dlp", *ARGS, url], capture_output=True, text=True, timeout=120)
+    return time.perf_counter() - start
+
+
+async def run_pool(pool: YtDlpWorkerPool, url: str) -> float:
+    start = time.perf_counter()
+    try:
+        await pool.extract(url, ARGS)
+    except YtDlpExtractionError:
+        pass
+    return time.perf_counter() - start
+
+
+def summarize(name: str, samples: list) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{name:<12} n={len(samples):<3} mean={statistics.mean(samples) * 1000:8.1f}ms "
+          f"median={statistics.median(samples) * 1000:8.1f}ms p95={p95 * 1000:8.1f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=10)
+    parser.add_argument("--url", default="not-a-valid-url")
+    parser.add_argument("--pool-size", type=int, default=1)
+    opts = parser.parse_args()
+
+    subprocess_samples = [run_subprocess(opts.url) for _ in range(opts.jobs)]
+    summarize("subprocess", subprocess_samples)
+
+    pool = YtDlpWorkerPool(size=opts.pool_size, max_jobs_per_worker=10_000)
+    try:
+        warmup = await run_pool(pool, opts.url)
+        print(f"{'pool warmup':<12} {warmup * 1000:8.1f}ms (worker spawn + yt-dlp import)")
+        pool_samples = [await run_pool(pool, opts.url) for _ in range(opts.jobs)]
+        summarize("pool", pool_samples)
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
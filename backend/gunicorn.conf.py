@@ -55,6 +55,11 @@ def pre_fork(server, worker):
 def post_fork(server, worker):
     """After forking worker"""
     server.log.info("Worker spawned (pid: %s)", worker.pid)
+    # With preload_app the engine was created in the master; never share its
+    # pooled connections between workers.
+    from app.db.session import dispose_engine_after_fork
+
+    dispose_engine_after_fork()
 
 def worker_abort(worker):
     """Handle worker abort"""
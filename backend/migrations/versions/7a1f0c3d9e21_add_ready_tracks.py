@@ -0,0 +1,44 @@
+"""add_ready_tracks
+
+Revision ID: 7a1f0c3d9e21
+Revises: 2c23188ada2a
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1f0c3d9e21'
+down_revision: Union[str, Sequence[str], None] = '2c23188ada2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'readytracks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('mood', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('artist', sa.String(), nullable=True),
+        sa.Column('youtube_id', sa.String(), nullable=False),
+        sa.Column('stream_url', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_readytracks_id'), 'readytracks', ['id'], unique=False)
+    op.create_index(op.f('ix_readytracks_mood'), 'readytracks', ['mood'], unique=False)
+    op.create_index(op.f('ix_readytracks_created_at'), 'readytracks', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_readytracks_created_at'), table_name='readytracks')
+    op.drop_index(op.f('ix_readytracks_mood'), table_name='readytracks')
+    op.drop_index(op.f('ix_readytracks_id'), table_name='readytracks')
+    op.drop_table('readytracks')
@@ -0,0 +1,39 @@
+"""add_radio_stations
+
+Revision ID: b8e24d61f0a7
+Revises: 7a1f0c3d9e21
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e24d61f0a7'
+down_revision: Union[str, Sequence[str], None] = '7a1f0c3d9e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'radiostations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('tracks', sa.JSON(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_radiostations_id'), 'radiostations', ['id'], unique=False)
+    op.create_index(op.f('ix_radiostations_category'), 'radiostations', ['category'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_radiostations_category'), table_name='radiostations')
+    op.drop_index(op.f('ix_radiostations_id'), table_name='radiostations')
+    op.drop_table('radiostations')
@@ -0,0 +1,41 @@
+"""add_content_versions
+
+Revision ID: c3f9a2e7d514
+Revises: b8e24d61f0a7
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a2e7d514'
+down_revision: Union[str, Sequence[str], None] = 'b8e24d61f0a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table = op.create_table(
+        'contentversions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    # Seed the counters so concurrent first writers only ever UPDATE
+    now = datetime.datetime.utcnow()
+    op.bulk_insert(table, [
+        {'name': name, 'version': 1, 'updated_at': now}
+        for name in ('home-feed', 'quotes', 'articles')
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('contentversions')
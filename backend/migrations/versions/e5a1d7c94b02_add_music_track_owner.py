@@ -0,0 +1,57 @@
+"""add_music_track_owner
+
+Revision ID: e5a1d7c94b02
+Revises: c3f9a2e7d514
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1d7c94b02'
+down_revision: Union[str, Sequence[str], None] = 'c3f9a2e7d514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode: SQLite can't ALTER constraints, so the table is copied there
+    with op.batch_alter_table('musictracks') as batch_op:
+        batch_op.add_column(sa.Column('owner_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_musictracks_owner_id_users', 'users', ['owner_id'], ['id'], ondelete='CASCADE',
+        )
+        batch_op.create_index(
+            'ix_musictracks_owner_id_created_at', ['owner_id', 'created_at']
+        )
+    # The home feed is now versioned per user ('music', 'music:<id>', 'quotes')
+    versions = sa.table(
+        'contentversions',
+        sa.column('name', sa.String),
+        sa.column('version', sa.Integer),
+        sa.column('updated_at', sa.DateTime),
+    )
+    op.execute(
+        versions.update()
+        .where(versions.c.name == 'home-feed')
+        .values(name='music', updated_at=datetime.datetime.utcnow())
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    versions = sa.table('contentversions', sa.column('name', sa.String))
+    op.execute(versions.delete().where(versions.c.name.like('music:%')))
+    op.execute(
+        versions.update().where(versions.c.name == 'music').values(name='home-feed')
+    )
+    with op.batch_alter_table('musictracks') as batch_op:
+        batch_op.drop_index('ix_musictracks_owner_id_created_at')
+        batch_op.drop_constraint('fk_musictracks_owner_id_users', type_='foreignkey')
+        batch_op.drop_column('owner_id')
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app import crud
 from app.main import app
 from app.dependencies import get_db, get_current_user
 from app.db.base_class import Base
@@ -21,6 +22,8 @@ def temp_session(tmp_path):
     )
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Every test database starts at user id 1
+    crud.user.cache.clear()
     yield TestingSessionLocal
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
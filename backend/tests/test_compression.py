@@ -0,0 +1,124 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+brotli = pytest.importorskip("brotli")
+zstandard = pytest.importorskip("zstandard")
+
+PAYLOAD = json.dumps([{"id": i, "content": "dear diary " * 5} for i in range(200)]).encode()
+
+
+def make_app(chunks, content_type=b"application/json", extra_headers=()):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type), *extra_headers]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk,
+                        "more_body": i < len(chunks) - 1})
+    return app
+
+
+async def call(app, accept_encoding=None, **options):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await CompressionMiddleware(app, **options)({"type": "http", "headers": headers}, receive, send)
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+def test_negotiation_follows_q_values_then_server_preference():
+    supported = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, deflate, br", supported) == "br"
+    assert negotiate_encoding("gzip, br;q=0.5", supported) == "gzip"
+    assert negotiate_encoding("*", supported) == "zstd"
+    assert negotiate_encoding("br;q=0, gzip;q=0", supported) is None
+    assert negotiate_encoding("identity", supported) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding, decode", [
+    ("gzip", gzip.decompress),
+    ("br", lambda body: brotli.decompress(body)),
+    ("zstd", lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body)),
+])
+async def test_complete_body_is_compressed(encoding, decode):
+    headers, body = await call(make_app([PAYLOAD]), encoding, offload_size=1)
+
+    assert headers["content-encoding"] == encoding
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(body) < len(PAYLOAD)
+    assert decode(body) == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_is_compressed_per_chunk():
+    chunks = [PAYLOAD[i:i + 500] for i in range(0, len(PAYLOAD), 500)]
+    headers, body = await call(make_app(chunks), "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert zlib.decompress(body, 31) == PAYLOAD
+
+
+def test_interleaved_zstd_bodies_stay_independent():
+    # One middleware serves many requests at once, on several threads
+    encoder = CompressionMiddleware(None).encoders["zstd"]
+    first, second = encoder.stream(), encoder.stream()
+    outputs = [b"", b""]
+    chunks = [PAYLOAD[i:i + 500] for i in range(0, len(PAYLOAD), 500)]
+    for chunk in chunks:
+        outputs[0] += first.process(chunk)
+        one_shot = encoder.compress(PAYLOAD)
+        outputs[1] += second.process(chunk[::-1])
+    outputs[0] += first.finish()
+    outputs[1] += second.finish()
+
+    def decode(body):
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+    assert decode(outputs[0]) == PAYLOAD
+    assert decode(outputs[1]) == b"".join(chunk[::-1] for chunk in chunks)
+    assert decode(one_shot) == PAYLOAD
+
+
+PRECOMPRESSED = gzip.compress(PAYLOAD)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept, app, expected", [
+    (None, make_app([PAYLOAD]), PAYLOAD),
+    ("gzip", make_app([b'{"ok":true}']), b'{"ok":true}'),  # Below minimum_size
+    ("gzip", make_app([PAYLOAD], content_type=b"audio/mpeg"), PAYLOAD),
+    ("br", make_app([PRECOMPRESSED], extra_headers=[(b"content-encoding", b"gzip")]), PRECOMPRESSED),
+])
+async def test_passthrough(accept, app, expected):
+    headers, body = await call(app, accept)
+
+    assert body == expected
+    assert headers.get("content-encoding", "gzip") == "gzip"
+    assert int(headers["content-length"]) == len(body)
+
+
+@pytest.mark.asyncio
+async def test_strong_etag_is_weakened_when_encoded():
+    app = make_app([PAYLOAD], extra_headers=[(b"etag", b'"home-feed.3.1700000000"')])
+
+    encoded, _ = await call(app, "gzip")
+    identity, _ = await call(app, None)
+
+    assert encoded["etag"] == 'W/"home-feed.3.1700000000"'
+    assert identity["etag"] == '"home-feed.3.1700000000"'
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db.pool import InstrumentedQueuePool, pool_stats
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_records_checkouts_utilization_and_timeouts(engine):
+    first = engine.connect()
+    second = engine.connect()
+    stats = engine.pool.get_stats()
+    assert stats["capacity"] == 2
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["utilization"] == 1.0
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    first.close()
+    second.close()
+
+    stats = engine.pool.get_stats()
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["peak_utilization"] == 1.0
+    assert stats["checkout_wait_seconds"]["count"] == 2
+
+
+def test_dispose_without_close_leaves_parent_connections_alone(engine):
+    inherited = engine.connect()
+    old_pool = engine.pool
+
+    engine.dispose(close=False)  # What a forked worker does
+
+    assert engine.pool is not old_pool
+    assert engine.pool.get_stats()["checkouts"] == 0
+    assert inherited.execute(text("select 1")).scalar() == 1
+    with engine.connect() as fresh:
+        assert fresh.execute(text("select 1")).scalar() == 1
+    inherited.close()
+
+
+def test_stats_for_other_pools():
+    engine = create_engine("sqlite://")
+    assert pool_stats(engine.pool) == {"pool": "SingletonThreadPool"}
+    engine.dispose()
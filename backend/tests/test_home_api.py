@@ -52,3 +52,50 @@ def test_home_feed_without_music(client):
         data = resp.json()
         assert data["quote"]["id"] == quote.id
         assert data["music"] is None
+
+
+def test_home_feed_etag_revalidates_until_a_write(client):
+    client_app, session_local = client
+    db = session_local()
+    try:
+        crud.motivational_quote.create(
+            db, obj_in=schemas.MotivationalQuoteCreate(text="first", author="a")
+        )
+    finally:
+        db.close()
+
+    resp = client_app.get("/api/v1/home-feed")
+    etag = resp.headers["etag"]
+    assert resp.status_code == 200
+
+    cached = client_app.get("/api/v1/home-feed", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    # Compressed responses carry the weak form; it must still match
+    weak = client_app.get("/api/v1/home-feed", headers={"If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+
+    db = session_local()
+    try:
+        track = crud.music_track.create(
+            db,
+            obj_in=schemas.AudioTrackCreate(
+                title="t", youtube_id="y", artist="a", cover_url=None,
+                stream_url="https://example.com/a",
+            ),
+        )
+        after_insert = client_app.get("/api/v1/home-feed", headers={"If-None-Match": etag})
+        assert after_insert.status_code == 200
+        assert after_insert.headers["etag"] != etag
+
+        track.status = "generating"
+        db.commit()
+    finally:
+        db.close()
+
+    after_update = client_app.get(
+        "/api/v1/home-feed", headers={"If-None-Match": after_insert.headers["etag"]}
+    )
+    assert after_update.status_code == 200
+    assert after_update.json()["music_status"] == "generating"
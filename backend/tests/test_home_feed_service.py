@@ -0,0 +1,99 @@
+import json
+
+import fakeredis
+
+from app import crud, models, schemas
+from app.services.home_feed_service import HomeFeedSnapshotService, home_feed_versions
+
+
+def _add_quote(db, text):
+    return crud.motivational_quote.create(
+        db, obj_in=schemas.MotivationalQuoteCreate(text=text, author="a")
+    )
+
+
+def _add_track(db, title, owner_id=None):
+    track = models.MusicTrack(
+        title=title, youtube_id="y", artist="a", stream_url="https://example.com/a",
+        status="done", owner_id=owner_id,
+    )
+    db.add(track)
+    db.commit()
+    db.refresh(track)
+    return track
+
+
+def _etag(db, user_id):
+    return crud.content_version.get_etag(db, *home_feed_versions(user_id))
+
+
+def test_snapshot_is_built_once_per_write(temp_session):
+    service = HomeFeedSnapshotService()
+    db = temp_session()
+    try:
+        assert service.get(db, 1, _etag(db, 1)) == (204, b"")
+
+        _add_quote(db, "first")
+        etag = _etag(db, 1)
+        status_code, body = service.get(db, 1, etag)
+        assert status_code == 200
+        assert json.loads(body)["quote"]["text"] == "first"
+        assert service.get(db, 1, etag) == (status_code, body)
+        assert service.get_stats()["builds"] == 2
+        assert service.get_stats()["hits"] == 1
+
+        track = _add_track(db, "t")
+        assert json.loads(service.get(db, 1, _etag(db, 1))[1])["music"]["id"] == track.id
+        assert service.get_stats()["builds"] == 3
+    finally:
+        db.close()
+
+
+def test_feeds_are_per_user(temp_session):
+    service = HomeFeedSnapshotService()
+    db = temp_session()
+    try:
+        shared = _add_track(db, "shared")
+        etag_b = _etag(db, 2)
+        assert json.loads(service.get(db, 2, etag_b)[1])["music"]["id"] == shared.id
+
+        own = _add_track(db, "mine", owner_id=1)
+        # User 1's write leaves user 2's version, and cached feed, untouched
+        assert _etag(db, 2) == etag_b
+        assert json.loads(service.get(db, 1, _etag(db, 1))[1])["music"]["id"] == own.id
+        assert json.loads(service.get(db, 2, etag_b)[1])["music"]["id"] == shared.id
+        assert crud.music_track.get_latest(db, owner_id=2) is None
+    finally:
+        db.close()
+
+
+def test_local_snapshots_are_bounded(temp_session):
+    service = HomeFeedSnapshotService(max_users=2)
+    db = temp_session()
+    try:
+        _add_quote(db, "q")
+        for user_id in (1, 2, 3):
+            service.get(db, user_id, _etag(db, user_id))
+        assert service.get_stats()["local_users"] == 2
+        # User 1 was evicted first
+        service.get(db, 1, _etag(db, 1))
+        assert service.get_stats()["builds"] == 4
+    finally:
+        db.close()
+
+
+def test_redis_snapshot_is_shared_between_workers(temp_session):
+    redis = fakeredis.FakeRedis()
+    worker_a = HomeFeedSnapshotService(redis_client=redis)
+    worker_b = HomeFeedSnapshotService(redis_client=redis)
+    db = temp_session()
+    try:
+        _add_quote(db, "shared")
+        etag = _etag(db, 1)
+
+        assert worker_a.get(db, 1, etag) == worker_b.get(db, 1, etag)
+        assert worker_a.get_stats()["builds"] == 1
+        assert worker_b.get_stats()["builds"] == 0
+        assert worker_b.get_stats()["shared_hits"] == 1
+    finally:
+        db.close()
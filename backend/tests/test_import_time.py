@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Loaded on first use; importing one of them at boot shows up here
+LAZY_MODULES = (
+    "youtubesearchpython",
+    "yt_dlp",
+    "celery",
+    "app.celery_app",
+    "app.tasks",
+    "app.services.stealth_youtube_extractor",
+    "passlib",
+)
+
+
+def import_times(module: str):
+    """``-X importtime`` for ``module`` in a fresh interpreter: {name: (self_us, cumulative_us)}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_app_main_import_report():
+    times = import_times("app.main")
+
+    loaded = sorted(
+        name for name in times
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES)
+    )
+    assert not loaded, f"imported at boot: {loaded}"
+    if not os.getenv("SENTRY_DSN"):
+        assert "sentry_sdk" not in times
+
+    print("\nimport app.main: %.0fms" % (times["app.main"][1] / 1000))
+    app_modules = sorted(
+        ((cumulative, name) for name, (_, cumulative) in times.items() if name.startswith("app.")),
+        reverse=True,
+    )
+    for cumulative, name in app_modules[:10]:
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
@@ -108,3 +108,23 @@ def test_music_latest_endpoint_returns_track(client):
         assert data["title"] == "t"
         assert data["artist"] == "a"
         assert data["cover_url"] is None
+
+
+def test_quote_and_article_etags_are_independent(client):
+    client_app, session_local = client
+    quotes = client_app.get("/api/v1/quotes")
+    latest = client_app.get("/api/v1/quotes/latest")
+    articles = client_app.get("/api/v1/articles")
+    assert quotes.headers["etag"] == latest.headers["etag"]
+
+    db = session_local()
+    try:
+        crud.article.create(db, obj_in=schemas.ArticleCreate(title="t1", url="u1"))
+    finally:
+        db.close()
+
+    resp = client_app.get("/api/v1/quotes", headers={"If-None-Match": quotes.headers["etag"]})
+    assert resp.status_code == 304
+    resp = client_app.get("/api/v1/articles", headers={"If-None-Match": articles.headers["etag"]})
+    assert resp.status_code == 200
+    assert len(resp.json()) == 1
@@ -5,6 +5,7 @@ from app import crud, models
 from app.services.music_suggestion_service import MusicSuggestionService
 from app.schemas.song import SongSuggestion
 from app.core.config import settings
+from app.core.security import create_access_token
 
 
 @pytest.mark.asyncio
@@ -59,3 +60,174 @@ def test_music_recommend_returns_suggestions(client, monkeypatch):
     assert resp.json()["title"] == "t"
     assert captured["mood"] == "joy"
     assert captured["profile"] is not None
+
+
+def test_music_stream_resolves_on_demand(client, monkeypatch):
+    from app.services.stealth_youtube_extractor import stealth_youtube_extractor
+
+    calls = []
+
+    async def fake_extract(youtube_url, **kwargs):
+        calls.append((youtube_url, kwargs["tenant"]))
+        return {"audio_url": "https://rr1.googlevideo.com/videoplayback?expire=2000000000"}
+
+    monkeypatch.setattr(stealth_youtube_extractor, "extract_audio_url", fake_extract)
+
+    client_app, _ = client
+    resp = client_app.get(
+        "/api/v1/music/stream/dQw4w9WgXcQ",
+        headers={"Authorization": f"Bearer {create_access_token(7)}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["youtube_id"] == "dQw4w9WgXcQ"
+    assert data["stream_url"].endswith("expire=2000000000")
+    assert data["expires_at"].startswith("2033-05-18")
+    # Queued under the listener for fair scheduling
+    assert calls == [("https://www.youtube.com/watch?v=dQw4w9WgXcQ", 7)]
+
+    assert client_app.get("/api/v1/music/stream/dQw4w9WgXcQ").status_code == 200
+    assert calls[-1][1] is None
+
+
+def test_music_stream_rejects_invalid_id(client):
+    client_app, _ = client
+    resp = client_app.get("/api/v1/music/stream/not-an-id")
+    assert resp.status_code == 400
+
+
+def test_stream_cache_skips_urls_close_to_expiry():
+    import time
+    from app.services.stealth_youtube_extractor import StealthYouTubeExtractor
+
+    extractor = StealthYouTubeExtractor()
+    now = time.time()
+    extractor.cache["fresh"] = {"data": {"audio_url": "a"}, "timestamp": now, "expires_at": now + 3000}
+    extractor.cache["expiring"] = {"data": {"audio_url": "b"}, "timestamp": now, "expires_at": now + 60}
+
+    assert extractor.get_cached("fresh") == {"audio_url": "a"}
+    assert extractor.get_cached("expiring") is None
+    assert extractor.get_cached("missing") is None
+
+
+def test_radio_station_uses_one_suggestion_call_and_parallel_searches(client, monkeypatch):
+    import threading
+    import time
+    import app.services.radio_station_service as radio_module
+
+    calls = []
+
+    async def fake_diverse(self, keyword, count=3, avoid_titles=None):
+        calls.append((keyword, count))
+        return [SongSuggestion(title=f"Song {i}", artist="A") for i in range(count)]
+
+    monkeypatch.setattr(MusicSuggestionService, "suggest_diverse_songs", fake_diverse)
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    class SlowSearch:
+        def __init__(self, query, limit=1):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            self.query = query
+
+        def result(self):
+            # Two suggestions map to the same video; the duplicate is dropped
+            video_id = "dup" if self.query.startswith(("Song 0", "Song 1")) else self.query
+            return {"result": [{"id": video_id}]}
+
+    monkeypatch.setattr(radio_module, "VideosSearch", SlowSearch)
+
+    client_app, _ = client
+    resp = client_app.get("/api/v1/music/station", params={"category": "jazz"})
+    assert resp.status_code == 200
+    tracks = resp.json()
+
+    assert len(calls) == 1
+    assert calls[0][1] == settings.RADIO_STATION_SIZE + 2
+    assert len(tracks) == settings.RADIO_STATION_SIZE
+    assert len({t["youtube_id"] for t in tracks}) == len(tracks)
+    assert [t["id"] for t in tracks] == list(range(1, len(tracks) + 1))
+    assert 1 < active["peak"] <= settings.RADIO_SEARCH_CONCURRENCY
+    assert "suggest;dur=" in resp.headers["server-timing"]
+    assert "search;dur=" in resp.headers["server-timing"]
+
+
+def test_radio_station_served_from_precomputed_store(client, monkeypatch):
+    from datetime import datetime, timedelta
+
+    calls = []
+
+    async def fake_diverse(self, keyword, count=3, avoid_titles=None):
+        calls.append(keyword)
+        return []
+
+    monkeypatch.setattr(MusicSuggestionService, "suggest_diverse_songs", fake_diverse)
+
+    client_app, session_local = client
+    stored = [{"id": 1, "title": "Stored", "artist": "A", "youtube_id": "abc",
+               "stream_url": None, "cover_url": None, "status": "done"}]
+    db = session_local()
+    try:
+        crud.radio_station.upsert(db, category="jazz", tracks=stored)
+        stale = crud.radio_station.upsert(db, category="rock", tracks=stored)
+        stale.generated_at = datetime.utcnow() - timedelta(hours=settings.RADIO_STATION_MAX_AGE_HOURS + 1)
+        db.commit()
+    finally:
+        db.close()
+
+    resp = client_app.get("/api/v1/music/station", params={"category": "jazz"})
+    assert resp.status_code == 200
+    assert resp.json()[0]["title"] == "Stored"
+    assert resp.headers["last-modified"].endswith("GMT")
+    assert calls == []
+
+    # A stale entry is a miss: live generation runs (and falls back here)
+    resp = client_app.get("/api/v1/music/station", params={"category": "rock"})
+    assert resp.status_code == 200
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_all_rotates_every_category(temp_session, monkeypatch):
+    from app.services.music_moods import RADIO_CATEGORIES
+    from app.services.radio_station_service import RadioStationService
+    import app.services.radio_station_service as radio_module
+
+    monkeypatch.setattr(MusicSuggestionService, "__init__", lambda self, settings=None: None)
+    avoided = {}
+
+    async def fake_diverse(self, keyword, count=3, avoid_titles=None):
+        avoided[keyword] = avoid_titles
+        return [SongSuggestion(title=f"{keyword} {i}", artist="A") for i in range(count)]
+
+    monkeypatch.setattr(MusicSuggestionService, "suggest_diverse_songs", fake_diverse)
+
+    class FakeSearch:
+        def __init__(self, query, limit=1):
+            self.query = query
+
+        def result(self):
+            return {"result": [{"id": self.query}]}
+
+    monkeypatch.setattr(radio_module, "VideosSearch", FakeSearch)
+
+    db = temp_session()
+    try:
+        service = RadioStationService()
+        first = await service.refresh_all(db)
+        assert set(first) == set(RADIO_CATEGORIES)
+        assert all(avoid == [] for avoid in avoided.values())
+
+        await service.refresh_all(db)
+        jazz = crud.radio_station.get_by_category(db, category="jazz")
+        assert len(jazz.tracks) == settings.RADIO_STATION_SIZE
+        assert all(len(avoid) == settings.RADIO_STATION_SIZE for avoid in avoided.values())
+        assert db.query(models.RadioStation).count() == len(RADIO_CATEGORIES)
+    finally:
+        db.close()
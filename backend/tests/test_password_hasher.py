@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from passlib.context import CryptContext
+
+from app import crud
+from app.core import password_hasher as password_hasher_module
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusy
+from app.models.user import User
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, rounds=4)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_and_verify_in_pool(hasher):
+    async def scenario():
+        hashed = await hasher.hash("secret")
+        return hashed, await hasher.verify("secret", hashed), await hasher.verify("wrong", hashed)
+
+    hashed, ok, wrong = asyncio.run(scenario())
+    assert hashed.startswith("$2b$04$")
+    assert ok == (True, None)
+    assert wrong == (False, None)
+    stats = hasher.get_stats()
+    assert stats["hashed"] == 1 and stats["verified"] == 2
+    assert stats["pending"] == 0
+    assert stats["run_time_seconds"]["count"] == 3
+
+
+def test_verify_returns_upgraded_hash_when_rounds_change(hasher):
+    old = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secret")
+    matches, new_hash = asyncio.run(hasher.verify("secret", old))
+    assert matches
+    assert new_hash.startswith("$2b$04$")
+    assert hasher.stats["rehash_needed"] == 1
+
+
+def test_rejects_beyond_max_pending(hasher):
+    hasher.max_pending = 1
+
+    async def scenario():
+        return await asyncio.gather(
+            hasher.hash("a"), hasher.hash("b"), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert isinstance(results[1], PasswordHasherBusy)
+    assert hasher.get_stats()["rejected"] == 1
+
+
+def test_login_rehashes_outdated_password(client, monkeypatch):
+    client_app, session_local = client
+    hasher = PasswordHasher(max_workers=1, rounds=4)
+    monkeypatch.setattr("app.api.v1.auth.password_hasher", hasher)
+    old = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secret")
+    db = session_local()
+    try:
+        db.add(User(username="dana", email="dana@example.com", hashed_password=old))
+        db.commit()
+    finally:
+        db.close()
+
+    try:
+        resp = client_app.post(
+            "/api/v1/auth/login", json={"email": "dana@example.com", "password": "secret"}
+        )
+        assert resp.status_code == 200
+        db = session_local()
+        try:
+            stored = crud.user.get_by_email(db, email="dana@example.com").hashed_password
+        finally:
+            db.close()
+        assert stored.startswith("$2b$04$")
+
+        # The upgraded hash still logs in, without another rehash
+        resp = client_app.post(
+            "/api/v1/auth/login", json={"email": "dana@example.com", "password": "secret"}
+        )
+        assert resp.status_code == 200
+        assert hasher.stats["rehash_needed"] == 1
+    finally:
+        hasher.shutdown()
+
+
+def test_login_answers_503_when_hasher_is_saturated(client, monkeypatch):
+    client_app, _ = client
+    client_app.post(
+        "/api/v1/auth/register",
+        json={"username": "erin", "email": "erin@example.com", "password": "secret"},
+    )
+
+    async def busy(*args):
+        raise PasswordHasherBusy("full")
+
+    monkeypatch.setattr(password_hasher_module.password_hasher, "verify", busy)
+    resp = client_app.post(
+        "/api/v1/auth/login", json={"email": "erin@example.com", "password": "secret"}
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
@@ -0,0 +1,130 @@
+import asyncio
+import datetime
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.audio import AudioTrack
+from app.services.playlist_cache_service import (
+    LocalPlaylistBackend,
+    PlaylistCacheService,
+    RedisPlaylistBackend,
+)
+
+TODAY = datetime.date.today().isoformat()
+YESTERDAY = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+
+
+def _playlist(title="t"):
+    return [AudioTrack(id=1, title=title, artist="a", youtube_id="abcdefghijk")]
+
+
+def test_cache_stores_serialized_playlists():
+    cache = PlaylistCacheService(backend=LocalPlaylistBackend())
+    payload = cache.set_playlist(1, TODAY, "personalized", _playlist())
+
+    assert isinstance(payload, bytes)
+    assert cache.get_serialized(1, TODAY, "personalized") == payload
+    assert json.loads(payload)[0]["title"] == "t"
+    assert cache.get_playlist(1, TODAY, "personalized")[0].youtube_id == "abcdefghijk"
+    assert cache.get_serialized(2, TODAY, "personalized") is None
+    assert cache.get_stats()["hits"] == 2
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_local_backend_evicts_least_recently_used():
+    cache = PlaylistCacheService(backend=LocalPlaylistBackend(max_entries=2))
+    cache.set_playlist(1, TODAY, "p", _playlist("one"))
+    cache.set_playlist(2, TODAY, "p", _playlist("two"))
+    cache.get_serialized(1, TODAY, "p")  # user 1 becomes most recent
+    cache.set_playlist(3, TODAY, "p", _playlist("three"))
+
+    assert cache.get_serialized(2, TODAY, "p") is None
+    assert cache.get_serialized(1, TODAY, "p") is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_entries_expire_when_their_day_ends():
+    cache = PlaylistCacheService(backend=LocalPlaylistBackend())
+    cache.set_playlist(1, YESTERDAY, "p", _playlist())
+    cache.set_playlist(1, TODAY, "p", _playlist())
+
+    assert cache.clear_old() == 1
+    assert cache.get_serialized(1, YESTERDAY, "p") is None
+    assert cache.get_serialized(1, TODAY, "p") is not None
+
+
+class FakeRedis:
+    """Minimal stand-in for the redis client calls the backend uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key, (None,))[0]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = (value, ex)
+
+
+def test_redis_backend_is_shared_between_instances():
+    client = FakeRedis()
+    worker_a = PlaylistCacheService(backend=RedisPlaylistBackend(client))
+    worker_b = PlaylistCacheService(backend=RedisPlaylistBackend(client))
+
+    payload = worker_a.set_playlist(1, TODAY, "p", _playlist())
+    assert worker_b.get_serialized(1, TODAY, "p") == payload
+    _, ttl = client.data[f"playlist:1:{TODAY}:p"]
+    assert 0 < ttl <= 24 * 3600
+
+    # Past days are never written
+    worker_a.set_playlist(1, YESTERDAY, "p", _playlist())
+    assert f"playlist:1:{YESTERDAY}:p" not in client.data
+
+
+def test_backend_errors_are_treated_as_misses():
+    class BrokenRedis:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, key, value, ex=None):
+            raise ConnectionError("down")
+
+    cache = PlaylistCacheService(backend=RedisPlaylistBackend(BrokenRedis()))
+    assert cache.set_playlist(1, TODAY, "p", _playlist())
+    assert cache.get_serialized(1, TODAY, "p") is None
+    assert cache.get_stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_endpoint_keeps_the_event_loop_free_during_cache_lookups(monkeypatch):
+    from app.api.v1 import personalized_playlist
+
+    class SlowRedis(FakeRedis):
+        def get(self, key):
+            time.sleep(0.2)  # A Redis round trip up to socket_timeout
+            return super().get(key)
+
+    cache = PlaylistCacheService(backend=RedisPlaylistBackend(SlowRedis()))
+    payload = cache.set_playlist(1, TODAY, "personalized", _playlist())
+    monkeypatch.setattr(personalized_playlist, "playlist_cache", cache)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    response = await personalized_playlist.get_personalized_playlist(
+        db=None, current_user=SimpleNamespace(id=1), suggestion_service=None
+    )
+    ticking.cancel()
+
+    assert response.body == payload
+    assert ticks >= 5
@@ -0,0 +1,276 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_minute_window_slides_and_reports_exact_wait():
+    clock = FakeClock()
+    limiter = RateLimiter(limits={"requests_per_minute": 2, "concurrent_requests": 10}, clock=clock)
+
+    await limiter.record_request("youtube")
+    clock.now += 10
+    await limiter.record_request("youtube")
+    assert not await limiter.can_make_request("youtube")
+    assert limiter.get_wait_time("youtube") == pytest.approx(50)
+
+    clock.now += 50
+    assert await limiter.can_make_request("youtube")
+    assert limiter.get_wait_time("youtube") == 0
+    assert limiter.get_request_count("youtube") == 2
+
+
+@pytest.mark.asyncio
+async def test_hour_window_wait_time():
+    clock = FakeClock()
+    limiter = RateLimiter(limits={"requests_per_hour": 1}, clock=clock)
+
+    await limiter.record_request("youtube")
+    await limiter.complete_request("youtube")
+    clock.now += 600
+    assert not await limiter.can_make_request("youtube")
+    assert limiter.get_wait_time("youtube") == pytest.approx(3000)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_tracked_per_source():
+    limiter = RateLimiter(limits={"concurrent_requests": 1})
+
+    await limiter.record_request("youtube")
+    assert not await limiter.can_make_request("youtube")
+    assert await limiter.can_make_request("youtube_search")
+    assert limiter.get_active_count("youtube") == 1
+    assert limiter.get_active_count("youtube_search") == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_is_woken_when_a_request_completes():
+    limiter = RateLimiter(limits={"concurrent_requests": 1})
+    await limiter.record_request("youtube")
+
+    async def finish_soon():
+        await asyncio.sleep(0.05)
+        await limiter.complete_request("youtube")
+
+    started = time.monotonic()
+    finisher = asyncio.create_task(finish_soon())
+    assert await limiter.wait_for_available_slot("youtube", max_wait=5)
+    assert time.monotonic() - started < 1
+    await finisher
+
+
+@pytest.mark.asyncio
+async def test_waiter_times_out_when_slot_never_frees():
+    limiter = RateLimiter(limits={"concurrent_requests": 1})
+    await limiter.record_request("youtube")
+
+    assert not await limiter.wait_for_available_slot("youtube", max_wait=0.05)
+    assert (await limiter.get_status())["youtube"]["waiting"] == 0
+
+
+@pytest.mark.parametrize("backend", ["local", "redis"])
+def test_both_backends_enforce_the_configured_limits(backend):
+    pytest.importorskip("redis")
+    from app.core.config import Settings
+    from app.core.rate_limiter import create_rate_limiter
+
+    settings = Settings(
+        RATE_LIMIT_BACKEND=backend,
+        YOUTUBE_REQUESTS_PER_MINUTE=7,
+        YOUTUBE_REQUESTS_PER_HOUR=70,
+        YOUTUBE_CONCURRENT_REQUESTS=4,
+    )
+    assert create_rate_limiter(settings).youtube_limits == {
+        "requests_per_minute": 7,
+        "requests_per_hour": 70,
+        "concurrent_requests": 4,
+    }
+
+
+def _redis_limiters(count, limits, clock):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from app.core.rate_limiter import RedisRateLimiter
+
+    server = fakeredis.FakeServer()
+    return [
+        RedisRateLimiter(fakeredis.FakeRedis(server=server), limits=limits, clock=clock)
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_budget_is_shared_between_workers():
+    clock = FakeClock()
+    worker_a, worker_b = _redis_limiters(
+        2, {"requests_per_minute": 2, "concurrent_requests": 10}, clock
+    )
+
+    await worker_a.record_request("youtube")
+    clock.now += 10
+    await worker_b.record_request("youtube")
+
+    assert not await worker_a.can_make_request("youtube")
+    assert not await worker_b.can_make_request("youtube")
+    assert worker_a.get_wait_time("youtube") == pytest.approx(50)
+    assert worker_b.get_request_count("youtube") == 2
+
+    clock.now += 50
+    assert await worker_b.can_make_request("youtube")
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_reserves_slot_while_waiting():
+    clock = FakeClock()
+    worker_a, worker_b = _redis_limiters(2, {"concurrent_requests": 1}, clock)
+
+    assert await worker_a.wait_for_available_slot("youtube", max_wait=1)
+    # The reservation already holds the only slot cluster-wide
+    assert not await worker_b.wait_for_available_slot("youtube", max_wait=0.05)
+
+    await worker_a.record_request("youtube")  # consumes the reservation
+    assert worker_a.get_active_count("youtube") == 1
+    assert worker_a.get_request_count("youtube") == 1
+
+    await worker_a.complete_request("youtube")
+    assert worker_b.get_active_count("youtube") == 0
+    assert await worker_b.wait_for_available_slot("youtube", max_wait=1)
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_expires_leases_of_dead_workers():
+    clock = FakeClock()
+    (limiter,) = _redis_limiters(1, {"concurrent_requests": 1}, clock)
+    limiter.lease_seconds = 30
+
+    await limiter.record_request("youtube")
+    assert not await limiter.can_make_request("youtube")
+    clock.now += 31
+    assert await limiter.can_make_request("youtube")
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_releases_unused_reservation():
+    clock = FakeClock()
+    worker_a, worker_b = _redis_limiters(2, {"concurrent_requests": 1}, clock)
+
+    assert await worker_a.wait_for_available_slot("youtube", max_wait=1)
+    await worker_a.release_reservation("youtube")
+
+    assert worker_b.get_active_count("youtube") == 0
+    assert worker_b.get_request_count("youtube") == 0
+    assert await worker_b.wait_for_available_slot("youtube", max_wait=1)
+    # Nothing left to release
+    await worker_a.release_reservation("youtube")
+    assert worker_b.get_active_count("youtube") == 1
+
+
+@pytest.mark.asyncio
+async def test_extractor_returns_slot_of_request_that_never_ran(monkeypatch):
+    import random
+
+    from app.core import rate_limiter as rate_limiter_module
+    from app.core.request_queue import JobStatus, QueueFullError, RequestQueue
+    from app.services import stealth_youtube_extractor as extractor_module
+
+    (limiter,) = _redis_limiters(1, {"concurrent_requests": 2}, FakeClock())
+    queue = RequestQueue(max_workers=1, max_queue_size=1, overflow="reject")
+    for module in (rate_limiter_module, extractor_module):
+        monkeypatch.setattr(module, "rate_limiter", limiter)
+    monkeypatch.setattr(extractor_module, "request_queue", queue)
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0)
+    extractor = extractor_module.StealthYouTubeExtractor()
+    release = asyncio.Event()
+
+    async def busy():
+        await release.wait()
+
+    await queue.add_request(busy)
+    await asyncio.sleep(0)  # let the worker pick it up
+
+    # Queued behind the busy job, then abandoned by its caller
+    caller = asyncio.ensure_future(extractor.extract_audio_url("https://youtu.be/a", use_cache=False))
+    while queue.get_queue_size() == 0:
+        await asyncio.sleep(0.01)
+    (queued,) = [job for job in queue._jobs.values() if job.status is JobStatus.QUEUED]
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert queued.status is JobStatus.CANCELLED
+    assert limiter.get_active_count("youtube") == 0
+
+    # Rejected by the full queue
+    await queue.add_request(busy)
+    with pytest.raises(QueueFullError):
+        await extractor.extract_audio_url("https://youtu.be/b", use_cache=False)
+    assert limiter.get_active_count("youtube") == 0
+
+    release.set()
+    await asyncio.sleep(0.05)  # let the queue drain before stopping its worker
+    workers = list(queue._workers)
+    for worker in workers:
+        worker.cancel()
+    await asyncio.wait(workers)
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_keeps_the_event_loop_free():
+    clock = FakeClock()
+    (limiter,) = _redis_limiters(1, {"concurrent_requests": 5}, clock)
+    script = limiter._script
+
+    def slow_script(**kwargs):
+        time.sleep(0.2)
+        return script(**kwargs)
+
+    limiter._script = slow_script
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    assert await limiter.wait_for_available_slot("youtube", max_wait=1)
+    await limiter.get_status()  # three lookups, run concurrently
+    ticking.cancel()
+
+    assert ticks >= 20
+    assert limiter.get_active_count("youtube") == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_hands_back_slot_reserved_after_caller_left():
+    clock = FakeClock()
+    (limiter,) = _redis_limiters(1, {"concurrent_requests": 1}, clock)
+    script = limiter._script
+
+    def slow_script(**kwargs):
+        time.sleep(0.05)
+        return script(**kwargs)
+
+    limiter._script = slow_script
+    waiter = asyncio.ensure_future(limiter.wait_for_available_slot("youtube", max_wait=1))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0.1)
+
+    limiter._script = script
+    assert limiter.get_active_count("youtube") == 0
+    assert limiter._reserved["youtube"] == 0
@@ -0,0 +1,144 @@
+import time
+
+import fakeredis
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.core.security import create_access_token
+from app.db import recent_writes as recent_writes_module
+from app.db import session as db_session
+from app.db.base_class import Base
+from app.db.recent_writes import RecentWrites
+from app.dependencies import get_read_db
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = RecentWrites(window_seconds=60)
+    monkeypatch.setattr(recent_writes_module, "recent_writes", tracker)
+    monkeypatch.setattr("app.dependencies.recent_writes", tracker)
+    return tracker
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    # A second database that lags behind: it never sees the test's writes
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(db_session, "has_read_replica", lambda: True)
+    monkeypatch.setattr(
+        db_session, "ReadSessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+    yield
+    engine.dispose()
+
+
+def _add_journal(session_local, owner_id=1):
+    db = session_local()
+    try:
+        db.add(models.Journal(owner_id=owner_id, title="Hari ini", content="Tenang", mood="tenang"))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_marks_expire_after_the_window():
+    tracker = RecentWrites(window_seconds=0.05)
+    tracker.mark([1])
+    assert tracker.wrote_recently(1)
+    assert not tracker.wrote_recently(2)
+    assert not tracker.wrote_recently(None)
+    time.sleep(0.06)
+    assert not tracker.wrote_recently(1)
+    assert tracker.get_stats()["primary_reads"] == 1
+
+
+def test_local_marks_are_bounded():
+    tracker = RecentWrites(window_seconds=60, max_entries=2)
+    tracker.mark([1])
+    tracker.mark([2])
+    tracker.mark([3])
+    assert not tracker.wrote_recently(1)
+    assert tracker.wrote_recently(2) and tracker.wrote_recently(3)
+
+
+def test_redis_shares_marks_between_workers():
+    redis_client = fakeredis.FakeRedis()
+    first = RecentWrites(window_seconds=60, redis_client=redis_client)
+    second = RecentWrites(window_seconds=60, redis_client=redis_client)
+    first.mark([7])
+    assert second.wrote_recently(7)
+    assert not second.wrote_recently(8)
+
+
+def test_redis_failure_reads_from_primary():
+    class BrokenRedis:
+        def exists(self, key):
+            raise ConnectionError("down")
+
+    tracker = RecentWrites(window_seconds=60, redis_client=BrokenRedis())
+    assert tracker.wrote_recently(1)
+    assert tracker.get_stats()["errors"] == 1
+
+
+def test_commit_marks_the_owner(temp_session, tracker):
+    _add_journal(temp_session, owner_id=1)
+    assert tracker.wrote_recently(1)
+    assert not tracker.wrote_recently(2)
+
+
+def test_rollback_and_disabled_tracker_mark_nobody(temp_session, tracker):
+    db = temp_session()
+    try:
+        db.add(models.Journal(owner_id=1, title="Batal", content="-"))
+        db.flush()
+        db.rollback()
+    finally:
+        db.close()
+    assert not tracker.wrote_recently(1)
+
+    tracker.enabled = False
+    _add_journal(temp_session, owner_id=1)
+    assert not tracker.wrote_recently(1)
+
+
+def test_reads_go_to_replica_until_own_write(client, tracker, replica):
+    test_client, session_local = client
+    headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+    tracker.enabled = False
+    _add_journal(session_local)
+
+    # Someone else's write (or none) leaves the read on the lagging replica
+    assert test_client.get("/api/v1/journals/", headers=headers).json() == []
+
+    tracker.mark([1])
+    journals = test_client.get("/api/v1/journals/", headers=headers).json()
+    assert [journal["title"] for journal in journals] == ["Hari ini"]
+
+
+def test_etag_and_body_come_from_the_same_database(client, replica):
+    test_client, session_local = client
+    db = session_local()
+    try:
+        db.add(models.Article(title="Tidur cukup", url="https://example.com/tidur"))
+        db.commit()
+        primary_etag = crud.content_version.get_etag(db, "articles")
+    finally:
+        db.close()
+
+    response = test_client.get("/api/v1/articles/")
+    assert response.json() == []
+    assert response.headers["etag"] != primary_etag
+
+
+def test_without_replica_reads_use_the_request_session(temp_session):
+    primary = temp_session()
+    try:
+        dependency = get_read_db(primary, token=None)
+        assert next(dependency) is primary
+    finally:
+        primary.close()
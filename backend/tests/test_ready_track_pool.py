@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import crud, models
+from app.core.config import settings
+from app.schemas.song import SongSuggestion
+from app.services.music_moods import mood_bucket
+from app.services.music_suggestion_service import MusicSuggestionService
+from app.services.ready_track_pool_service import ReadyTrackPoolService
+
+
+def test_mood_bucket_normalizes_journal_moods():
+    assert mood_bucket("Senang sekali") == "bahagia"
+    assert mood_bucket("stres") == "stress"
+    assert mood_bucket("sedih") == "sedih"
+    assert mood_bucket("ok") == "netral"
+    assert mood_bucket(None) == "netral"
+
+
+def test_assign_for_mood_publishes_fresh_track(temp_session):
+    db = temp_session()
+    try:
+        stale = crud.ready_track.create_for_mood(
+            db, mood="sedih", title="Old", artist="A", youtube_id="old", stream_url="http://old"
+        )
+        stale.created_at = datetime.utcnow() - timedelta(hours=settings.READY_TRACK_MAX_AGE_HOURS + 1)
+        db.commit()
+        crud.ready_track.create_for_mood(
+            db, mood="sedih", title="Fresh", artist="B", youtube_id="fresh", stream_url="http://fresh"
+        )
+
+        service = ReadyTrackPoolService()
+        track = service.assign_for_mood(db, "Sedih")
+
+        assert track.title == "Fresh"
+        assert track.status == "done"
+        assert crud.music_track.get_latest(db).id == track.id
+        assert crud.ready_track.youtube_ids_for_mood(db, mood="sedih") == ["old"]
+        # Only the stale entry is left, so the bucket is now empty
+        assert service.assign_for_mood(db, "sedih") is None
+    finally:
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_refill_tops_up_each_bucket(temp_session, monkeypatch):
+    monkeypatch.setattr(MusicSuggestionService, "__init__", lambda self, settings=None: None)
+
+    async def fake_diverse(self, keyword, count=5, avoid_titles=None):
+        return [SongSuggestion(title=f"{keyword[:5]} {i}", artist="X") for i in range(count)]
+
+    monkeypatch.setattr(MusicSuggestionService, "suggest_diverse_songs", fake_diverse)
+
+    async def fake_resolve(self, song):
+        return {
+            "title": song.title,
+            "artist": song.artist,
+            "youtube_id": f"id-{song.title}",
+            "stream_url": f"http://{song.title}",
+        }
+
+    monkeypatch.setattr(ReadyTrackPoolService, "_resolve", fake_resolve)
+
+    db = temp_session()
+    try:
+        crud.ready_track.create_for_mood(
+            db, mood="bahagia", title="Kept", artist="A", youtube_id="kept", stream_url="http://kept"
+        )
+
+        added = await ReadyTrackPoolService().refill(db)
+
+        size = settings.READY_TRACK_POOL_SIZE
+        assert added["bahagia"] == size - 1
+        assert added["netral"] == size
+        counts = crud.ready_track.count_by_mood(
+            db, fresh_after=datetime.utcnow() - timedelta(hours=1)
+        )
+        assert all(counts[bucket] == size for bucket in added)
+        assert db.query(models.ReadyTrack).count() == size * len(added)
+
+        # A second pass has nothing to do
+        assert await ReadyTrackPoolService().refill(db) == {}
+    finally:
+        db.close()
@@ -0,0 +1,221 @@
+import asyncio
+
+import pytest
+
+from app.core.request_queue import (
+    AIMDConcurrencyController,
+    JobStatus,
+    QueueFullError,
+    RequestPriority,
+    RequestQueue,
+    is_throttle_error,
+)
+
+
+async def _echo(value, delay=0):
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_result_available_for_queued_and_finished_jobs():
+    queue = RequestQueue(max_workers=1)
+    blocker = await queue.add_request(_echo, args=("first", 0.05))
+    waiting = await queue.add_request(_echo, args=("second",))
+
+    # Still queued behind the blocker, yet the id resolves
+    assert waiting.status is JobStatus.QUEUED
+    assert await queue.get_result(waiting.request_id, timeout=1) == "second"
+    assert await blocker.result(timeout=1) == "first"
+    assert await queue.get_result(blocker.request_id, timeout=1) == "first"
+
+    stats = queue.get_detailed_status()
+    assert stats["completed_requests"] == 2
+    assert stats["queue_time_seconds"]["count"] == 2
+    assert stats["run_time_seconds"]["count"] == 2
+    assert waiting.queue_time >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted():
+    async def boom():
+        raise RuntimeError("nope")
+
+    queue = RequestQueue(max_workers=1)
+    job = await queue.add_request(boom)
+    with pytest.raises(RuntimeError):
+        await job.result(timeout=1)
+    assert job.status is JobStatus.FAILED
+    assert queue.get_failed_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects():
+    queue = RequestQueue(max_workers=1, max_queue_size=1, overflow="reject")
+    running = await queue.add_request(_echo, args=("run", 0.05))
+    await asyncio.sleep(0)  # let the worker pick it up
+    await queue.add_request(_echo, args=("queued",))
+
+    with pytest.raises(QueueFullError):
+        await queue.add_request(_echo, args=("extra",), priority=RequestPriority.CRITICAL)
+    assert queue.get_stats()["rejected"] == 1
+    assert await running.result(timeout=1) == "run"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lower_priority_job():
+    queue = RequestQueue(max_workers=1, max_queue_size=2, overflow="shed")
+    running = await queue.add_request(_echo, args=("run", 0.05))
+    await asyncio.sleep(0)
+    low = await queue.add_request(_echo, args=("low",), priority=RequestPriority.LOW)
+    normal = await queue.add_request(_echo, args=("normal",))
+
+    high = await queue.add_request(_echo, args=("high",), priority=RequestPriority.HIGH)
+    with pytest.raises(QueueFullError):
+        await low.result(timeout=1)
+    assert low.status is JobStatus.SHED
+
+    # Nothing queued is less important than a new LOW request
+    with pytest.raises(QueueFullError):
+        await queue.add_request(_echo, args=("low2",), priority=RequestPriority.LOW)
+
+    assert await high.result(timeout=1) == "high"
+    assert await normal.result(timeout=1) == "normal"
+    assert await running.result(timeout=1) == "run"
+    assert queue.get_stats()["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_wait_cancels_queued_job():
+    queue = RequestQueue(max_workers=1)
+    blocker = await queue.add_request(_echo, args=("run", 0.1))
+    queued = await queue.add_request(_echo, args=("never",))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await queued.result(timeout=0.01)
+    assert queued.status is JobStatus.CANCELLED
+    assert queue.get_queue_size() == 0
+    assert await blocker.result(timeout=1) == "run"
+
+
+@pytest.mark.asyncio
+async def test_burst_from_one_tenant_does_not_starve_others():
+    queue = RequestQueue(max_workers=1)
+    order = []
+
+    async def record(name):
+        order.append(name)
+
+    blocker = await queue.add_request(_echo, args=("run", 0.02))
+    for i in range(5):
+        await queue.add_request(record, args=(f"heavy-{i}",), tenant=1)
+    light = await queue.add_request(record, args=("light",), tenant=2)
+    assert queue.get_tenant_stats()["1"]["queued"] == 5
+
+    await light.result(timeout=1)
+    await blocker.result(timeout=1)
+    # The light tenant's single job runs right after the heavy tenant's first one
+    assert order[:2] == ["heavy-0", "light"]
+
+
+@pytest.mark.asyncio
+async def test_tenant_weight_and_priority_aging():
+    queue = RequestQueue(max_workers=1, aging_seconds=0.01)
+    order = []
+
+    async def record(name):
+        order.append(name)
+
+    blocker = await queue.add_request(_echo, args=("run", 0.05))
+    low = await queue.add_request(record, args=("low",), priority=RequestPriority.LOW, tenant="a")
+    await asyncio.sleep(0.03)  # the LOW job ages past NORMAL
+    normal = await queue.add_request(record, args=("normal",), tenant="b")
+
+    await normal.result(timeout=1)
+    await low.result(timeout=1)
+    await blocker.result(timeout=1)
+    assert order == ["low", "normal"]
+
+    queue.set_tenant_weight("big", 3)
+    assert queue._tenant("big").weight == 3
+
+
+def test_aimd_controller_bounds_and_cooldown():
+    controller = AIMDConcurrencyController(min_limit=1, max_limit=4, initial=2,
+                                           latency_target=1, cooldown=60)
+    for _ in range(20):
+        controller.on_success(0.1)
+    assert controller.current == 4  # Additive increase, capped at max
+
+    controller.on_throttle()
+    assert controller.current == 2
+    controller.on_throttle()  # Within the cooldown: one burst counts once
+    assert controller.current == 2
+
+    controller.cooldown = 0
+    controller.on_success(5)  # Slower than the target
+    controller.on_throttle()
+    controller.on_throttle()
+    assert controller.current == 1  # Never below min
+    assert controller.decreases == 2
+
+
+def test_throttle_classification():
+    assert is_throttle_error(RuntimeError("HTTP Error 429: Too Many Requests"))
+    assert is_throttle_error(RuntimeError("Sign in to confirm you're not a bot"))
+    assert is_throttle_error(asyncio.TimeoutError())
+    assert not is_throttle_error(ValueError("Video unavailable"))
+
+
+@pytest.mark.asyncio
+async def test_throttling_shrinks_workers():
+    queue = RequestQueue(max_workers=4, min_workers=1)
+    assert queue.concurrency.current == 4
+
+    async def throttled():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("HTTP Error 429")
+
+    jobs = [await queue.add_request(throttled) for _ in range(4)]
+    assert queue.get_active_workers() == 4
+    await asyncio.gather(*(job.result(timeout=1) for job in jobs), return_exceptions=True)
+
+    stats = queue.get_stats()
+    assert stats["concurrency_limit"] == 2
+    assert stats["concurrency_decreases"] == 1
+
+    # Over-limit workers exit as they pick up work; successes grow the limit back
+    jobs = [await queue.add_request(_echo, args=(i, 0.01)) for i in range(8)]
+    assert queue.get_active_workers() <= 2
+    await asyncio.gather(*(job.result(timeout=1) for job in jobs))
+    assert queue.get_stats()["concurrency_limit"] == 4
+
+
+@pytest.mark.asyncio
+async def test_empty_results_do_not_grow_the_limit():
+    queue = RequestQueue(max_workers=4, min_workers=1)
+    queue.concurrency.limit = 1
+
+    jobs = [await queue.add_request(_echo, args=(None, 0.01)) for _ in range(8)]
+    await asyncio.gather(*(job.result(timeout=1) for job in jobs))
+
+    assert all(job.status is JobStatus.DONE for job in jobs)
+    assert queue.get_stats()["concurrency_limit"] == 1
+    assert queue.concurrency.increases == 0
+
+
+@pytest.mark.asyncio
+async def test_workers_start_on_demand_and_idle_ones_exit():
+    queue = RequestQueue(max_workers=3, min_workers=1, idle_timeout=0.05)
+    assert queue.get_active_workers() == 0
+
+    jobs = [await queue.add_request(_echo, args=(i, 0.01)) for i in range(3)]
+    assert queue.get_active_workers() == 3
+    await asyncio.gather(*(job.result(timeout=1) for job in jobs))
+
+    await asyncio.sleep(0.2)
+    assert queue.get_active_workers() == 1
+
+    # A single request needs a single worker
+    assert await (await queue.add_request(_echo, args=("again",))).result(timeout=1) == "again"
+    assert queue.get_active_workers() == 1
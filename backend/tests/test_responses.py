@@ -0,0 +1,63 @@
+import datetime
+import uuid
+
+import orjson
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.responses import ORJSONResponse, ORJSONRoute
+from app.models.chat import SenderType
+from app.schemas.chat import ChatMessage
+
+
+def _message(**overrides):
+    return ChatMessage(
+        id=1,
+        owner_id=2,
+        content="halo",
+        sender_type=SenderType.AI,
+        created_at=datetime.datetime(2025, 1, 2, 3, 4, 5, 600000),
+        is_flagged=False,
+        **overrides,
+    )
+
+
+def test_orjson_response_renders_datetimes_enums_and_models():
+    body = ORJSONResponse({
+        "message": _message(),
+        "sender": SenderType.USER,
+        "at": datetime.datetime(2025, 1, 2, 3, 4, 5),
+        "id": uuid.UUID(int=1),
+        1: "non-str key",
+    }).body
+
+    assert orjson.loads(body) == {
+        "message": orjson.loads(_message().model_dump_json()),
+        "sender": "user",
+        "at": "2025-01-02T03:04:05",
+        "id": "00000000-0000-0000-0000-000000000001",
+        "1": "non-str key",
+    }
+
+
+def test_route_class_uses_orjson_only_without_response_model():
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.get("/plain")
+    def plain():
+        return {"message": _message(), "sender": SenderType.AI}
+
+    @router.get("/typed", response_model=ChatMessage)
+    def typed():
+        return _message()
+
+    routes = {route.path: route for route in router.routes}
+    assert routes["/plain"].response_class is ORJSONResponse
+    assert routes["/typed"].response_class is not ORJSONResponse
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    plain_body = client.get("/plain").json()
+    assert plain_body["sender"] == "ai"
+    assert plain_body["message"] == client.get("/typed").json()
@@ -0,0 +1,87 @@
+import datetime
+
+from app.core import sentry as sentry_module
+from app.core.sentry import RouteSampler
+
+ROUTES = {
+    "/api/v1/health": 0.0,
+    "/api/v1/home-feed": 0.01,
+    "/api/v1/chat": 0.5,
+    "/api/v1/chat/flagged": 0.2,
+}
+
+
+def _context(path, parent_sampled=None):
+    return {"asgi_scope": {"type": "http", "path": path}, "parent_sampled": parent_sampled}
+
+
+def _transaction(name, seconds, status="ok"):
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "type": "transaction",
+        "transaction": name,
+        "start_timestamp": start,
+        "timestamp": start + datetime.timedelta(seconds=seconds),
+        "contexts": {"trace": {"status": status}},
+    }
+
+
+def test_rate_uses_longest_matching_prefix():
+    sampler = RouteSampler(default_rate=0.1, route_rates=ROUTES)
+    assert sampler.rate_for("/api/v1/home-feed") == 0.01
+    assert sampler.rate_for("/api/v1/chat/") == 0.5
+    assert sampler.rate_for("/api/v1/chat/flagged") == 0.2
+    assert sampler.rate_for("/api/v1/articles/") == 0.1
+    assert sampler.rate_for("app.tasks.refill_ready_track_pool_task") == 0.1
+
+
+def test_head_sampling_without_keep_slow():
+    sampler = RouteSampler(route_rates=ROUTES, profiles_rate=0.5, keep_slow=False)
+    assert sampler.traces_sampler(_context("/api/v1/home-feed")) == 0.01
+    assert sampler.traces_sampler(_context("/api/v1/chat/")) == 0.5
+    assert sampler.traces_sampler(_context("/api/v1/home-feed", parent_sampled=True)) == 1.0
+    # Applied by Sentry to traced transactions only
+    assert sampler.profiles_sampler(_context("/api/v1/chat/")) == 0.5
+    assert sampler.profiles_sampler(_context("/api/v1/health/health")) == 0.0
+    assert sampler.traces_sampler({"transaction_context": {"name": "/api/v1/health/health"}}) == 0.0
+    fast = _transaction("/api/v1/home-feed", 0.01)
+    assert sampler.before_send_transaction(fast, {}) is fast
+
+
+def test_busy_routes_keep_slow_or_failed_by_default(monkeypatch):
+    sampler = RouteSampler(route_rates=ROUTES, slow_seconds=2.0, tail_min_rate=0.25)
+    assert sampler.traces_sampler(_context("/api/v1/chat/")) == 1.0
+    assert sampler.traces_sampler(_context("/api/v1/health/health")) == 0.0
+    # Below tail_min_rate: still head-sampled, and sent as is
+    assert sampler.traces_sampler(_context("/api/v1/home-feed")) == 0.01
+    assert sampler.traces_sampler(_context("/api/v1/chat/flagged")) == 0.2
+    head = _transaction("/api/v1/home-feed", 0.01)
+    assert sampler.before_send_transaction(head, {}) is head
+
+    monkeypatch.setattr(sentry_module.random, "random", lambda: 0.7)
+    slow = _transaction("/api/v1/chat/", 2.5)
+    failed = _transaction("/api/v1/chat/", 0.01, status="internal_error")
+    profiled = {**_transaction("/api/v1/chat/", 0.01), "profile": object()}
+    assert sampler.before_send_transaction(slow, {}) is slow
+    assert sampler.before_send_transaction(failed, {}) is failed
+    assert sampler.before_send_transaction(profiled, {}) is profiled
+    # Fast, successful and client errors go by the route rate
+    assert sampler.before_send_transaction(_transaction("/api/v1/chat/", 0.01), {}) is None
+    assert sampler.before_send_transaction(
+        _transaction("/api/v1/chat/", 0.01, status="not_found"), {}
+    ) is None
+    monkeypatch.setattr(sentry_module.random, "random", lambda: 0.3)
+    assert sampler.before_send_transaction(_transaction("/api/v1/chat/", 0.01), {}) is not None
+
+
+def test_keep_slow_profiles_only_the_routes_share():
+    sampler = RouteSampler(route_rates=ROUTES, profiles_rate=0.5)
+    # Every chat request is traced, so a quarter profiled = half of the 50% kept
+    assert sampler.profiles_sampler(_context("/api/v1/chat/")) == 0.25
+    assert sampler.profiles_sampler(_context("/api/v1/home-feed")) == 0.5
+
+
+def test_duration_accepts_serialized_timestamps():
+    event = {"start_timestamp": "2026-01-01T00:00:00Z", "timestamp": "2026-01-01T00:00:03.5Z"}
+    assert sentry_module._duration(event) == 3.5
+    assert sentry_module._duration({"timestamp": 1.0}) is None
@@ -68,4 +68,140 @@ async def test_generate_music_recommendation_task_sets_track(monkeypatch, temp_s
         assert track.title in ("Song", "Generating...")
         assert track.youtube_id == "ytid"
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+@pytest.mark.asyncio
+async def test_music_generation_reuses_single_llm_response(monkeypatch, temp_session):
+    db = temp_session()
+    try:
+        db.add(models.Journal(content="j1", created_at=datetime.utcnow()))
+        db.commit()
+    finally:
+        db.close()
+
+    from app.tasks import run_music_generation_flow
+
+    def fake_init(self, settings=None):
+        pass
+
+    monkeypatch.setattr(MusicKeywordService, "__init__", fake_init)
+    monkeypatch.setattr(MusicSuggestionService, "__init__", fake_init)
+    monkeypatch.setattr("app.tasks.SessionLocal", temp_session)
+
+    calls = {"keyword": 0, "diverse": 0, "single": 0}
+
+    async def fake_keyword(self, journals, user_profile=None):
+        calls["keyword"] += 1
+        return '1. "A" - X\n2. "B" - Y\n3. "C" - Z'
+
+    async def fake_diverse(self, keyword, count=3, avoid_titles=None):
+        calls["diverse"] += 1
+        assert {"A", "B", "C"} <= set(avoid_titles)
+        return []
+
+    async def fake_single(self, mood, user_profile=None):
+        calls["single"] += 1
+        return None
+
+    class EmptySearch:
+        def __init__(self, query, limit=1):
+            pass
+
+        def result(self):
+            return {"result": []}
+
+    monkeypatch.setattr(MusicKeywordService, "generate_keyword", fake_keyword)
+    monkeypatch.setattr(MusicSuggestionService, "suggest_diverse_songs", fake_diverse)
+    monkeypatch.setattr(MusicSuggestionService, "suggest_song", fake_single)
+    monkeypatch.setattr("app.tasks.VideosSearch", EmptySearch)
+
+    await run_music_generation_flow()
+
+    # One keyword call feeds the first attempt; later attempts ask for fresh songs
+    assert calls["keyword"] == 1
+    assert calls["diverse"] == 4
+
+
+def test_cleanup_failed_tracks_task_applies_retention(monkeypatch, temp_session):
+    from datetime import timedelta
+    from app.tasks import cleanup_failed_tracks_task
+    from app.core.config import settings
+
+    monkeypatch.setattr("app.tasks.SessionLocal", temp_session)
+    monkeypatch.setattr(settings, "FAILED_TRACK_RETENTION_COUNT", 2)
+    monkeypatch.setattr(settings, "FAILED_TRACK_RETENTION_HOURS", 24)
+
+    old = datetime.utcnow() - timedelta(days=2)
+    db = temp_session()
+    try:
+        for i in range(4):
+            db.add(models.MusicTrack(title=f"old{i}", youtube_id="", status="failed",
+                                     created_at=old + timedelta(minutes=i)))
+        db.add(models.MusicTrack(title="recent", youtube_id="", status="failed",
+                                 created_at=datetime.utcnow()))
+        db.add(models.MusicTrack(title="done", youtube_id="y", status="done", created_at=old))
+        db.commit()
+    finally:
+        db.close()
+
+    removed = cleanup_failed_tracks_task()
+
+    db = temp_session()
+    try:
+        titles = {t.title for t in db.query(models.MusicTrack).all()}
+    finally:
+        db.close()
+    # "recent" and "old3" are the newest failed tracks; "recent" is also inside the window
+    assert removed == 3
+    assert titles == {"recent", "old3", "done"}
+
+
+@pytest.mark.asyncio
+async def test_music_generation_queues_extraction_under_the_user(monkeypatch, temp_session):
+    db = temp_session()
+    try:
+        db.add(models.User(username="u", email="u@example.com", hashed_password="x"))
+        db.add(models.Journal(content="j1", owner_id=1, created_at=datetime.utcnow()))
+        db.commit()
+    finally:
+        db.close()
+
+    from app.tasks import run_music_generation_flow
+    from app.services.stealth_youtube_extractor import stealth_youtube_extractor
+
+    def fake_init(self, settings=None):
+        pass
+
+    async def fake_keyword(self, journals, user_profile=None):
+        return '1. "A" - X'
+
+    class Search:
+        def __init__(self, query, limit=1):
+            pass
+
+        def result(self):
+            return {"result": [{"id": "ytid", "title": "A (Official Audio)", "duration": "3:30"}]}
+
+    extractions = []
+
+    async def fake_extract(youtube_url, **kwargs):
+        extractions.append(kwargs)
+        return {"audio_url": "https://rr1.googlevideo.com/videoplayback?expire=2000000000"}
+
+    monkeypatch.setattr(MusicKeywordService, "__init__", fake_init)
+    monkeypatch.setattr(MusicSuggestionService, "__init__", fake_init)
+    monkeypatch.setattr("app.tasks.SessionLocal", temp_session)
+    monkeypatch.setattr(MusicKeywordService, "generate_keyword", fake_keyword)
+    monkeypatch.setattr("app.tasks.VideosSearch", Search)
+    monkeypatch.setattr(stealth_youtube_extractor, "extract_audio_url", fake_extract)
+
+    await run_music_generation_flow(user_id=1)
+
+    assert extractions and all(call["tenant"] == 1 for call in extractions)
+    assert extractions[0]["adaptive"] is True
+    db = temp_session()
+    try:
+        track = crud.music_track.get_latest(db, owner_id=1)
+        assert (track.title, track.status) == ("A", "done")
+    finally:
+        db.close()
@@ -22,3 +22,65 @@ def test_delete_current_user(client):
         assert db.query(User).filter_by(id=1).first() is None
     finally:
         db.close()
+
+
+def _seed_history(session_local, journals, chats, owner_id=1):
+    from app.models.chat import ChatMessage, SenderType
+    from app.models.journal import Journal
+
+    db = session_local()
+    try:
+        db.add_all(
+            Journal(title=f"j{i}", content="isi", mood="tenang", owner_id=owner_id)
+            for i in range(journals)
+        )
+        db.add_all(
+            ChatMessage(content=f"c{i}", sender_type=SenderType.USER, owner_id=owner_id)
+            for i in range(chats)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _read_ndjson(body):
+    import json
+
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def test_export_streams_all_history_as_ndjson(client, monkeypatch):
+    from app.core.config import settings
+
+    client_app, session_local = client
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    _seed_history(session_local, journals=5, chats=3)
+    _seed_history(session_local, journals=2, chats=2, owner_id=2)
+
+    resp = client_app.get("/api/v1/users/me/export", headers={"Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    records = _read_ndjson(resp.content)
+    assert records[0]["type"] == "export"
+    assert [r["data"]["title"] for r in records if r["type"] == "journal"] == [
+        f"j{i}" for i in range(5)
+    ]
+    chats = [r["data"] for r in records if r["type"] == "chat_message"]
+    assert [c["content"] for c in chats] == ["c0", "c1", "c2"]
+    assert chats[0]["sender_type"] == "user"
+    assert records[-1] == {"type": "summary", "counts": {"journal": 5, "chat_message": 3}}
+
+
+def test_export_gzip_download(client):
+    import gzip
+
+    client_app, session_local = client
+    _seed_history(session_local, journals=3, chats=1)
+
+    resp = client_app.get("/api/v1/users/me/export", params={"gzip": True})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/gzip"
+    assert resp.headers["content-disposition"].endswith('.ndjson.gz"')
+    assert "content-encoding" not in resp.headers
+    records = _read_ndjson(gzip.decompress(resp.content))
+    assert records[-1]["counts"] == {"journal": 3, "chat_message": 1}
@@ -0,0 +1,100 @@
+from sqlalchemy import event
+
+from app import crud
+from app.core import user_cache as user_cache_module
+from app.core.security import create_access_token
+from app.core.user_cache import UserCache
+from app.dependencies import get_current_user
+from app.models.user import User
+
+
+def _add_user(session_local, username="tester"):
+    db = session_local()
+    try:
+        user = User(username=username, email=f"{username}@example.com", hashed_password="hash")
+        db.add(user)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def _count_queries(session_local):
+    statements = []
+    event.listen(
+        session_local.kw["bind"], "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_current_user_is_served_from_cache(temp_session):
+    user_id = _add_user(temp_session)
+    token = create_access_token(user_id)
+    statements = _count_queries(temp_session)
+
+    db = temp_session()
+    try:
+        assert get_current_user(db, token).username == "tester"
+    finally:
+        db.close()
+    assert len(statements) == 1
+
+    db = temp_session()
+    try:
+        user = get_current_user(db, token)
+        assert len(statements) == 1
+        assert user in db and not db.is_modified(user)
+        # The hash isn't cached; it lazy-loads through the request's session
+        assert user.hashed_password == "hash"
+        assert len(statements) == 2
+    finally:
+        db.close()
+
+
+def test_update_and_delete_invalidate(temp_session):
+    user_id = _add_user(temp_session)
+    invalidations = crud.user.cache.get_stats()["invalidations"]
+    db = temp_session()
+    try:
+        user = crud.user.get_cached(db, user_id)
+        crud.user.update(db, db_obj=user, obj_in={"username": "renamed"})
+    finally:
+        db.close()
+
+    db = temp_session()
+    try:
+        user = crud.user.get_cached(db, user_id)
+        assert user.username == "renamed"
+        crud.user.remove(db, id=user_id)
+    finally:
+        db.close()
+
+    db = temp_session()
+    try:
+        assert crud.user.get_cached(db, user_id) is None
+    finally:
+        db.close()
+    assert crud.user.cache.get_stats()["invalidations"] == invalidations + 2
+
+
+def test_cache_is_bounded_and_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: now[0])
+    cache = UserCache(ttl_seconds=30, max_entries=2)
+    for user_id in (1, 2, 3):
+        cache.set(user_id, {"id": user_id}, cache.generation)
+    assert cache.get(1) is None
+    assert cache.get(3) == {"id": 3}
+    assert cache.get_stats()["evictions"] == 1
+
+    now[0] += 31
+    assert cache.get(3) is None
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = UserCache()
+    generation = cache.generation
+    cache.invalidate(1)  # e.g. a concurrent update committed mid-load
+    cache.set(1, {"id": 1, "username": "stale"}, generation)
+    assert cache.get(1) is None
@@ -0,0 +1,56 @@
+import pytest
+
+from app.services.ytdlp_worker_pool import (
+    YtDlpExtractionError,
+    YtDlpJobTimeout,
+    YtDlpWorkerPool,
+)
+
+ARGS = ["--quiet", "--skip-download", "--print-json"]
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_worker_and_reports_errors():
+    pool = YtDlpWorkerPool(size=1, job_timeout=60, max_jobs_per_worker=10)
+    try:
+        for _ in range(2):
+            with pytest.raises(YtDlpExtractionError) as exc:
+                await pool.extract("not-a-valid-url", ARGS)
+            assert "not a valid URL" in str(exc.value)
+
+        stats = pool.get_stats()
+        assert stats["workers_started"] == 1
+        assert stats["jobs_failed"] == 2
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_worker_after_max_jobs():
+    pool = YtDlpWorkerPool(size=1, job_timeout=60, max_jobs_per_worker=1)
+    try:
+        for _ in range(2):
+            with pytest.raises(YtDlpExtractionError):
+                await pool.extract("not-a-valid-url", ARGS)
+
+        stats = pool.get_stats()
+        assert stats["workers_started"] == 2
+        assert stats["workers_recycled"] == 2
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_worker_on_timeout():
+    pool = YtDlpWorkerPool(size=1, job_timeout=60)
+    try:
+        # The first job cannot finish before the worker has even imported yt-dlp
+        with pytest.raises(YtDlpJobTimeout):
+            await pool.extract("not-a-valid-url", ARGS, timeout=0.001)
+        assert pool.get_stats()["live_workers"] == 0
+
+        with pytest.raises(YtDlpExtractionError):
+            await pool.extract("not-a-valid-url", ARGS)
+        assert pool.get_stats()["workers_started"] == 2
+    finally:
+        pool.shutdown()